@@ -0,0 +1,274 @@
+"""Фоновый пересчёт данных графика: старые артисты остаются до прихода новых."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from curve_definition import get_cartesian_coordinates
+from instrumentation import instrumented
+from polyline_simplify import pixel_tolerance
+from config import (ASYNC_POLL_INTERVAL, ASYNC_COARSE_POINTS,
+                    ASYNC_PIXEL_STEP, ASYNC_MAX_SUBDIVISIONS,
+                    ASYNC_MAX_POINTS, ASYNC_CHUNK_SIZE)
+
+
+class AsyncRecompute:
+    """
+    Пересчёт в рабочем потоке с заменой результата в главном потоке.
+
+    compute(*args, cancelled) выполняется в рабочем потоке и не должен
+    обращаться к matplotlib; cancelled() возвращает True, если запрос
+    устарел, и длинное вычисление может прерваться (вернуть None).
+    apply(result) выполняется в главном потоке по таймеру холста и
+    обновляет артисты. Пока результата нет, на экране остаются прежние.
+
+    Запросы между тиками таймера объединяются: отправляется только
+    последний, ещё не начатый устаревший запрос отменяется.
+
+    Использование:
+        job = AsyncRecompute(ax, compute, apply)
+        job.request(xlim, ylim)
+    """
+
+    def __init__(self, ax, compute, apply, poll_interval=None):
+        """
+        Инициализация.
+
+        Args:
+            ax: объект осей matplotlib
+            compute: функция compute(*args, cancelled) -> результат
+            apply: функция apply(result), вызывается в главном потоке
+            poll_interval: период таймера в мс (по умолчанию из config)
+        """
+        if poll_interval is None:
+            poll_interval = ASYNC_POLL_INTERVAL
+
+        self.ax = ax
+        self.fig = ax.figure
+        self.compute = compute
+        self.apply = apply
+
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._generation = 0
+        self._pending = None
+        self._future = None
+
+        self._timer = self.fig.canvas.new_timer(interval=poll_interval)
+        self._timer.add_callback(self._on_timer)
+
+    @property
+    def busy(self):
+        """Есть ли неотправленный или незавершённый запрос."""
+        return self._pending is not None or self._future is not None
+
+    def request(self, *args):
+        """Запрашивает пересчёт; аргументы передаются в compute."""
+        self._pending = args
+        self._timer.start()
+
+    def _run(self, generation, args):
+        """Выполняется в рабочем потоке."""
+        result = self.compute(*args, cancelled=lambda: generation != self._generation)
+        return generation, result
+
+    def _submit(self):
+        """Отправляет последний запрос, отменяя устаревший."""
+        if self._future is not None:
+            self._future.cancel()
+
+        self._generation += 1
+        self._future = self._executor.submit(self._run, self._generation, self._pending)
+        self._pending = None
+
+    @instrumented
+    def _on_timer(self):
+        """Тик таймера: отправка запроса и замена артистов готовым результатом."""
+        if self._pending is not None:
+            self._submit()
+
+        future = self._future
+        if future is None or not future.done():
+            return
+
+        self._future = None
+        generation, result = future.result()
+        if generation == self._generation and result is not None:
+            self.apply(result)
+            self.fig.canvas.draw_idle()
+
+        if not self.busy:
+            self._timer.stop()
+
+    def wait(self, timeout=None):
+        """
+        Дожидается завершения текущего запроса и применяет результат
+        (для неинтерактивных холстов и измерений).
+        """
+        while self.busy:
+            if self._pending is not None:
+                self._submit()
+            self._future.exception(timeout)
+            self._on_timer()
+
+    def close(self):
+        """Останавливает таймер и рабочий поток."""
+        self._timer.stop()
+        self._generation += 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def resample_view(xlim, ylim, pixel_size, point_function=None,
+                  coarse_points=None, pixel_step=None, max_points=None,
+                  chunk_size=None, cancelled=None):
+    """
+    Выборка кривой с плотностью, зависящей от текущего вида.
+
+    Грубая сетка θ оценивает, какие интервалы попадают в видимую область;
+    видимые интервалы делятся так, чтобы шаг на экране был около
+    pixel_step пикселей, невидимые остаются грубыми.
+
+    Args:
+        xlim, ylim: границы видимой области
+        pixel_size: размер пикселя в единицах данных
+        point_function: θ -> (x, y) (по умолчанию точки кривой;
+                        например, compute_curvature_center — для эволюты)
+        coarse_points: точек грубой сетки (по умолчанию из config)
+        pixel_step: шаг на экране в пикселях (по умолчанию из config)
+        max_points: ограничение общего числа точек (по умолчанию из config)
+        chunk_size: точек в одном блоке вычислений (по умолчанию из config)
+        cancelled: функция без аргументов; True — прервать вычисление
+
+    Returns:
+        tuple или None: (x, y) или None, если вычисление прервано
+    """
+    if point_function is None:
+        point_function = get_cartesian_coordinates
+    if coarse_points is None:
+        coarse_points = ASYNC_COARSE_POINTS
+    if pixel_step is None:
+        pixel_step = ASYNC_PIXEL_STEP
+    if max_points is None:
+        max_points = ASYNC_MAX_POINTS
+    if chunk_size is None:
+        chunk_size = ASYNC_CHUNK_SIZE
+    if cancelled is None:
+        cancelled = lambda: False
+
+    theta = np.linspace(0, 2 * np.pi, coarse_points + 1)
+    with np.errstate(invalid='ignore', over='ignore'):
+        x, y = point_function(theta)
+
+        # Интервал видим, если его ограничивающий прямоугольник пересекает вид
+        x0, x1 = np.minimum(x[:-1], x[1:]), np.maximum(x[:-1], x[1:])
+        y0, y1 = np.minimum(y[:-1], y[1:]), np.maximum(y[:-1], y[1:])
+        visible = ((x1 >= min(xlim)) & (x0 <= max(xlim)) &
+                   (y1 >= min(ylim)) & (y0 <= max(ylim)))
+
+        length_px = np.hypot(x[1:] - x[:-1], y[1:] - y[:-1]) / pixel_size
+
+    counts = np.ones(coarse_points, dtype=int)
+    wanted = np.nan_to_num(length_px[visible] / pixel_step, nan=1.0, posinf=1.0)
+    # У эволюты интервал у точки перегиба уходит в бесконечность —
+    # подразбиение каждого интервала ограничено
+    counts[visible] = np.clip(np.ceil(wanted), 1, ASYNC_MAX_SUBDIVISIONS).astype(int)
+
+    # Ограничиваем общий объём, уменьшая подразбиение видимых интервалов
+    budget = max_points - (coarse_points - visible.sum())
+    if counts[visible].sum() > budget > 0:
+        counts[visible] = np.maximum(counts[visible] * budget // counts[visible].sum(), 1)
+
+    owner = np.repeat(np.arange(coarse_points), counts)
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    fraction = (np.arange(counts.sum()) - offsets[owner]) / counts[owner]
+    dense = np.append(theta[owner] + fraction * (theta[1] - theta[0]), theta[-1])
+
+    xs, ys = np.empty_like(dense), np.empty_like(dense)
+    for start in range(0, len(dense), chunk_size):
+        if cancelled():
+            return None
+        block = slice(start, start + chunk_size)
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            xs[block], ys[block] = point_function(dense[block])
+
+    return xs, ys
+
+
+class AsyncCurveResampler(AsyncRecompute):
+    """
+    Линия, пересэмплируемая в фоне при каждом изменении вида.
+
+    Подписывается на xlim_changed / ylim_changed осей; до прихода новой
+    выборки на экране остаётся прежняя линия.
+
+    Использование:
+        fig, ax = create_figure()
+        draw_curve(ax)
+        zoom = InteractiveZoom(ax)
+        resampler = AsyncCurveResampler(ax)
+        plt.show()
+    """
+
+    def __init__(self, ax, line=None, point_function=None, poll_interval=None,
+                 **resample_kwargs):
+        """
+        Инициализация.
+
+        Args:
+            ax: объект осей matplotlib
+            line: обновляемая линия Line2D (по умолчанию создаётся новая)
+            point_function: θ -> (x, y) (по умолчанию точки кривой)
+            poll_interval: период таймера в мс (по умолчанию из config)
+            **resample_kwargs: аргументы для resample_view
+        """
+        if line is None:
+            line, = ax.plot([], [], color='darkblue', linewidth=1.0, zorder=2)
+
+        self.line = line
+        self.point_function = point_function
+        self.resample_kwargs = resample_kwargs
+
+        super().__init__(ax, self._compute, self._apply, poll_interval)
+
+        self._cids = [ax.callbacks.connect('xlim_changed', self._on_view_changed),
+                      ax.callbacks.connect('ylim_changed', self._on_view_changed)]
+        self._on_view_changed(ax)
+
+    def _on_view_changed(self, ax):
+        """Изменение границ осей — запрос новой выборки."""
+        self.request(ax.get_xlim(), ax.get_ylim(), pixel_tolerance(ax, 1))
+
+    def _compute(self, xlim, ylim, pixel_size, cancelled):
+        """Выборка в рабочем потоке."""
+        return resample_view(xlim, ylim, pixel_size,
+                             point_function=self.point_function,
+                             cancelled=cancelled, **self.resample_kwargs)
+
+    def _apply(self, result):
+        """Замена данных линии в главном потоке."""
+        self.line.set_data(*result)
+
+    def close(self):
+        """Отключает обработчики осей и останавливает пересчёт."""
+        for cid in self._cids:
+            self.ax.callbacks.disconnect(cid)
+        super().close()
+
+
+if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+    from curve_math import compute_curvature_center
+    from interactive_zoom import InteractiveZoom
+    from visualization_base import create_figure, setup_axes
+
+    fig, ax = create_figure()
+    setup_axes(ax, title='Фоновая выборка кривой и эволюты при zoom')
+    ax.set_xlim(-2, 2)
+    ax.set_ylim(-2, 2)
+
+    zoom = InteractiveZoom(ax)
+    curve = AsyncCurveResampler(ax)
+    evolute_line, = ax.plot([], [], color='purple', linewidth=0.8, zorder=2)
+    evolute = AsyncCurveResampler(ax, line=evolute_line,
+                                  point_function=compute_curvature_center)
+
+    plt.show()
@@ -0,0 +1,204 @@
+"""Пакетное вычисление для многих кривых сразу: массивы (кривые × θ)"""
+
+import numpy as np
+from instrumentation import instrumented
+from config import BATCH_MAX_ELEMENTS
+
+# Величины, которые вычисляет evaluate_batch
+BATCH_QUANTITIES = ('r', 'dr', 'd2r', 'x', 'y', 'dx', 'dy', 'd2x', 'd2y',
+                    'curvature', 'center_x', 'center_y')
+
+
+def as_coefficient_sets(coefficient_sets):
+    """
+    Приводит набор вариантов коэффициентов к массиву формы (M, 2, K+1).
+
+    Args:
+        coefficient_sets: массив (M, 2, K+1) или (M, 2·(K+1)) — по строке
+                          [a_0..a_K, b_0..b_K] на кривую
+
+    Returns:
+        numpy.ndarray: коэффициенты формы (M, 2, K+1)
+    """
+    sets = np.asarray(coefficient_sets, dtype=float)
+    if sets.ndim == 2:
+        # Одна строка — плоский вектор [a_0..a_K, b_0..b_K]
+        sets = sets.reshape(sets.shape[0], 2, -1)
+    if sets.ndim != 3 or sets.shape[1] != 2:
+        raise ValueError(f"Ожидалась форма (M, 2, K+1), получено {sets.shape}")
+    return sets
+
+
+def harmonic_basis(theta, num_harmonics):
+    """
+    Общий для всех кривых базис [cos(kθ); sin(kθ)], k = 0..K.
+
+    Args:
+        theta: сетка θ (одномерный массив)
+        num_harmonics: K + 1
+
+    Returns:
+        numpy.ndarray: матрица (2·(K+1), T)
+    """
+    k_theta = np.outer(np.arange(num_harmonics), np.asarray(theta, dtype=float))
+    return np.vstack([np.cos(k_theta), np.sin(k_theta)])
+
+
+def _radius_operator(sets):
+    """
+    Матрица, переводящая базис в r, r', r'' для блока кривых.
+
+    d^n/dθ^n [a·cos(kθ) + b·sin(kθ)] раскладывается по тому же базису:
+        r'  = (k·b)·cos − (k·a)·sin
+        r'' = −(k²·a)·cos − (k²·b)·sin
+
+    Returns:
+        numpy.ndarray: матрица (3·M, 2·(K+1)), строки — r, r', r'' по кривым
+    """
+    a, b = sets[:, 0], sets[:, 1]
+    k = np.arange(sets.shape[2])
+    return np.vstack([np.hstack([a, b]),
+                      np.hstack([k * b, -k * a]),
+                      np.hstack([-k**2 * a, -k**2 * b])])
+
+
+def _evaluate_chunk(sets, basis, cos_theta, sin_theta):
+    """Все величины BATCH_QUANTITIES для блока кривых — одним умножением матриц."""
+    m = len(sets)
+    r, dr, d2r = np.split(_radius_operator(sets) @ basis, [m, 2 * m])
+
+    x = r * cos_theta
+    y = r * sin_theta
+    dx = dr * cos_theta - y
+    dy = dr * sin_theta + x
+    d2x = d2r * cos_theta - 2 * dr * sin_theta - x
+    d2y = d2r * sin_theta + 2 * dr * cos_theta - y
+
+    speed_sq = dx**2 + dy**2
+    denom = dx * d2y - dy * d2x
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        curvature = denom / speed_sq**1.5
+        factor = speed_sq / denom
+
+    return {
+        'r': r, 'dr': dr, 'd2r': d2r,
+        'x': x, 'y': y, 'dx': dx, 'dy': dy, 'd2x': d2x, 'd2y': d2y,
+        'curvature': curvature,
+        'center_x': x - dy * factor,
+        'center_y': y + dx * factor
+    }
+
+
+def iter_batches(coefficient_sets, theta, chunk_size=None):
+    """
+    Вычисляет величины по блокам кривых.
+
+    Базис cos(kθ), sin(kθ) строится один раз для всех кривых; блок
+    размера chunk_size (по умолчанию — так, чтобы массив блока содержал
+    не больше BATCH_MAX_ELEMENTS элементов) считается одним умножением
+    матриц и поэлементными операциями над массивами (блок × θ).
+
+    Args:
+        coefficient_sets: массив (M, 2, K+1) или (M, 2·(K+1))
+        theta: общая сетка θ
+        chunk_size: кривых в блоке (опционально)
+
+    Yields:
+        tuple: (номер первой кривой блока, {величина: массив (блок × T)})
+    """
+    sets = as_coefficient_sets(coefficient_sets)
+    theta = np.asarray(theta, dtype=float)
+    if chunk_size is None:
+        chunk_size = max(1, BATCH_MAX_ELEMENTS // max(theta.size, 1))
+
+    basis = harmonic_basis(theta, sets.shape[2])
+    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
+
+    for start in range(0, len(sets), chunk_size):
+        yield start, _evaluate_chunk(sets[start:start + chunk_size], basis,
+                                     cos_theta, sin_theta)
+
+
+@instrumented
+def evaluate_batch(coefficient_sets, theta, quantities=None, chunk_size=None):
+    """
+    Координаты, производные, кривизна и центры кривизны для многих кривых.
+
+    Args:
+        coefficient_sets: массив (M, 2, K+1) или (M, 2·(K+1))
+        theta: общая сетка θ (одномерный массив длины T)
+        quantities: какие величины вернуть (по умолчанию все BATCH_QUANTITIES)
+        chunk_size: кривых в блоке (опционально)
+
+    Returns:
+        dict: {величина: массив (M, T)}; 'curvature' — знаковая кривизна
+    """
+    if quantities is None:
+        quantities = BATCH_QUANTITIES
+
+    sets = as_coefficient_sets(coefficient_sets)
+    theta = np.asarray(theta, dtype=float)
+    result = {name: np.empty((len(sets), theta.size)) for name in quantities}
+
+    for start, chunk in iter_batches(sets, theta, chunk_size):
+        rows = slice(start, start + len(chunk['r']))
+        for name in quantities:
+            result[name][rows] = chunk[name]
+
+    return result
+
+
+@instrumented
+def batch_curve_statistics(coefficient_sets, num_samples=1000, chunk_size=None):
+    """
+    Статистика get_curve_statistics для каждой кривой набора.
+
+    Args:
+        coefficient_sets: массив (M, 2, K+1) или (M, 2·(K+1))
+        num_samples: точек периодической сетки θ
+        chunk_size: кривых в блоке (опционально)
+
+    Returns:
+        dict: {имя: массив длины M} — max/min/mean кривизны, число точек
+              перегиба, площадь и периметр
+    """
+    sets = as_coefficient_sets(coefficient_sets)
+    theta = np.linspace(0, 2 * np.pi, num_samples, endpoint=False)
+
+    names = ('max_curvature', 'min_curvature', 'mean_curvature',
+             'inflection_count', 'area', 'perimeter')
+    stats = {name: np.empty(len(sets)) for name in names}
+
+    for start, chunk in iter_batches(sets, theta, chunk_size):
+        rows = slice(start, start + len(chunk['r']))
+        r, dr, signed = chunk['r'], chunk['dr'], chunk['curvature']
+        curvatures = np.abs(signed)
+
+        signs = np.sign(signed)
+        stats['max_curvature'][rows] = curvatures.max(axis=1)
+        stats['min_curvature'][rows] = curvatures.min(axis=1)
+        stats['mean_curvature'][rows] = curvatures.mean(axis=1)
+        stats['inflection_count'][rows] = np.count_nonzero(
+            signs != np.roll(signs, -1, axis=1), axis=1)
+        stats['area'][rows] = np.pi * np.mean(r**2, axis=1)
+        stats['perimeter'][rows] = 2 * np.pi * np.mean(np.sqrt(r**2 + dr**2), axis=1)
+
+    return stats
+
+
+if __name__ == '__main__':
+    import time
+    from curve_definition import CURVE_COEFFICIENTS
+
+    rng = np.random.default_rng(0)
+    num_curves, num_samples = 10**4, 10**4
+    sets = np.repeat(CURVE_COEFFICIENTS[np.newaxis], num_curves, axis=0)
+    sets[:, :, 1:] += rng.normal(0, 0.02, sets[:, :, 1:].shape)
+
+    start = time.perf_counter()
+    stats = batch_curve_statistics(sets, num_samples)
+    print(f"{num_curves} кривых × {num_samples} точек: "
+          f"{time.perf_counter() - start:.2f} с")
+    print(f"Максимальная кривизна: от {stats['max_curvature'].min():.3f} "
+          f"до {stats['max_curvature'].max():.3f}")
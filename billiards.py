@@ -0,0 +1,299 @@
+"""Бильярд внутри кривой: многократные отражения пучка лучей"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from matplotlib.collections import LineCollection
+
+from curve_definition import r_function
+from instrumentation import instrumented
+from ray_intersection import intersect_rays
+from config import (BILLIARD_MAX_BOUNCES, BILLIARD_CHUNK_SIZE, BILLIARD_MAX_WORKERS,
+                    BILLIARD_RETRY_REFINEMENT, BILLIARD_HIT_TOLERANCE,
+                    BILLIARD_MAX_PATHS, BILLIARD_COLOR, BILLIARD_LINEWIDTH, BILLIARD_ALPHA,
+                    RAY_CELL_SUBDIVISIONS)
+
+
+def _inside(px, py):
+    """Полярная проверка принадлежности (знаковое расстояние < 0): ρ < r(φ)."""
+    return np.hypot(px, py) < r_function(np.arctan2(py, px))
+
+
+def _confirmed_hits(position, direction, hits, tolerance):
+    """
+    Маска попаданий, согласованных с движением луча внутри кривой.
+
+    Попадание принимается, если точка удара лежит на луче, луч подходит
+    к кривой изнутри (против внутренней нормали: d·n < 0) и середина
+    отрезка от старта до удара лежит внутри кривой. Пропущенный корень
+    (два корня в одной подъячейке сетки поиска) выводит луч наружу,
+    и одно из условий нарушается.
+    """
+    ray = hits['ray']
+    ox, oy = position[ray, 0], position[ray, 1]
+    dx, dy = direction[ray, 0], direction[ray, 1]
+    hx, hy = hits['x'], hits['y']
+
+    on_ray = (np.abs(dx * (hy - oy) - dy * (hx - ox)) <=
+              tolerance * np.hypot(dx, dy) * (1 + np.abs(hits['t'])))
+    from_inside = dx * hits['nx'] + dy * hits['ny'] < 0
+    return on_ray & from_inside & _inside(0.5 * (ox + hx), 0.5 * (oy + hy))
+
+
+def _nearest_hits(rows, position, direction, current_theta, intersect_kwargs):
+    """
+    Ближайшие подтверждённые попадания для лучей rows.
+
+    Лучи, у которых попадание не найдено или не подтвердилось
+    (_confirmed_hits), пересчитываются на сетке поиска мельче в
+    BILLIARD_RETRY_REFINEMENT раз; вместе с сеткой сужается и
+    исключаемый интервал вокруг точки старта.
+
+    Returns:
+        tuple: (лучи с попаданием, попадания по этим лучам, лучи без
+               подтверждённого попадания)
+    """
+    subdivisions = intersect_kwargs.get('subdivisions') or RAY_CELL_SUBDIVISIONS
+    kwargs = dict(intersect_kwargs)
+
+    found_rays, found_hits = [], []
+    pending = np.arange(len(rows))
+    for refinement in (1,) + tuple(BILLIARD_RETRY_REFINEMENT):
+        kwargs['subdivisions'] = subdivisions * refinement
+        hits = intersect_rays(position[pending], direction[pending], nearest=True,
+                              exclude_theta=current_theta[pending], **kwargs)
+        good = _confirmed_hits(position[pending], direction[pending], hits,
+                               BILLIARD_HIT_TOLERANCE)
+
+        found_rays.append(pending[hits['ray'][good]])
+        found_hits.append({name: column[good] for name, column in hits.items()})
+
+        missing = np.ones(len(pending), dtype=bool)
+        missing[hits['ray'][good]] = False
+        pending = pending[missing]
+        if not pending.size:
+            break
+
+    found = np.concatenate(found_rays)
+    hits = {name: np.concatenate([part[name] for part in found_hits])
+            for name in found_hits[0]}
+    return rows[found], hits, rows[pending]
+
+
+def _simulate_block(rows, x, y, theta, bounces, direction, current_theta,
+                    limit, failed, intersect_kwargs):
+    """Отражения для блока лучей rows; результаты пишутся в общие массивы."""
+    active = rows[limit[rows] > 0]
+    for step in range(theta.shape[1]):
+        if not active.size:
+            break
+
+        position = np.column_stack([x[active, step], y[active, step]])
+        rays, hits, lost = _nearest_hits(active, position, direction[active],
+                                         current_theta[active], intersect_kwargs)
+        # Луч внутри замкнутой кривой обязан в неё попасть
+        failed[lost] = True
+
+        x[rays, step + 1], y[rays, step + 1] = hits['x'], hits['y']
+        theta[rays, step] = hits['theta']
+        current_theta[rays] = hits['theta']
+        bounces[rays] += 1
+
+        # Отражение относительно нормали в точке удара
+        nx, ny = hits['nx'], hits['ny']
+        dot = direction[rays, 0] * nx + direction[rays, 1] * ny
+        direction[rays, 0] -= 2 * dot * nx
+        direction[rays, 1] -= 2 * dot * ny
+
+        active = rays[bounces[rays] < limit[rays]]
+
+
+@instrumented
+def simulate_billiards(origins, directions, max_bounces=None, start_theta=None,
+                       chunk_size=None, max_workers=None, **intersect_kwargs):
+    """
+    Траектории лучей, отражающихся от кривой изнутри.
+
+    На каждом шаге все активные лучи пересекаются с кривой одним вызовом
+    intersect_rays (nearest=True — уточняется только ближайший корень),
+    направление отражается относительно единичной нормали
+    (compute_normal_vector): d' = d − 2(d·n)n. Луч внутри замкнутой
+    кривой всегда в неё попадает, поэтому отсутствие попадания или
+    попадание снаружи — ошибка поиска корня: такие лучи пересчитываются
+    на более мелкой сетке (_nearest_hits). Луч выбывает, когда набрал
+    свою норму отражений; если попадание так и не подтвердилось, луч
+    выбывает досрочно и отмечается в 'failed'.
+    Все траектории хранятся в заранее выделенных массивах (лучи × отражения).
+    Лучи независимы, поэтому блоки по chunk_size лучей обрабатываются
+    в пуле потоков.
+
+    Args:
+        origins: начальные точки внутри кривой, массив (N, 2)
+        directions: начальные направления, массив (N, 2)
+        max_bounces: отражений на луч — число или массив длины N
+                     (по умолчанию из config)
+        start_theta: θ начальных точек, если они лежат на кривой
+                     (массив N, NaN — точка не на кривой)
+        chunk_size: лучей в блоке (по умолчанию из config)
+        max_workers: потоков (по умолчанию из config; None — по числу ядер)
+        **intersect_kwargs: параметры intersect_rays (coarse_cells и т.д.)
+
+    Returns:
+        dict: 'x', 'y' — вершины траекторий (N, B+1), после выбывания NaN;
+              'theta' — θ точек отражения (N, B); 'bounces' — число
+              отражений каждого луча; 'dx', 'dy' — последние направления;
+              'failed' — лучи, выбывшие без подтверждённого попадания
+    """
+    if max_bounces is None:
+        max_bounces = BILLIARD_MAX_BOUNCES
+    if chunk_size is None:
+        chunk_size = BILLIARD_CHUNK_SIZE
+    if max_workers is None:
+        max_workers = BILLIARD_MAX_WORKERS or os.cpu_count()
+
+    origins = np.atleast_2d(np.asarray(origins, dtype=float))
+    directions = np.atleast_2d(np.asarray(directions, dtype=float))
+    num_rays = len(origins)
+
+    limit = np.broadcast_to(np.asarray(max_bounces, dtype=int), (num_rays,))
+    num_steps = int(limit.max()) if num_rays else 0
+
+    x = np.full((num_rays, num_steps + 1), np.nan)
+    y = np.full((num_rays, num_steps + 1), np.nan)
+    theta = np.full((num_rays, num_steps), np.nan)
+    bounces = np.zeros(num_rays, dtype=int)
+    failed = np.zeros(num_rays, dtype=bool)
+    x[:, 0], y[:, 0] = origins[:, 0], origins[:, 1]
+    direction = directions.copy()
+    current_theta = (np.full(num_rays, np.nan) if start_theta is None
+                     else np.array(start_theta, dtype=float))
+
+    def work(block):
+        rows = np.arange(block, min(block + chunk_size, num_rays))
+        _simulate_block(rows, x, y, theta, bounces, direction, current_theta,
+                        limit, failed, intersect_kwargs)
+
+    blocks = range(0, num_rays, chunk_size)
+    if max_workers > 1 and len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(work, blocks))
+    else:
+        for block in blocks:
+            work(block)
+
+    return {'x': x, 'y': y, 'theta': theta, 'bounces': bounces,
+            'dx': direction[:, 0], 'dy': direction[:, 1], 'failed': failed}
+
+
+def check_billiard_paths(paths, tolerance=None):
+    """
+    Проверка траекторий: концы отрезков лежат на кривой, середины —
+    внутри неё (знаковое расстояние до кривой отрицательно), досрочно
+    выбывших лучей нет.
+
+    Args:
+        paths: результат simulate_billiards
+        tolerance: допустимое |ρ − r(φ)| для концов (по умолчанию из config)
+
+    Returns:
+        tuple: (passed, report) — report: 'failed' — досрочно выбывших
+               лучей, 'off_curve' — наибольшее отклонение конца отрезка
+               от кривой, 'outside' — середин вне кривой
+    """
+    if tolerance is None:
+        tolerance = BILLIARD_HIT_TOLERANCE
+
+    segments = billiard_segments(paths)
+    ends = segments[:, 1]
+    midpoints = segments.mean(axis=1)
+
+    off_curve = np.abs(np.hypot(ends[:, 0], ends[:, 1]) -
+                       r_function(np.arctan2(ends[:, 1], ends[:, 0])))
+    report = {
+        'failed': int(paths['failed'].sum()),
+        'off_curve': float(off_curve.max()) if off_curve.size else 0.0,
+        'outside': int((~_inside(midpoints[:, 0], midpoints[:, 1])).sum())
+    }
+    passed = (report['failed'] == 0 and report['off_curve'] <= tolerance and
+              report['outside'] == 0)
+    return passed, report
+
+
+def billiard_segments(paths, max_paths=None):
+    """
+    Отрезки траекторий для LineCollection.
+
+    Args:
+        paths: результат simulate_billiards
+        max_paths: сколько первых траекторий взять (None — все)
+
+    Returns:
+        numpy.ndarray: отрезки, массив (M, 2, 2)
+    """
+    x, y = paths['x'][:max_paths], paths['y'][:max_paths]
+    points = np.stack([x, y], axis=-1)
+    segments = np.stack([points[:, :-1], points[:, 1:]], axis=2)
+
+    # Отрезок существует, если отражение в его конце состоялось
+    valid = np.isfinite(x[:, 1:])
+    return segments[valid]
+
+
+def add_billiard_paths_to_plot(ax, paths, max_paths=None, color=None,
+                               linewidth=None, alpha=None):
+    """
+    Рисует траектории одной LineCollection.
+
+    Args:
+        ax: объект осей matplotlib
+        paths: результат simulate_billiards
+        max_paths: сколько траекторий рисовать (по умолчанию из config)
+        color: цвет (по умолчанию из config)
+        linewidth: толщина линий (по умолчанию из config)
+        alpha: прозрачность (по умолчанию из config)
+
+    Returns:
+        LineCollection: коллекция отрезков
+    """
+    if max_paths is None:
+        max_paths = BILLIARD_MAX_PATHS
+    if color is None:
+        color = BILLIARD_COLOR
+    if linewidth is None:
+        linewidth = BILLIARD_LINEWIDTH
+    if alpha is None:
+        alpha = BILLIARD_ALPHA
+
+    collection = LineCollection(billiard_segments(paths, max_paths), colors=color,
+                                linewidths=linewidth, alpha=alpha, zorder=2)
+    ax.add_collection(collection)
+    ax.autoscale_view()
+
+    return collection
+
+
+if __name__ == '__main__':
+    import time
+    import matplotlib.pyplot as plt
+    from visualization_base import create_figure, draw_curve, setup_axes
+
+    num_rays = 10**5
+    rng = np.random.default_rng(0)
+    angles = rng.uniform(0, 2 * np.pi, num_rays)
+    origins = np.tile([0.1, 0.05], (num_rays, 1))
+    directions = np.column_stack([np.cos(angles), np.sin(angles)])
+
+    start = time.perf_counter()
+    paths = simulate_billiards(origins, directions)
+    print(f"{num_rays} лучей × {BILLIARD_MAX_BOUNCES} отражений: "
+          f"{time.perf_counter() - start:.2f} с, "
+          f"в среднем {paths['bounces'].mean():.1f} отражений")
+    passed, report = check_billiard_paths(paths)
+    print(f"Проверка траекторий: {'OK' if passed else 'ОШИБКА'} {report}")
+
+    fig, ax = create_figure()
+    draw_curve(ax, show_fill=False)
+    add_billiard_paths_to_plot(ax, paths)
+    setup_axes(ax, title='Бильярд внутри кривой')
+    plt.show()
@@ -12,6 +12,7 @@ FIGURE_SIZE = (12, 12)
 CURVE_COLOR = 'blue'
 CURVE_LINEWIDTH = 2
 CURVE_FILL_ALPHA = 0.1
+AXES_PADDING = 0.3  # поля вокруг точного ограничивающего прямоугольника кривой (setup_axes, сброс вида)
 
 # Параметры точек
 POINT_SIZE = 100
@@ -32,3 +33,151 @@ EVOLUTE_CONNECTION_COLOR = 'green'
 EVOLUTE_CONNECTION_STYLE = '--'
 EVOLUTE_CONNECTION_WIDTH = 1
 EVOLUTE_CONNECTION_ALPHA = 0.6
+
+# Параметрический перебор коэффициентов
+SWEEP_NUM_SAMPLES = 1000  # точек сетки θ на один вариант кривой
+SWEEP_CHUNK_SIZE = 256  # вариантов в одной задаче пула процессов
+SWEEP_CHECKPOINT_EVERY = 10  # сохранять контрольную точку каждые N задач
+
+# Анимация
+ANIMATION_FRAMES = 360  # кадров на один оборот
+ANIMATION_INTERVAL = 30  # задержка между кадрами, мс
+ANIMATION_FPS = 30  # частота кадров при экспорте
+ANIMATION_CIRCLE_POINTS = 128  # точек на соприкасающейся окружности
+
+# Пространственный индекс и подсказка под курсором
+SPATIAL_INDEX_LEAF_SIZE = 32  # точек кривой в одном листе индекса
+HOVER_NUM_SAMPLES = 4096  # плотность выборки для подсказки
+HOVER_MAX_DISTANCE_PX = 20  # подсказка показывается ближе этого расстояния
+
+# Инструментирование (см. instrumentation.py)
+PROFILE_ENABLED = False  # счётчики вызовов и время горячих функций
+PROFILE_MEMORY = False  # дополнительно замерять выделенную память (медленно)
+PROFILE_REPORT_PATH = None  # путь для JSON-отчёта в конце main()
+
+# 3D-визуализация
+PLOT3D_Z_QUANTITY = 'theta'  # величина по оси z: 'theta', 'curvature', 'radius', 'zero'
+PLOT3D_CURVATURE_CLIP = 5.0  # ограничение κ и R по оси z (пики у точек перегиба)
+PLOT3D_CIRCLE_POINTS = 64  # точек на соприкасающейся окружности
+
+# Кривая, раскрашенная по кривизне, и гребёнка кривизны
+CURVATURE_CMAP = 'viridis'
+CURVATURE_LOG_SCALE = True  # логарифмическая шкала цвета (пики κ у перегибов)
+COMB_NUM_POINTS = 2000  # точек кривой и волос гребёнки
+COMB_SCALE = 0.02  # длина волоса на единицу кривизны
+COMB_MAX_LENGTH = 0.5  # ограничение длины волоса
+COMB_COLOR = 'gray'
+COMB_LINEWIDTH = 0.8
+
+# Выборка точек по весу (кривизна, длина дуги)
+SAMPLER_TABLE_SIZE = 8192  # интервалов в таблице функции распределения
+SAMPLER_CACHE_SIZE = 8  # таблиц в кэше (по весу, степени, размеру и коэффициентам)
+
+# Сцена с инкрементальным обновлением
+SCENE_CIRCLE_POINTS = 64  # точек на соприкасающейся окружности
+
+# Перетаскивание точек вдоль кривой
+DRAG_PICK_RADIUS_PX = 10  # радиус захвата точки
+DRAG_NEWTON_ITERATIONS = 3  # шагов Ньютона на одно событие мыши
+
+# Самопроверка аналитических производных
+VALIDATION_NUM_SAMPLES = 1024  # точек периодической сетки
+VALIDATION_TOLERANCE = 1e-6  # допустимая относительная спектральная ошибка
+
+# Упрощение ломаной кривой (допуск в единицах данных, None — без упрощения)
+SIMPLIFY_TOLERANCE = None  # при отрисовке на экране
+EXPORT_THETA_POINTS = 20000  # точек кривой при сохранении в файл
+EXPORT_SIMPLIFY_TOLERANCE = 5e-4  # допуск при сохранении в файл
+
+# Пересечение лучей с кривой
+RAY_COARSE_CELLS = 64  # ячеек θ верхнего уровня
+RAY_CELL_SUBDIVISIONS = 8  # подъячеек в ячейке (мелкая сетка поиска смены знака)
+RAY_NEWTON_ITERATIONS = 8  # максимум шагов Ньютона при уточнении корня
+RAY_CHUNK_SIZE = 65536  # лучей в одном блоке
+
+# Фоновый пересчёт при изменении вида
+ASYNC_POLL_INTERVAL = 30  # период проверки готовых результатов, мс
+ASYNC_COARSE_POINTS = 2048  # точек грубой сетки для оценки видимости
+ASYNC_PIXEL_STEP = 2.0  # желаемый шаг выборки на экране, пиксели
+ASYNC_MAX_SUBDIVISIONS = 256  # максимум подразбиений одного интервала сетки
+ASYNC_MAX_POINTS = 200000  # ограничение общего числа точек выборки
+ASYNC_CHUNK_SIZE = 32768  # точек в блоке (между проверками отмены)
+
+# Знаковое расстояние до кривой (фон-тепловая карта)
+SDF_RESOLUTION = 1024  # пикселей по длинной стороне растра
+SDF_NUM_SAMPLES = 4096  # вершин ломаной для поиска ближайшей точки
+SDF_TILE_SIZE = 64  # размер тайла, пиксели
+SDF_LEAF_SIZE = 16  # вершин в листе индекса ближайшей вершины
+SDF_PADDING = 0.2  # поля вокруг кривой в области по умолчанию
+SDF_NEWTON_ITERATIONS = 3  # шагов Ньютона при уточнении расстояния
+SDF_MAX_WORKERS = None  # потоков (None — по числу ядер)
+SDF_CACHE_SIZE = 4  # растров в кэше
+SDF_CMAP = 'RdBu_r'  # цветовая карта (синий — внутри, красный — снаружи)
+SDF_ALPHA = 0.6  # прозрачность фона
+
+# Пакетное вычисление для многих кривых
+BATCH_MAX_ELEMENTS = 1 << 21  # элементов в массиве одного блока (кривые × θ)
+
+# Дисковый кэш предвычислений (переменная окружения CURVES2D_CACHE_DIR
+# переопределяет каталог, '0' — отключает кэш)
+CACHE_ENABLED = True  # использовать ли дисковый кэш
+CACHE_DIR = None  # каталог кэша (None — ~/.cache/curves2d)
+CACHE_MAX_BYTES = 256 * 1024 * 1024  # ограничение размера кэша
+
+# Замер отклика интерактивного графика (ui_benchmark)
+BENCHMARK_SCENE_SIZES = (5, 50, 200)  # количества точек на кривой
+BENCHMARK_ZOOM_STEPS = 10  # шагов приближения (и столько же отдаления)
+BENCHMARK_PAN_STEPS = 40  # перемещений мыши при pan
+BENCHMARK_HOVER_STEPS = 60  # положений курсора вдоль кривой
+BENCHMARK_EDIT_SIZES = (10, 1000, 10000)  # точек сцены при замере move_point
+BENCHMARK_EDIT_MOVES = 200  # переносов точки на каждый размер
+BENCHMARK_EDIT_MAX_GROWTH = 3.0  # допустимый рост времени переноса от меньшей сцены к большей
+
+# Бильярд внутри кривой (многократные отражения лучей)
+BILLIARD_MAX_BOUNCES = 50  # отражений на траекторию
+BILLIARD_CHUNK_SIZE = 16384  # лучей в блоке (блоки считаются в пуле потоков)
+BILLIARD_MAX_WORKERS = None  # потоков (None — по числу ядер)
+BILLIARD_RETRY_REFINEMENT = (4, 16)  # во сколько раз мельче сетка поиска при повторных попытках
+BILLIARD_HIT_TOLERANCE = 1e-9  # допустимое отклонение точки удара от луча и от кривой
+BILLIARD_MAX_PATHS = 2000  # траекторий на графике
+BILLIARD_COLOR = 'darkorange'  # цвет траекторий
+BILLIARD_LINEWIDTH = 0.3  # толщина линий траекторий
+BILLIARD_ALPHA = 0.3  # прозрачность траекторий
+
+# Подгонка ряда Фурье по измеренным точкам контура
+FIT_NUM_HARMONICS = 32  # гармоник ряда (K)
+FIT_METHOD = 'fft'  # 'fft' — через равномерную сетку θ, 'lstsq' — наименьшие квадраты
+FIT_REGULARIZATION = 0.0  # вес штрафа за гладкость λ·Σ k^(2p)·(a_k² + b_k²)
+FIT_SMOOTHNESS_ORDER = 2  # порядок производной p в штрафе
+FIT_OVERSAMPLING = 8  # узлов сетки θ на гармонику (метод 'fft')
+FIT_MIN_GRID_SIZE = 4096  # минимум узлов сетки θ (метод 'fft')
+
+# Интерполяционные таблицы репера (приближённое вычисление за O(1))
+INTERP_TOLERANCE = 1e-6  # допустимая погрешность x, y, T, κ
+INTERP_MIN_SIZE = 64  # начальный размер таблицы при подборе
+INTERP_MAX_SIZE = 1 << 20  # наибольший размер таблицы
+INTERP_CACHE_SIZE = 4  # таблиц в кэше (по коэффициентам и допуску)
+
+# Опорная функция, точный ограничивающий прямоугольник и выпуклая оболочка
+SUPPORT_SAMPLES_PER_HARMONIC = 16  # узлов грубой сетки θ на гармонику
+SUPPORT_MIN_SAMPLES = 256  # минимум узлов грубой сетки θ
+SUPPORT_NEWTON_ITERATIONS = 12  # максимум шагов Ньютона
+SUPPORT_DIRECTIONS = 720  # направлений при построении оболочки и ширины
+SUPPORT_BISECTION_STEPS = 48  # делений пополам при уточнении битангенсов
+
+# Панель кривизны (curvature_dashboard)
+DASHBOARD_NUM_SAMPLES = 200000  # точек равномерной сетки θ (линии прореживаются по пикселям)
+DASHBOARD_HIST_BINS = 60  # столбцов гистограммы κ
+DASHBOARD_MAX_RADIUS = 5.0  # ограничение R на графике
+
+# Отчёт по точкам в main() (полная таблица или сводка)
+REPORT_FULL_TABLE_MAX_ROWS = 50  # до скольких точек выводить полную таблицу
+REPORT_TOP_K = 10  # строк с наибольшей κ в сводке
+REPORT_QUANTILES = (0.0, 0.01, 0.25, 0.5, 0.75, 0.99, 1.0)  # уровни квантилей κ и R
+REPORT_INFLECTION_THRESHOLD = 1e-2  # κ ниже порога — точка около перегиба
+
+# Расстояния между кривыми (curve_distance)
+DISTANCE_NUM_SAMPLES = 1024  # точек сетки θ на кривую
+DISTANCE_NEWTON_ITERATIONS = 4  # шагов Ньютона при уточнении ближайших точек
+DISTANCE_REFINE_BLOCK = 64  # точек, уточняемых за один шаг перебора
+DISTANCE_FRECHET_BAND = 0.125  # полуширина полосы Фреше (доля числа точек)
@@ -0,0 +1,191 @@
+"""Панель кривизны: κ(θ), R(θ), κ(s) и гистограмма по одному вычислению"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from curve_math import get_frame_table
+from polyline_simplify import minmax_decimate, pixel_columns
+from instrumentation import instrumented
+from config import DASHBOARD_NUM_SAMPLES, DASHBOARD_HIST_BINS, DASHBOARD_MAX_RADIUS
+
+
+@instrumented
+def curvature_analysis(num_samples=None, bins=None):
+    """
+    Кривизна, длина дуги, экстремумы, перегибы и гистограмма κ.
+
+    Все величины получаются из одного вызова get_frame_table на
+    равномерной периодической сетке θ (без повтора 2π).
+
+    Args:
+        num_samples: количество точек (по умолчанию из config)
+        bins: количество столбцов гистограммы (по умолчанию из config)
+
+    Returns:
+        dict: таблица get_frame_table и дополнительно
+              'arc_length' — длина дуги s(θ), 'length' — длина кривой,
+              'maxima', 'minima' — индексы локальных экстремумов κ со знаком,
+              'inflection_theta', 'inflection_arc_length' — точки перегиба,
+              'histogram', 'bin_edges' — доля длины кривой по значениям κ
+    """
+    if num_samples is None:
+        num_samples = DASHBOARD_NUM_SAMPLES
+    if bins is None:
+        bins = DASHBOARD_HIST_BINS
+
+    theta = np.linspace(0, 2 * np.pi, num_samples, endpoint=False)
+    step = 2 * np.pi / num_samples
+    table = get_frame_table(theta)
+
+    # Длина дуги по формуле трапеций; последний отрезок замыкает кривую
+    speed = table['speed']
+    pieces = 0.5 * step * (speed + np.roll(speed, -1))
+    table['arc_length'] = np.concatenate([[0.0], np.cumsum(pieces[:-1])])
+    table['length'] = pieces.sum()
+
+    kappa = table['signed_curvature']
+    previous, following = np.roll(kappa, 1), np.roll(kappa, -1)
+    table['maxima'] = np.flatnonzero((kappa > previous) & (kappa >= following))
+    table['minima'] = np.flatnonzero((kappa < previous) & (kappa <= following))
+
+    # Перегиб — смена знака κ между соседними узлами, положение — линейной интерполяцией
+    crossing = np.flatnonzero(np.signbit(kappa) != np.signbit(following))
+    fraction = kappa[crossing] / (kappa[crossing] - following[crossing])
+    table['inflection_theta'] = theta[crossing] + fraction * step
+    table['inflection_arc_length'] = (table['arc_length'][crossing] +
+                                      fraction * pieces[crossing])
+
+    # Веса — длина дуги, приходящаяся на узел: гистограмма не зависит от параметризации
+    histogram, edges = np.histogram(kappa, bins=bins, weights=speed * step)
+    table['histogram'] = histogram / table['length']
+    table['bin_edges'] = edges
+
+    return table
+
+
+def add_decimated_line(ax, x, y, **kwargs):
+    """
+    Рисует длинную линию с прореживанием min/max по пикселям осей.
+
+    На каждый пиксельный столбец остаётся не больше двух вершин, поэтому
+    размер линии ограничен шириной экрана, а узкие пики не теряются.
+    При изменении границ по x видимый участок прореживается заново.
+
+    Args:
+        ax: объект осей matplotlib
+        x: неубывающие координаты по горизонтали
+        y: значения
+        **kwargs: параметры ax.plot
+
+    Returns:
+        Line2D: линия
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    index = minmax_decimate(x, y, pixel_columns(ax))
+    line, = ax.plot(x[index], y[index], **kwargs)
+
+    def update(axes):
+        x0, x1 = axes.get_xlim()
+        # Берём по одному узлу за границами, чтобы линия доходила до края
+        start = max(np.searchsorted(x, x0) - 1, 0)
+        stop = min(np.searchsorted(x, x1, side='right') + 1, len(x))
+        visible = slice(start, stop)
+        index = start + minmax_decimate(x[visible], y[visible], pixel_columns(axes),
+                                        x_range=(x0, x1))
+        line.set_data(x[index], y[index])
+
+    ax.callbacks.connect('xlim_changed', update)
+    return line
+
+
+@instrumented
+def plot_curvature_dashboard(num_samples=None, max_radius=None, save_path=None):
+    """
+    Панель кривизны: κ(θ) с экстремумами и перегибами, R(θ), κ(s)
+    по длине дуги и гистограмма κ, взвешенная по длине.
+
+    Все панели строятся по одному вычислению curvature_analysis;
+    линии прореживаются по пикселям (add_decimated_line).
+
+    Args:
+        num_samples: количество точек (по умолчанию из config)
+        max_radius: ограничение R на графике (по умолчанию из config)
+        save_path: путь для сохранения
+
+    Returns:
+        tuple: (fig, axes, analysis) — analysis из curvature_analysis
+    """
+    if max_radius is None:
+        max_radius = DASHBOARD_MAX_RADIUS
+
+    analysis = curvature_analysis(num_samples)
+    theta = analysis['theta']
+    kappa = analysis['signed_curvature']
+    arc_length = analysis['arc_length']
+    maxima, minima = analysis['maxima'], analysis['minima']
+    inflections = analysis['inflection_theta']
+
+    fig, axes = plt.subplots(2, 2, figsize=(14, 9))
+    ax_theta, ax_radius, ax_arc, ax_hist = axes.ravel()
+
+    # Кривизна со знаком по θ
+    add_decimated_line(ax_theta, theta, kappa, color='b', linewidth=1)
+    ax_theta.scatter(theta[maxima], kappa[maxima], marker='^', color='red',
+                     zorder=3, label='Максимумы κ')
+    ax_theta.scatter(theta[minima], kappa[minima], marker='v', color='green',
+                     zorder=3, label='Минимумы κ')
+    ax_theta.scatter(inflections, np.zeros_like(inflections), marker='x',
+                     color='black', zorder=3, label='Перегибы')
+    ax_theta.axhline(0, color='gray', linewidth=0.8)
+    ax_theta.set_xlabel('θ (рад)', fontsize=12)
+    ax_theta.set_ylabel('Кривизна κ', fontsize=12)
+    ax_theta.set_title('Кривизна со знаком вдоль кривой', fontsize=14)
+    ax_theta.set_xlim(0, 2 * np.pi)
+    ax_theta.legend(fontsize=9)
+
+    # Радиус кривизны (ограничиваем для наглядности)
+    add_decimated_line(ax_radius, theta, np.minimum(analysis['radius'], max_radius),
+                       color='r', linewidth=1)
+    ax_radius.set_xlabel('θ (рад)', fontsize=12)
+    ax_radius.set_ylabel('Радиус кривизны R', fontsize=12)
+    ax_radius.set_title(f'Радиус кривизны (ограничен R ≤ {max_radius:g})', fontsize=14)
+    ax_radius.set_xlim(0, 2 * np.pi)
+
+    # Кривизна по длине дуги
+    add_decimated_line(ax_arc, arc_length, kappa, color='purple', linewidth=1)
+    ax_arc.scatter(analysis['inflection_arc_length'], np.zeros_like(inflections),
+                   marker='x', color='black', zorder=3)
+    ax_arc.axhline(0, color='gray', linewidth=0.8)
+    ax_arc.set_xlabel('Длина дуги s', fontsize=12)
+    ax_arc.set_ylabel('Кривизна κ', fontsize=12)
+    ax_arc.set_title(f'κ(s), длина кривой L = {analysis["length"]:.4f}', fontsize=14)
+    ax_arc.set_xlim(0, analysis['length'])
+
+    # Распределение κ по длине кривой
+    ax_hist.stairs(analysis['histogram'], analysis['bin_edges'], fill=True,
+                   color='steelblue', alpha=0.7)
+    ax_hist.set_xlabel('Кривизна κ', fontsize=12)
+    ax_hist.set_ylabel('Доля длины кривой', fontsize=12)
+    ax_hist.set_title('Распределение кривизны', fontsize=14)
+
+    for ax in axes.ravel():
+        ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+
+    if save_path:
+        plt.savefig(save_path, dpi=150)
+
+    return fig, axes, analysis
+
+
+if __name__ == '__main__':
+    fig, axes, analysis = plot_curvature_dashboard()
+    print(f"Длина кривой: {analysis['length']:.6f}")
+    print(f"Экстремумов κ: {len(analysis['maxima'])} max, {len(analysis['minima'])} min")
+    print(f"Точек перегиба: {len(analysis['inflection_theta'])}")
+    for line in (line for ax in axes.ravel() for line in ax.get_lines()):
+        if len(line.get_xdata()) > 2:
+            print(f"  линия: {len(line.get_xdata())} вершин")
+    plt.show()
@@ -1,33 +1,136 @@
 """Определение параметрической кривой (клякса)"""
 
+from contextlib import contextmanager
+
 import numpy as np
+from instrumentation import instrumented
+
+
+# Гармонические коэффициенты кривой:
+#     r(θ) = Σ a_k·cos(kθ) + b_k·sin(kθ),  k = 0..K
+# Строка 0 — a_k (при cos), строка 1 — b_k (при sin).
+CURVE_COEFFICIENTS = np.array([
+    [1.0, 0.0, 0.3, 0.0, 0.0, 0.0, 0.0, 0.1, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 0.2, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.05],
+])
+
+_active_coefficients = CURVE_COEFFICIENTS
+
+
+def as_coefficients(coeffs):
+    """
+    Приводит коэффициенты к массиву формы (2, K+1).
+
+    Args:
+        coeffs: массив (2, K+1) или плоский вектор [a_0..a_K, b_0..b_K]
+
+    Returns:
+        numpy.ndarray: коэффициенты формы (2, K+1)
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    if coeffs.ndim == 1:
+        if coeffs.size % 2:
+            raise ValueError("Плоский вектор коэффициентов должен иметь чётную длину")
+        coeffs = coeffs.reshape(2, -1)
+    if coeffs.ndim != 2 or coeffs.shape[0] != 2:
+        raise ValueError(f"Ожидалась форма (2, K+1), получено {coeffs.shape}")
+    return coeffs
+
+
+def get_curve_coefficients():
+    """
+    Возвращает активные гармонические коэффициенты кривой.
+
+    Returns:
+        numpy.ndarray: коэффициенты формы (2, K+1)
+    """
+    return _active_coefficients
+
+
+def set_curve_coefficients(coeffs=None):
+    """
+    Устанавливает активные коэффициенты кривой.
+
+    Все функции curve_definition и curve_math используют их при вычислениях.
+
+    Args:
+        coeffs: коэффициенты (2, K+1); None — вернуть коэффициенты по умолчанию
+    """
+    global _active_coefficients
+    if coeffs is None:
+        _active_coefficients = CURVE_COEFFICIENTS
+    else:
+        _active_coefficients = as_coefficients(coeffs)
+
+
+@contextmanager
+def use_curve_coefficients(coeffs):
+    """
+    Временно подменяет коэффициенты кривой.
+
+    Пример:
+        with use_curve_coefficients(coeffs):
+            extremes = get_curvature_extremes()
+    """
+    previous = _active_coefficients
+    set_curve_coefficients(coeffs)
+    try:
+        yield
+    finally:
+        set_curve_coefficients(previous)
+
+
+def harmonic_series(theta, coeffs=None, order=0):
+    """
+    Производная порядка order тригонометрического ряда (аналитически).
+
+    d^n/dθ^n [a·cos(kθ) + b·sin(kθ)] = k^n·[a·cos(kθ + nπ/2) + b·sin(kθ + nπ/2)]
+
+    Args:
+        theta: угол (скаляр или массив)
+        coeffs: коэффициенты (2, K+1); по умолчанию — активные
+        order: порядок производной (0 — сама функция)
+
+    Returns:
+        float или numpy.ndarray: значение ряда или его производной
+    """
+    a, b = get_curve_coefficients() if coeffs is None else as_coefficients(coeffs)
+    theta = np.asarray(theta, dtype=float)
+    phase = order * np.pi / 2
+
+    result = np.zeros_like(theta)
+    for k in np.flatnonzero((a != 0) | (b != 0)):
+        if k == 0 and order > 0:
+            continue
+        arg = k * theta + phase
+        result = result + k ** order * (a[k] * np.cos(arg) + b[k] * np.sin(arg))
+
+    return result
 
 
+@instrumented
 def r_function(theta):
     """
     Радиус-функция r(θ) для полярных координат.
 
-    Кривая: r(θ) = 1 + 0.3·cos(2θ) + 0.2·sin(3θ) + 0.1·cos(7θ) + 0.05·sin(11θ)
+    Кривая по умолчанию:
+        r(θ) = 1 + 0.3·cos(2θ) + 0.2·sin(3θ) + 0.1·cos(7θ) + 0.05·sin(11θ)
     """
-    return (1 +
-            0.3 * np.cos(2 * theta) +
-            0.2 * np.sin(3 * theta) +
-            0.1 * np.cos(7 * theta) +
-            0.05 * np.sin(11 * theta))
+    return harmonic_series(theta, order=0)
 
 
+@instrumented
 def dr_function(theta):
     """
     Производная dr/dθ (аналитически).
 
-    dr/dθ = -0.6·sin(2θ) + 0.6·cos(3θ) - 0.7·sin(7θ) + 0.55·cos(11θ)
+    Для кривой по умолчанию:
+        dr/dθ = -0.6·sin(2θ) + 0.6·cos(3θ) - 0.7·sin(7θ) + 0.55·cos(11θ)
     """
-    return (-0.3 * 2 * np.sin(2 * theta) +
-            0.2 * 3 * np.cos(3 * theta) -
-            0.1 * 7 * np.sin(7 * theta) +
-            0.05 * 11 * np.cos(11 * theta))
+    return harmonic_series(theta, order=1)
 
 
+@instrumented
 def get_cartesian_coordinates(theta):
     """
     Преобразование из полярных в декартовы координаты.
@@ -44,6 +147,7 @@ def get_cartesian_coordinates(theta):
     return x, y
 
 
+@instrumented
 def get_curve_points(num_points=1000):
     """
     Генерирует массив точек кривой.
@@ -0,0 +1,105 @@
+"""Аналитические производные произвольного порядка: r⁽ᵏ⁾(θ), x⁽ᵏ⁾(θ), y⁽ᵏ⁾(θ)"""
+
+import numpy as np
+from curve_definition import get_curve_coefficients, as_coefficients
+from instrumentation import instrumented
+
+# cos(nπ/2) и sin(nπ/2) для n mod 4 — точные целые, без ошибок округления
+_COS_QUARTER = np.array([1.0, 0.0, -1.0, 0.0])
+_SIN_QUARTER = np.array([0.0, 1.0, 0.0, -1.0])
+
+
+def _quarter_phase(max_order):
+    """Множители cos(nπ/2), sin(nπ/2) для n = 0..max_order."""
+    n = np.arange(max_order + 1) % 4
+    return _COS_QUARTER[n], _SIN_QUARTER[n]
+
+
+def _binomial_matrix(max_order):
+    """Нижнетреугольная матрица биномиальных коэффициентов C(n, j)."""
+    binom = np.zeros((max_order + 1, max_order + 1))
+    binom[:, 0] = 1.0
+    for n in range(1, max_order + 1):
+        binom[n, 1:n + 1] = binom[n - 1, :n] + binom[n - 1, 1:n + 1]
+    return binom
+
+
+@instrumented
+def radius_derivatives(theta, max_order, coeffs=None):
+    """
+    Вычисляет r(θ), r'(θ), ..., r⁽ᵏ⁾(θ) за один пакетный проход.
+
+    Для каждой гармоники:
+        d^n/dθ^n [a·cos(kθ) + b·sin(kθ)] = k^n·[(a·cₙ + b·sₙ)·cos(kθ) + (b·cₙ − a·sₙ)·sin(kθ)]
+    где cₙ = cos(nπ/2), sₙ = sin(nπ/2). Базис cos(kθ), sin(kθ) вычисляется
+    один раз, а все порядки получаются одним матричным умножением
+    (порядки × гармоники) @ (гармоники × N).
+
+    Args:
+        theta: угол (скаляр или массив)
+        max_order: наибольший порядок производной k
+        coeffs: коэффициенты (2, K+1); по умолчанию — активные
+
+    Returns:
+        numpy.ndarray: массив формы (k+1,) + theta.shape, строка n — r⁽ⁿ⁾(θ)
+    """
+    a, b = get_curve_coefficients() if coeffs is None else as_coefficients(coeffs)
+    theta = np.asarray(theta, dtype=float)
+
+    harmonics = np.flatnonzero((a != 0) | (b != 0))
+    a, b = a[harmonics], b[harmonics]
+
+    angles = np.multiply.outer(harmonics, theta.ravel())
+    cos_basis = np.cos(angles)
+    sin_basis = np.sin(angles)
+
+    cos_n, sin_n = _quarter_phase(max_order)
+    scale = harmonics.astype(float)[np.newaxis, :] ** np.arange(max_order + 1)[:, np.newaxis]
+
+    weight_cos = scale * (a * cos_n[:, np.newaxis] + b * sin_n[:, np.newaxis])
+    weight_sin = scale * (b * cos_n[:, np.newaxis] - a * sin_n[:, np.newaxis])
+
+    derivs = weight_cos @ cos_basis + weight_sin @ sin_basis
+    return derivs.reshape((max_order + 1,) + theta.shape)
+
+
+@instrumented
+def cartesian_derivatives(theta, max_order, coeffs=None):
+    """
+    Вычисляет x⁽ⁿ⁾(θ) и y⁽ⁿ⁾(θ) для n = 0..k по правилу Лейбница.
+
+        x⁽ⁿ⁾ = Σⱼ C(n, j)·r⁽ⁿ⁻ʲ⁾·cos(θ + jπ/2)
+        y⁽ⁿ⁾ = Σⱼ C(n, j)·r⁽ⁿ⁻ʲ⁾·sin(θ + jπ/2)
+
+    Все порядки считаются одной свёрткой по j, cos(θ) и sin(θ) — один раз.
+
+    Args:
+        theta: угол (скаляр или массив)
+        max_order: наибольший порядок производной k
+        coeffs: коэффициенты (2, K+1); по умолчанию — активные
+
+    Returns:
+        tuple: (x_derivs, y_derivs), каждый формы (k+1,) + theta.shape
+    """
+    theta = np.asarray(theta, dtype=float)
+    r_derivs = radius_derivatives(theta.ravel(), max_order, coeffs)
+
+    cos_t = np.cos(theta.ravel())
+    sin_t = np.sin(theta.ravel())
+    cos_j, sin_j = _quarter_phase(max_order)
+
+    # cos(θ + jπ/2) и sin(θ + jπ/2) для всех j
+    cos_shift = np.outer(cos_j, cos_t) - np.outer(sin_j, sin_t)
+    sin_shift = np.outer(sin_j, cos_t) + np.outer(cos_j, sin_t)
+
+    # r_shift[n, j] = r⁽ⁿ⁻ʲ⁾; для j > n биномиальный коэффициент равен нулю
+    orders = np.arange(max_order + 1)
+    lag = np.clip(orders[:, np.newaxis] - orders[np.newaxis, :], 0, None)
+    r_shift = r_derivs[lag]
+    binom = _binomial_matrix(max_order)
+
+    x_derivs = np.einsum('nj,njk,jk->nk', binom, r_shift, cos_shift)
+    y_derivs = np.einsum('nj,njk,jk->nk', binom, r_shift, sin_shift)
+
+    shape = (max_order + 1,) + theta.shape
+    return x_derivs.reshape(shape), y_derivs.reshape(shape)
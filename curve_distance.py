@@ -0,0 +1,223 @@
+"""Расстояния между кривыми: Хаусдорф и дискретное расстояние Фреше"""
+
+import numpy as np
+from curve_definition import (get_curve_coefficients, as_coefficients,
+                              use_curve_coefficients, get_cartesian_coordinates)
+from curve_math import project_point_to_curve
+from batch_curves import as_coefficient_sets, iter_batches
+from spatial_index import CurveSpatialIndex
+from instrumentation import instrumented
+from config import (DISTANCE_NUM_SAMPLES, DISTANCE_NEWTON_ITERATIONS,
+                    DISTANCE_REFINE_BLOCK, DISTANCE_FRECHET_BAND)
+
+
+def _sample_grid(num_samples):
+    """Общая сетка θ: от 0 до 2π включительно (начало и конец кривой совпадают)."""
+    return np.linspace(0, 2 * np.pi, num_samples)
+
+
+def _directed_hausdorff(px, py, index, theta, coeffs, iterations, block):
+    """
+    Направленное расстояние Хаусдорфа от точек (px, py) до кривой coeffs.
+
+    Ближайшая выборочная точка кривой (index) даёт верхнюю оценку
+    расстояния для каждой точки. Точки уточняются проекцией Ньютона
+    в порядке убывания оценки блоками по block штук; перебор
+    останавливается, как только оценка следующей точки не больше
+    уже найденного максимума — уточнение только уменьшает расстояние,
+    поэтому результат от этого не меняется.
+
+    Returns:
+        float: max по точкам расстояния до кривой
+    """
+    nearest, upper = index.query(px, py)
+    order = np.argsort(-upper)
+
+    best = 0.0
+    with use_curve_coefficients(coeffs):
+        for start in range(0, len(order), block):
+            rows = order[start:start + block]
+            rows = rows[upper[rows] > best]
+            if not rows.size:
+                break
+
+            projected = project_point_to_curve(px[rows], py[rows], theta[nearest[rows]],
+                                               iterations=iterations)
+            qx, qy = get_cartesian_coordinates(projected)
+            # Ньютон мог уйти к соседнему локальному минимуму — оценка сверху остаётся в силе
+            distance = np.minimum(np.hypot(qx - px[rows], qy - py[rows]), upper[rows])
+            best = max(best, distance.max())
+
+    return best
+
+
+@instrumented
+def hausdorff_distance(coefficient_sets, reference=None, num_samples=None,
+                       iterations=None, chunk_size=None):
+    """
+    Расстояние Хаусдорфа от каждой кривой набора до эталонной.
+
+    H(A, B) = max(max_a d(a, B), max_b d(b, A)). Точки обеих кривых
+    берутся на сетке θ; расстояние от точки до другой кривой — поиск
+    ближайшей выборочной точки по CurveSpatialIndex и уточнение
+    проекцией Ньютона (project_point_to_curve) с ранним выходом
+    (_directed_hausdorff). Индекс эталонной кривой строится один раз
+    на весь набор, точки вариантов вычисляются блоками (iter_batches).
+
+    Args:
+        coefficient_sets: массив (M, 2, K+1) или (M, 2·(K+1))
+        reference: коэффициенты эталона (по умолчанию — активные)
+        num_samples: точек сетки θ (по умолчанию из config)
+        iterations: шагов Ньютона (по умолчанию из config)
+        chunk_size: кривых в блоке iter_batches (опционально)
+
+    Returns:
+        numpy.ndarray: расстояния, массив (M,)
+    """
+    if reference is None:
+        reference = get_curve_coefficients()
+    if num_samples is None:
+        num_samples = DISTANCE_NUM_SAMPLES
+    if iterations is None:
+        iterations = DISTANCE_NEWTON_ITERATIONS
+
+    reference = as_coefficients(reference)
+    sets = as_coefficient_sets(coefficient_sets)
+    theta = _sample_grid(num_samples)
+
+    with use_curve_coefficients(reference):
+        ref_x, ref_y = get_cartesian_coordinates(theta)
+    ref_index = CurveSpatialIndex(ref_x, ref_y)
+
+    distances = np.empty(len(sets))
+    for start, values in iter_batches(sets, theta, chunk_size):
+        for row, (x, y) in enumerate(zip(values['x'], values['y'])):
+            coeffs = sets[start + row]
+            to_curve = _directed_hausdorff(ref_x, ref_y, CurveSpatialIndex(x, y), theta,
+                                           coeffs, iterations, DISTANCE_REFINE_BLOCK)
+            to_reference = _directed_hausdorff(x, y, ref_index, theta, reference,
+                                               iterations, DISTANCE_REFINE_BLOCK)
+            distances[start + row] = max(to_curve, to_reference)
+
+    return distances
+
+
+def _banded_frechet(ax, ay, bx, by, band):
+    """
+    Дискретное расстояние Фреше между ломаной A и блоком ломаных B.
+
+    Динамика c[i, j] = max(d(a_i, b_j), min(c[i−1, j], c[i, j−1], c[i−1, j−1]))
+    считается по антидиагоналям t = i + j: ячейки диагонали зависят
+    только от двух предыдущих, поэтому каждая диагональ — одна
+    векторная операция сразу для всех кривых блока. Учитываются только
+    ячейки полосы |i − j| ≤ band. Диагонали хранятся по индексу i
+    со сдвигом на 1: строка 0 — всегда ∞ (граница таблицы).
+
+    Args:
+        ax, ay: точки A, массивы (N,)
+        bx, by: точки кривых блока, массивы (M, N)
+        band: полуширина полосы
+
+    Returns:
+        numpy.ndarray: расстояния, массив (M,)
+    """
+    m, n = bx.shape
+    # Раскладка (точки × кривые): выборка по i и j берёт целые строки
+    bx, by = np.ascontiguousarray(bx.T), np.ascontiguousarray(by.T)
+    ax, ay = ax[:, np.newaxis], ay[:, np.newaxis]
+    diagonals = np.full((3, n + 1, m), np.inf)
+    ranges = [(0, -1)] * 3
+
+    for t in range(2 * n - 1):
+        lo = max(0, t - n + 1, (t - band + 1) // 2)
+        hi = min(t, n - 1, (t + band) // 2)
+
+        current = diagonals[t % 3]
+        previous, before = diagonals[(t - 1) % 3], diagonals[(t - 2) % 3]
+
+        # Буфер хранит диагональ t − 3 — стираем её
+        old_lo, old_hi = ranges[t % 3]
+        current[old_lo + 1:old_hi + 2] = np.inf
+        ranges[t % 3] = (lo, hi)
+
+        # Вдоль диагонали i растёт, j = t − i убывает
+        rows = slice(lo, hi + 1)
+        cols = slice(t - lo, t - hi - 1 if t - hi > 0 else None, -1)
+        cost = np.hypot(ax[rows] - bx[cols], ay[rows] - by[cols])
+        if t == 0:
+            current[1] = cost[0]
+            continue
+
+        # c[i−1, j] и c[i, j−1] — на диагонали t − 1, c[i−1, j−1] — на t − 2
+        reach = np.minimum(np.minimum(previous[lo:hi + 1], previous[lo + 1:hi + 2]),
+                           before[lo:hi + 1])
+        np.maximum(cost, reach, out=current[lo + 1:hi + 2])
+
+    return diagonals[(2 * n - 2) % 3][n]
+
+
+@instrumented
+def frechet_distance(coefficient_sets, reference=None, num_samples=None,
+                     band=None, chunk_size=None):
+    """
+    Дискретное расстояние Фреше от каждой кривой набора до эталонной.
+
+    Кривые сравниваются как замкнутые ломаные по общей сетке θ от 0
+    до 2π (с одной и той же начальной точкой θ = 0). Допускаются только
+    сопоставления, у которых номера точек расходятся не больше чем на
+    band, поэтому результат — оценка сверху полного дискретного
+    расстояния Фреше (точная, если оптимальное сопоставление лежит в
+    полосе), а затраты — O(N·band) на кривую вместо O(N²).
+
+    Args:
+        coefficient_sets: массив (M, 2, K+1) или (M, 2·(K+1))
+        reference: коэффициенты эталона (по умолчанию — активные)
+        num_samples: точек сетки θ (по умолчанию из config)
+        band: полуширина полосы в точках (по умолчанию — доля
+              DISTANCE_FRECHET_BAND от num_samples)
+        chunk_size: кривых в блоке iter_batches (опционально)
+
+    Returns:
+        numpy.ndarray: расстояния, массив (M,)
+    """
+    if reference is None:
+        reference = get_curve_coefficients()
+    if num_samples is None:
+        num_samples = DISTANCE_NUM_SAMPLES
+    if band is None:
+        band = max(1, int(DISTANCE_FRECHET_BAND * num_samples))
+
+    sets = as_coefficient_sets(coefficient_sets)
+    theta = _sample_grid(num_samples)
+
+    with use_curve_coefficients(as_coefficients(reference)):
+        ref_x, ref_y = get_cartesian_coordinates(theta)
+
+    distances = np.empty(len(sets))
+    for start, values in iter_batches(sets, theta, chunk_size):
+        stop = start + len(values['x'])
+        distances[start:stop] = _banded_frechet(ref_x, ref_y, values['x'],
+                                                values['y'], band)
+
+    return distances
+
+
+if __name__ == '__main__':
+    import time
+
+    rng = np.random.default_rng(0)
+    base = get_curve_coefficients()
+    num_curves = 1000
+    noise = rng.normal(scale=0.01, size=(num_curves,) + base.shape)
+    sets = base + noise / (1 + np.arange(base.shape[1]))
+
+    start = time.perf_counter()
+    hausdorff = hausdorff_distance(sets)
+    print(f"Хаусдорф, {num_curves} кривых: {time.perf_counter() - start:.2f} с, "
+          f"медиана {np.median(hausdorff):.4f}, max {hausdorff.max():.4f}")
+
+    start = time.perf_counter()
+    frechet = frechet_distance(sets)
+    print(f"Фреше, {num_curves} кривых: {time.perf_counter() - start:.2f} с, "
+          f"медиана {np.median(frechet):.4f}, max {frechet.max():.4f}")
+    print(f"Фреше ≥ Хаусдорфа: {np.all(frechet >= hausdorff - 1e-3)}")
@@ -1,9 +1,12 @@
 """Математические расчёты: касательные, нормали и кривизна"""
 
 import numpy as np
-from curve_definition import r_function, dr_function
+from instrumentation import instrumented
+from curve_definition import r_function, dr_function, harmonic_series
+from curve_derivatives import cartesian_derivatives
 
 
+@instrumented
 def compute_derivatives(theta):
     """
     Вычисляет производные dx/dθ и dy/dθ аналитически.
@@ -27,6 +30,7 @@ def compute_derivatives(theta):
     return dx_dtheta, dy_dtheta
 
 
+@instrumented
 def compute_second_derivatives(theta):
     """
     Вычисляет вторые производные d²x/dθ² и d²y/dθ² аналитически.
@@ -63,9 +67,10 @@ def d2r_function(theta):
     """
     Вторая производная d²r/dθ² (аналитически).
 
-    r(θ) = 1 + 0.3·cos(2θ) + 0.2·sin(3θ) + 0.1·cos(7θ) + 0.05·sin(11θ)
-    dr/dθ = -0.6·sin(2θ) + 0.6·cos(3θ) - 0.7·sin(7θ) + 0.55·cos(11θ)
-    d²r/dθ² = -1.2·cos(2θ) - 1.8·sin(3θ) - 4.9·cos(7θ) - 6.05·sin(11θ)
+    Для кривой по умолчанию:
+        r(θ) = 1 + 0.3·cos(2θ) + 0.2·sin(3θ) + 0.1·cos(7θ) + 0.05·sin(11θ)
+        dr/dθ = -0.6·sin(2θ) + 0.6·cos(3θ) - 0.7·sin(7θ) + 0.55·cos(11θ)
+        d²r/dθ² = -1.2·cos(2θ) - 1.8·sin(3θ) - 4.9·cos(7θ) - 6.05·sin(11θ)
 
     Args:
         theta: угол (скаляр или массив)
@@ -73,12 +78,29 @@ def d2r_function(theta):
     Returns:
         float или numpy.ndarray: значение второй производной
     """
-    return (-0.3 * 4 * np.cos(2 * theta) -      # -1.2·cos(2θ)
-            0.2 * 9 * np.sin(3 * theta) -        # -1.8·sin(3θ)
-            0.1 * 49 * np.cos(7 * theta) -       # -4.9·cos(7θ)
-            0.05 * 121 * np.sin(11 * theta))     # -6.05·sin(11θ)
+    return harmonic_series(theta, order=2)
 
 
+@instrumented
+def compute_third_derivatives(theta):
+    """
+    Вычисляет третьи производные d³x/dθ³ и d³y/dθ³ аналитически.
+
+    По правилу Лейбница (см. curve_derivatives.cartesian_derivatives):
+        d³x/dθ³ = r‴·cos(θ) - 3·r″·sin(θ) - 3·r′·cos(θ) + r·sin(θ)
+        d³y/dθ³ = r‴·sin(θ) + 3·r″·cos(θ) - 3·r′·sin(θ) - r·cos(θ)
+
+    Args:
+        theta: угол (скаляр или массив)
+
+    Returns:
+        tuple: (d3x_dtheta3, d3y_dtheta3)
+    """
+    x_derivs, y_derivs = cartesian_derivatives(theta, 3)
+    return x_derivs[3], y_derivs[3]
+
+
+@instrumented
 def compute_curvature(theta):
     """
     Вычисляет кривизну κ (каппа) в точке.
@@ -105,6 +127,7 @@ def compute_curvature(theta):
     return curvature
 
 
+@instrumented
 def compute_radius_of_curvature(theta):
     """
     Вычисляет радиус кривизны R = 1/κ.
@@ -129,6 +152,7 @@ def compute_radius_of_curvature(theta):
     return radius
 
 
+@instrumented
 def compute_curvature_center(theta):
     """
     Вычисляет центр кривизны (центр соприкасающейся окружности).
@@ -189,6 +213,35 @@ def compute_signed_curvature(theta):
     return numerator / denominator
 
 
+@instrumented
+def compute_curvature_derivative(theta):
+    """
+    Вычисляет производную знаковой кривизны dκ/dθ.
+
+    κ = N / s³,  где N = x'·y'' - y'·x'',  s² = x'² + y'²
+
+        dκ/dθ = (x'·y''' - y'·x''') / s³ - 3·N·(x'·x'' + y'·y'') / s⁵
+
+    Нули dκ/dθ — экстремумы кривизны (и точки возврата эволюты).
+
+    Args:
+        theta: угол (скаляр или массив)
+
+    Returns:
+        float или numpy.ndarray: dκ/dθ
+    """
+    x_derivs, y_derivs = cartesian_derivatives(theta, 3)
+    _, dx, d2x, d3x = x_derivs
+    _, dy, d2y, d3y = y_derivs
+
+    speed_sq = dx**2 + dy**2
+    numerator = dx * d2y - dy * d2x
+
+    return ((dx * d3y - dy * d3x) / speed_sq**1.5 -
+            3 * numerator * (dx * d2x + dy * d2y) / speed_sq**2.5)
+
+
+@instrumented
 def compute_tangent_vector(theta):
     """
     Вычисляет единичный касательный вектор.
@@ -210,6 +263,7 @@ def compute_tangent_vector(theta):
     return tx, ty
 
 
+@instrumented
 def compute_normal_vector(theta):
     """
     Вычисляет единичный вектор нормали.
@@ -231,6 +285,53 @@ def compute_normal_vector(theta):
     return nx, ny
 
 
+@instrumented
+def project_point_to_curve(px, py, theta0, iterations=3, max_step=0.25):
+    """
+    Проецирует точку плоскости на кривую методом Ньютона по θ.
+
+    Ищется ближайший к начальному приближению корень функции
+        f(θ) = (P(θ) - M)·P'(θ),   f'(θ) = |P'(θ)|² + (P(θ) - M)·P''(θ)
+    где M = (px, py). Если f' ≤ 0 (окрестность максимума расстояния),
+    делается шаг градиентного спуска -f/|P'|². Шаг ограничен max_step,
+    чтобы не перескакивать на соседние лепестки.
+
+    Args:
+        px, py: координаты точки (скаляры или массивы)
+        theta0: начальное приближение (например, θ с прошлого шага)
+        iterations: количество шагов Ньютона
+        max_step: ограничение шага, рад
+
+    Returns:
+        float или numpy.ndarray: θ проекции в диапазоне [0, 2π)
+    """
+    theta = np.asarray(theta0, dtype=float)
+
+    for _ in range(iterations):
+        r = r_function(theta)
+        dr = dr_function(theta)
+        d2r = d2r_function(theta)
+        cos_t = np.cos(theta)
+        sin_t = np.sin(theta)
+
+        ex = r * cos_t - px
+        ey = r * sin_t - py
+        dx = dr * cos_t - r * sin_t
+        dy = dr * sin_t + r * cos_t
+        d2x = d2r * cos_t - 2 * dr * sin_t - r * cos_t
+        d2y = d2r * sin_t + 2 * dr * cos_t - r * sin_t
+
+        f = ex * dx + ey * dy
+        speed_sq = dx**2 + dy**2
+        df = speed_sq + ex * d2x + ey * d2y
+
+        step = np.where(df > 0, -f / np.where(df > 0, df, 1.0), -f / speed_sq)
+        theta = theta + np.clip(step, -max_step, max_step)
+
+    return np.mod(theta, 2 * np.pi)
+
+
+@instrumented
 def get_point_data(theta):
     """
     Получает полную информацию о точке на кривой.
@@ -274,6 +375,66 @@ def get_multiple_points_data(theta_array):
     return [get_point_data(t) for t in theta_array]
 
 
+@instrumented
+def get_frame_table(theta_array):
+    """
+    Получает данные для массива точек в виде столбцовой таблицы.
+
+    Векторизованный аналог get_multiple_points_data: производные r(θ)
+    и тригонометрические множители вычисляются один раз для всего массива.
+
+    Args:
+        theta_array: массив углов
+
+    Returns:
+        dict: {имя столбца: numpy.ndarray}, столбцы theta, x, y, tx, ty,
+              nx, ny, curvature, signed_curvature, radius, center_x, center_y,
+              speed — |dP/dθ| (ds/dθ)
+    """
+    theta = np.asarray(theta_array, dtype=float)
+    r = r_function(theta)
+    dr = dr_function(theta)
+    d2r = d2r_function(theta)
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+
+    x = r * cos_t
+    y = r * sin_t
+    dx = dr * cos_t - r * sin_t
+    dy = dr * sin_t + r * cos_t
+    d2x = d2r * cos_t - 2 * dr * sin_t - r * cos_t
+    d2y = d2r * sin_t + 2 * dr * cos_t - r * sin_t
+
+    speed_sq = dx**2 + dy**2
+    speed = np.sqrt(speed_sq)
+    tx = dx / speed
+    ty = dy / speed
+
+    cross = dx * d2y - dy * d2x
+    signed_curvature = cross / speed_sq**1.5
+    curvature = np.abs(signed_curvature)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        radius = np.where(curvature > 1e-10, 1.0 / curvature, np.inf)
+        factor = speed_sq / cross
+
+    return {
+        'theta': theta,
+        'x': x,
+        'y': y,
+        'tx': tx,
+        'ty': ty,
+        'nx': -ty,
+        'ny': tx,
+        'curvature': curvature,
+        'signed_curvature': signed_curvature,
+        'radius': radius,
+        'center_x': x - dy * factor,
+        'center_y': y + dx * factor,
+        'speed': speed
+    }
+
+
 def verify_orthogonality(theta):
     """
     Проверяет ортогональность касательной и нормали.
@@ -321,6 +482,42 @@ def get_curvature_extremes(num_samples=1000):
     }
 
 
+def get_curve_statistics(num_samples=1000):
+    """
+    Сводная статистика кривизны и геометрии кривой.
+
+    Используется равномерная периодическая сетка по θ (без повтора 2π),
+    поэтому средние и интегралы вычисляются с спектральной точностью:
+        S = ½·∫ r² dθ
+        L = ∫ √(r² + r'²) dθ
+
+    Args:
+        num_samples: количество точек сетки
+
+    Returns:
+        dict: max/min/mean кривизны, число точек перегиба, площадь и периметр
+    """
+    theta_samples = np.linspace(0, 2 * np.pi, num_samples, endpoint=False)
+    r = r_function(theta_samples)
+    dr = dr_function(theta_samples)
+    signed = compute_signed_curvature(theta_samples)
+    curvatures = np.abs(signed)
+
+    # Перегиб — смена знака кривизны между соседними точками (сетка замкнута)
+    signs = np.sign(signed)
+    inflection_count = int(np.count_nonzero(signs != np.roll(signs, -1)))
+
+    return {
+        'max_curvature': float(np.max(curvatures)),
+        'min_curvature': float(np.min(curvatures)),
+        'mean_curvature': float(np.mean(curvatures)),
+        'inflection_count': inflection_count,
+        'area': float(np.pi * np.mean(r**2)),
+        'perimeter': float(2 * np.pi * np.mean(np.sqrt(r**2 + dr**2)))
+    }
+
+
+@instrumented
 def get_evolute_points(theta_points):
     """
     Вычисляет точки эволюты для выбранных точек кривой.
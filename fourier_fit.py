@@ -0,0 +1,291 @@
+"""Подгонка гармонических коэффициентов r(θ) по измеренным точкам контура"""
+
+import numpy as np
+from instrumentation import instrumented
+from config import (FIT_NUM_HARMONICS, FIT_METHOD, FIT_REGULARIZATION,
+                    FIT_SMOOTHNESS_ORDER, FIT_OVERSAMPLING, FIT_MIN_GRID_SIZE)
+
+# Точек в блоке при накоплении тригонометрических моментов (метод 'lstsq')
+MOMENT_CHUNK_SIZE = 4096
+
+
+def points_to_polar(x, y, center=None):
+    """
+    Переводит измеренные точки контура в полярные координаты.
+
+    Args:
+        x, y: координаты точек (в любом порядке)
+        center: полюс (cx, cy) (по умолчанию — начало координат)
+
+    Returns:
+        tuple: (θ в [0, 2π), r)
+    """
+    cx, cy = (0.0, 0.0) if center is None else center
+    dx = np.asarray(x, dtype=float).ravel() - cx
+    dy = np.asarray(y, dtype=float).ravel() - cy
+    return np.mod(np.arctan2(dy, dx), 2 * np.pi), np.hypot(dx, dy)
+
+
+def _penalty(num_harmonics, regularization, smoothness_order):
+    """Веса штрафа λ·k^(2p) для k = 0..K."""
+    return regularization * np.arange(num_harmonics + 1, dtype=float) ** (2 * smoothness_order)
+
+
+def _resample_uniform(theta, r, grid_size):
+    """
+    Значения r в центрах ячеек равномерной сетки θ_j = (j + ½)·2π/grid_size.
+
+    Точки усредняются по ячейкам сетки (средние θ и r ячейки), затем
+    средние периодически интерполируются в центры ячеек: средняя θ
+    плотно заполненной ячейки почти совпадает с центром, поэтому
+    интерполяция почти не сглаживает; пустые ячейки заполняет та же
+    интерполяция. Всё за O(N).
+    """
+    cell = np.minimum((theta * (grid_size / (2 * np.pi))).astype(np.intp), grid_size - 1)
+    counts = np.bincount(cell, minlength=grid_size)
+    theta_sum = np.bincount(cell, weights=theta, minlength=grid_size)
+    r_sum = np.bincount(cell, weights=r, minlength=grid_size)
+
+    filled = counts > 0
+    centers = (np.arange(grid_size) + 0.5) * (2 * np.pi / grid_size)
+    return np.interp(centers, theta_sum[filled] / counts[filled],
+                     r_sum[filled] / counts[filled], period=2 * np.pi)
+
+
+def _fit_fft(theta, r, num_harmonics, penalty, grid_size):
+    """
+    Коэффициенты по БПФ значений в центрах ячеек равномерной сетки.
+
+    Сдвиг сетки на полъячейки компенсируется множителем e^(−ikΔ/2).
+    Среднее по ячейке ширины Δ ослабляет гармонику k в
+    sinc(kΔ/2) = sin(kΔ/2)/(kΔ/2) раз (для точек, равномерно
+    распределённых внутри ячейки), поэтому спектр делится на этот
+    множитель.
+    """
+    spectrum = np.fft.rfft(_resample_uniform(theta, r, grid_size)) / grid_size
+    spectrum = spectrum[:num_harmonics + 1]
+
+    half_step = np.arange(num_harmonics + 1) * (np.pi / grid_size)
+    spectrum = spectrum * np.exp(-1j * half_step) / np.sinc(half_step / np.pi)
+
+    # На равномерной сетке матрица Грама диагональна: 1 для k = 0, ½ для k > 0,
+    # поэтому штраф λ·k^(2p) сводится к делению на 1 + λ·k^(2p)/gram
+    gram = np.full(num_harmonics + 1, 0.5)
+    gram[0] = 1.0
+    shrink = 1.0 / (1.0 + penalty / gram)
+
+    a = 2 * spectrum.real * shrink
+    b = -2 * spectrum.imag * shrink
+    a[0] *= 0.5
+    b[0] = 0.0
+    return np.vstack([a, b])
+
+
+def _trig_powers(theta, num_harmonics):
+    """
+    Степени z^k = e^(ikθ), k = 0..K, для блока точек — массив (K+1, N).
+
+    Строятся удвоением: z^(n+j) = z^n·z^j, без вычисления K экспонент.
+    """
+    powers = np.empty((num_harmonics + 1, len(theta)), dtype=complex)
+    powers[0] = 1.0
+    if num_harmonics:
+        powers[1] = np.exp(1j * theta)
+    filled = 2
+    while filled <= num_harmonics:
+        count = min(filled - 1, num_harmonics + 1 - filled)
+        np.multiply(powers[1:count + 1], powers[filled - 1],
+                    out=powers[filled:filled + count])
+        filled += count
+    return powers
+
+
+def _trig_moments(theta, r, num_harmonics):
+    """
+    Суммы Σ e^(imθ) для m = 0..2K и Σ r·e^(ikθ) для k = 0..K.
+
+    Для блока точек строятся степени z^k (_trig_powers), после чего все
+    суммы — одно умножение матриц: столбцы 1, r и z^K дают моменты 0..K,
+    правую часть и моменты K..2K. O(N·K) операций и O(блок·K) памяти.
+    """
+    moments = np.zeros(2 * num_harmonics + 1, dtype=complex)
+    rhs = np.zeros(num_harmonics + 1, dtype=complex)
+
+    for start in range(0, len(theta), MOMENT_CHUNK_SIZE):
+        block = slice(start, start + MOMENT_CHUNK_SIZE)
+        powers = _trig_powers(theta[block], num_harmonics)
+
+        weights = np.column_stack([np.ones(powers.shape[1]), r[block],
+                                   powers[num_harmonics]])
+        sums = powers @ weights
+
+        moments[:num_harmonics + 1] += sums[:, 0]
+        moments[num_harmonics + 1:] += sums[1:, 2]
+        rhs += sums[:, 1]
+
+    return moments, rhs
+
+
+def _fit_lstsq(theta, r, num_harmonics, penalty):
+    """
+    Точные наименьшие квадраты с тихоновским штрафом.
+
+    Матрица Грама базиса cos(kθ), sin(kθ) выражается через моменты
+    M_m = Σ e^(imθ):
+        Σ cos jθ·cos kθ = ½·Re(M_(j−k) + M_(j+k))
+        Σ sin jθ·sin kθ = ½·Re(M_(j−k) − M_(j+k))
+        Σ cos jθ·sin kθ = ½·Im(M_(k+j) + M_(k−j)),   M_(−m) = conj(M_m)
+    """
+    n = len(theta)
+    moments, rhs = _trig_moments(theta, r, num_harmonics)
+
+    k = np.arange(num_harmonics + 1)
+    diff = k[:, np.newaxis] - k
+    total = k[:, np.newaxis] + k
+    m_diff = np.where(diff >= 0, moments[np.abs(diff)], np.conj(moments[np.abs(diff)]))
+    m_total = moments[total]
+
+    cc = 0.5 * (m_diff.real + m_total.real)
+    ss = 0.5 * (m_diff.real - m_total.real)
+    cs = 0.5 * (m_total.imag - m_diff.imag)  # [j, k]: Σ cos jθ·sin kθ
+
+    # Неизвестные a_0..a_K, b_1..b_K (sin 0θ ≡ 0); целевая функция нормирована на N
+    gram = np.block([[cc, cs[:, 1:]], [cs[:, 1:].T, ss[1:, 1:]]]) / n
+    gram[np.diag_indices_from(gram)] += np.concatenate([penalty, penalty[1:]])
+    right = np.concatenate([rhs.real, rhs.imag[1:]]) / n
+
+    solution = np.linalg.solve(gram, right)
+    return np.vstack([solution[:num_harmonics + 1],
+                      np.concatenate([[0.0], solution[num_harmonics + 1:]])])
+
+
+@instrumented
+def fit_fourier(theta, r, num_harmonics=None, method=None, regularization=None,
+                smoothness_order=None, grid_size=None):
+    """
+    Подгоняет усечённый ряд r(θ) = Σ a_k·cos(kθ) + b_k·sin(kθ), k = 0..K.
+
+    Минимизируется (1/N)·Σ (r_i − r(θ_i))² + λ·Σ k^(2p)·(a_k² + b_k²);
+    штраф при p = 2 подавляет высокие гармоники, как ∫(r'')² dθ.
+    Метод 'fft' усредняет точки на равномерной сетке θ и берёт БПФ —
+    O(N + M·log M), подходит для плотных измерений; 'lstsq' — точное
+    решение по всем точкам через тригонометрические моменты, O(N·K).
+
+    Args:
+        theta, r: полярные координаты точек (points_to_polar)
+        num_harmonics: K — старшая гармоника (по умолчанию из config)
+        method: 'fft' или 'lstsq' (по умолчанию из config)
+        regularization: λ (по умолчанию из config)
+        smoothness_order: p (по умолчанию из config)
+        grid_size: узлов сетки θ для 'fft' (по умолчанию — FIT_OVERSAMPLING·(K+1),
+                   но не меньше FIT_MIN_GRID_SIZE)
+
+    Returns:
+        numpy.ndarray: коэффициенты (2, K+1) для set_curve_coefficients
+    """
+    if num_harmonics is None:
+        num_harmonics = FIT_NUM_HARMONICS
+    if method is None:
+        method = FIT_METHOD
+    if regularization is None:
+        regularization = FIT_REGULARIZATION
+    if smoothness_order is None:
+        smoothness_order = FIT_SMOOTHNESS_ORDER
+    if grid_size is None:
+        grid_size = max(FIT_MIN_GRID_SIZE, FIT_OVERSAMPLING * (num_harmonics + 1))
+
+    theta = np.mod(np.asarray(theta, dtype=float).ravel(), 2 * np.pi)
+    r = np.asarray(r, dtype=float).ravel()
+    if len(theta) < 2 * num_harmonics + 1:
+        raise ValueError(f"Для {num_harmonics} гармоник нужно не меньше "
+                         f"{2 * num_harmonics + 1} точек, получено {len(theta)}")
+
+    penalty = _penalty(num_harmonics, regularization, smoothness_order)
+
+    if method == 'fft':
+        if grid_size < 2 * num_harmonics + 1:
+            raise ValueError(f"Сетка из {grid_size} узлов не разрешает {num_harmonics} гармоник")
+        return _fit_fft(theta, r, num_harmonics, penalty, grid_size)
+    if method == 'lstsq':
+        return _fit_lstsq(theta, r, num_harmonics, penalty)
+    raise ValueError(f"Неизвестный метод подгонки: {method!r}")
+
+
+def fit_points(x, y, center=None, **fit_kwargs):
+    """
+    Коэффициенты кривой по измеренным точкам контура.
+
+    Контур должен быть звёздным относительно center; коэффициенты описывают
+    его в координатах с началом в center.
+
+    Args:
+        x, y: координаты точек
+        center: полюс (по умолчанию — начало координат)
+        **fit_kwargs: параметры fit_fourier
+
+    Returns:
+        numpy.ndarray: коэффициенты (2, K+1)
+    """
+    theta, r = points_to_polar(x, y, center)
+    return fit_fourier(theta, r, **fit_kwargs)
+
+
+def fit_residuals(theta, r, coeffs):
+    """
+    Невязки подгонки r_i − r(θ_i).
+
+    Ряд вычисляется точно в каждой θ_i: блоками по MOMENT_CHUNK_SIZE
+    точек строятся степени e^(ikθ) (_trig_powers), значение ряда —
+    Re Σ (a_k − i·b_k)·e^(ikθ), одно умножение матрицы на вектор.
+    O(N·K) операций, невязка отражает саму подгонку, а не погрешность
+    вычисления ряда.
+
+    Returns:
+        dict: 'residuals' — массив невязок, 'rms', 'max_abs'
+    """
+    a, b = np.asarray(coeffs, dtype=float)
+    num_harmonics = a.size - 1
+    theta = np.mod(np.asarray(theta, dtype=float).ravel(), 2 * np.pi)
+    weights = a - 1j * b
+
+    residuals = np.asarray(r, dtype=float).ravel().copy()
+    for start in range(0, len(theta), MOMENT_CHUNK_SIZE):
+        block = slice(start, start + MOMENT_CHUNK_SIZE)
+        residuals[block] -= (weights @ _trig_powers(theta[block], num_harmonics)).real
+
+    return {'residuals': residuals,
+            'rms': float(np.sqrt(np.mean(residuals**2))),
+            'max_abs': float(np.abs(residuals).max())}
+
+
+if __name__ == '__main__':
+    import time
+    import matplotlib.pyplot as plt
+    from curve_definition import CURVE_COEFFICIENTS, get_cartesian_coordinates, use_curve_coefficients
+    from curve_math import get_curve_statistics
+    from visualization_base import create_figure, draw_curve, setup_axes
+
+    # «Измерения»: точки эталонной кривой со случайным θ и шумом
+    rng = np.random.default_rng(0)
+    num_points = 10**6
+    x, y = get_cartesian_coordinates(rng.uniform(0, 2 * np.pi, num_points))
+    x += rng.normal(0, 0.01, num_points)
+    y += rng.normal(0, 0.01, num_points)
+
+    start = time.perf_counter()
+    coeffs = fit_points(x, y, num_harmonics=200, regularization=1e-9)
+    print(f"{num_points} точек, 200 гармоник: {time.perf_counter() - start:.3f} с")
+
+    theta, r = points_to_polar(x, y)
+    report = fit_residuals(theta, r, coeffs)
+    print(f"Невязка: RMS {report['rms']:.4f}, максимум {report['max_abs']:.4f}")
+    print(f"Отклонение от эталонных коэффициентов: "
+          f"{np.abs(coeffs[:, :12] - CURVE_COEFFICIENTS).max():.4f}")
+
+    with use_curve_coefficients(coeffs):
+        print(f"Площадь подогнанной кривой: {get_curve_statistics()['area']:.4f}")
+        fig, ax = create_figure()
+        ax.scatter(x[:5000], y[:5000], s=1, color='gray', alpha=0.5)
+        draw_curve(ax, show_fill=False)
+    setup_axes(ax, title='Подгонка ряда Фурье по измерениям')
+    plt.show()
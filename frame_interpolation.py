@@ -0,0 +1,269 @@
+"""Интерполяционные таблицы репера: приближённое вычисление x, y, T, N, κ за O(1)"""
+
+from collections import OrderedDict
+
+import numpy as np
+from curve_definition import get_curve_coefficients
+from curve_derivatives import cartesian_derivatives
+from instrumentation import instrumented
+from config import INTERP_TOLERANCE, INTERP_MIN_SIZE, INTERP_MAX_SIZE, INTERP_CACHE_SIZE
+
+# Интерполируемые величины; остальные столбцы репера выводятся из них
+INTERP_QUANTITIES = ('x', 'y', 'tx', 'ty', 'signed_curvature')
+
+# Построенные интерполяторы: ключ — коэффициенты и допуск
+_cache = OrderedDict()
+
+
+def _exact_values(theta):
+    """
+    Точные значения INTERP_QUANTITIES и их производные по θ.
+
+    T' = κ·|P'|·N, N = (−ty, tx);
+    κ' = (x'·y''' − y'·x''') / s³ − 3·(x'·y'' − y'·x'')·(x'·x'' + y'·y'') / s⁵
+
+    Returns:
+        tuple: (значения, производные) — массивы (величины × θ)
+    """
+    x_derivs, y_derivs = cartesian_derivatives(theta, 3)
+    x, dx, d2x, d3x = x_derivs
+    y, dy, d2y, d3y = y_derivs
+
+    speed_sq = dx**2 + dy**2
+    speed = np.sqrt(speed_sq)
+    tx, ty = dx / speed, dy / speed
+    cross = dx * d2y - dy * d2x
+    curvature = cross / speed_sq**1.5
+    curvature_derivative = ((dx * d3y - dy * d3x) / speed_sq**1.5 -
+                            3 * cross * (dx * d2x + dy * d2y) / speed_sq**2.5)
+
+    turn = curvature * speed
+    values = np.vstack([x, y, tx, ty, curvature])
+    slopes = np.vstack([dx, dy, -turn * ty, turn * tx, curvature_derivative])
+    return values, slopes
+
+
+def _hermite(values, slopes, size, theta):
+    """
+    Кубическая интерполяция Эрмита на периодической сетке из size ячеек.
+
+    Args:
+        values, slopes: массивы (величины × (size + 1)); slopes умножены на шаг
+        theta: точки вычисления (одномерный массив)
+
+    Returns:
+        numpy.ndarray: массив (величины × θ)
+    """
+    u = np.mod(theta, 2 * np.pi) * (size / (2 * np.pi))
+    cell = np.minimum(u.astype(np.intp), size - 1)
+    t = u - cell
+
+    t2 = t * t
+    s = 1 - t
+    h00 = (1 + 2 * t) * s * s
+    h10 = t * s * s
+    h01 = t2 * (3 - 2 * t)
+    h11 = -t2 * s
+
+    return (values[:, cell] * h00 + slopes[:, cell] * h10 +
+            values[:, cell + 1] * h01 + slopes[:, cell + 1] * h11)
+
+
+class FrameInterpolator:
+    """
+    Таблицы x, y, T, κ на равномерной периодической сетке θ.
+
+    В узлах хранятся значения и аналитические производные по θ, между
+    узлами — кубический сплайн Эрмита: вычисление в любой точке —
+    одна выборка по индексу ячейки и несколько умножений, без ветвлений
+    и без вычисления рядов. Нормаль, |κ|, R и центр кривизны выводятся
+    из интерполированных T и κ. Размер таблицы подбирается так, чтобы
+    погрешность в серединах ячеек (где ошибка Эрмита наибольшая) не
+    превышала tolerance; достигнутая погрешность хранится в self.error.
+
+    Использование:
+        frames = FrameInterpolator(tolerance=1e-6)
+        table = frames.evaluate(theta)   # столбцы как у get_frame_table
+    """
+
+    def __init__(self, tolerance=None, size=None, max_size=None):
+        """
+        Построение таблиц.
+
+        Args:
+            tolerance: допустимая погрешность (по умолчанию из config)
+            size: размер таблицы (по умолчанию — подбирается по tolerance)
+            max_size: наибольший размер при подборе (по умолчанию из config)
+        """
+        if tolerance is None:
+            tolerance = INTERP_TOLERANCE
+        if max_size is None:
+            max_size = INTERP_MAX_SIZE
+
+        self.tolerance = tolerance
+        if size is not None:
+            self._build(size)
+            return
+
+        size = INTERP_MIN_SIZE
+        while True:
+            self._build(size)
+            worst = max(self.error.values())
+            if worst <= tolerance or size >= max_size:
+                break
+            # Погрешность Эрмита убывает как h⁴
+            factor = max(1.25, 1.2 * (worst / tolerance) ** 0.25)
+            size = min(max_size, int(np.ceil(size * factor)))
+
+    def _build(self, size):
+        """Заполняет таблицы размера size и оценивает погрешность."""
+        grid = np.linspace(0, 2 * np.pi, size + 1)
+        values, slopes = _exact_values(grid)
+
+        self.size = size
+        self._values = values
+        self._slopes = slopes * (2 * np.pi / size)
+
+        midpoints = grid[:-1] + np.pi / size
+        exact, _ = _exact_values(midpoints)
+        approx = _hermite(self._values, self._slopes, size, midpoints)
+        self.error = dict(zip(INTERP_QUANTITIES,
+                              np.abs(approx - exact).max(axis=1).tolist()))
+
+    @property
+    def max_error(self):
+        """Наибольшая погрешность по всем величинам."""
+        return max(self.error.values())
+
+    @instrumented
+    def evaluate(self, theta):
+        """
+        Приближённые данные репера в точках θ.
+
+        Args:
+            theta: угол (скаляр или массив)
+
+        Returns:
+            dict: {имя столбца: numpy.ndarray} — столбцы get_frame_table,
+                  кроме speed; погрешность — в self.error
+        """
+        theta = np.asarray(theta, dtype=float)
+        x, y, tx, ty, signed_curvature = _hermite(self._values, self._slopes,
+                                                  self.size, theta.ravel())
+
+        # Нормируем T, чтобы репер оставался ортонормированным
+        length = np.hypot(tx, ty)
+        tx, ty = tx / length, ty / length
+        curvature = np.abs(signed_curvature)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            radius = np.where(curvature > 1e-10, 1.0 / curvature, np.inf)
+            inverse = 1.0 / signed_curvature
+
+        columns = {
+            'theta': theta.ravel(),
+            'x': x,
+            'y': y,
+            'tx': tx,
+            'ty': ty,
+            'nx': -ty,
+            'ny': tx,
+            'curvature': curvature,
+            'signed_curvature': signed_curvature,
+            'radius': radius,
+            'center_x': x - ty * inverse,
+            'center_y': y + tx * inverse
+        }
+        return {name: column.reshape(theta.shape) for name, column in columns.items()}
+
+    def point_data(self, theta):
+        """
+        Аналог get_point_data по таблицам.
+
+        Погрешность R = 1/|κ| и центра кривизны выводится из погрешностей
+        таблиц: при погрешности δ величины κ̃ отклонение 1/κ не больше
+        δ / (|κ̃|·(|κ̃| − δ)), поэтому у точек перегиба (|κ̃| ≤ δ) оценка
+        бесконечна.
+
+        Args:
+            theta: угол (скаляр)
+
+        Returns:
+            dict: ключи get_point_data и оценки погрешности:
+                  'interpolation_error' — max погрешность x, y, T, κ,
+                  'radius_error' — R, 'center_error' — центра кривизны
+        """
+        row = {name: float(value) for name, value in self.evaluate(theta).items()}
+
+        error = self.error
+        point_error = np.hypot(error['x'], error['y'])
+        tangent_error = np.hypot(error['tx'], error['ty'])
+        kappa, kappa_error = row['curvature'], error['signed_curvature']
+        if kappa > kappa_error:
+            radius_error = kappa_error / (kappa * (kappa - kappa_error))
+            center_error = point_error + tangent_error / (kappa - kappa_error) + radius_error
+        else:
+            radius_error = center_error = np.inf
+
+        return {
+            'theta': theta,
+            'point': (row['x'], row['y']),
+            'tangent': (row['tx'], row['ty']),
+            'normal': (row['nx'], row['ny']),
+            'curvature': row['curvature'],
+            'radius_of_curvature': row['radius'],
+            'curvature_center': (row['center_x'], row['center_y']),
+            'interpolation_error': self.max_error,
+            'radius_error': radius_error,
+            'center_error': center_error
+        }
+
+
+def get_frame_interpolator(tolerance=None):
+    """
+    Интерполятор для активных коэффициентов кривой (из кэша, если уже построен).
+
+    Args:
+        tolerance: допустимая погрешность (по умолчанию из config)
+
+    Returns:
+        FrameInterpolator: интерполятор
+    """
+    if tolerance is None:
+        tolerance = INTERP_TOLERANCE
+
+    key = (get_curve_coefficients().tobytes(), float(tolerance))
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+
+    interpolator = _cache[key] = FrameInterpolator(tolerance)
+    while len(_cache) > INTERP_CACHE_SIZE:
+        _cache.popitem(last=False)
+
+    return interpolator
+
+
+if __name__ == '__main__':
+    import time
+    from curve_math import get_frame_table
+
+    for tolerance in (1e-4, 1e-6, 1e-9):
+        start = time.perf_counter()
+        frames = FrameInterpolator(tolerance)
+        build = time.perf_counter() - start
+        print(f"Допуск {tolerance:g}: таблица {frames.size} узлов "
+              f"({1e3 * build:.1f} мс), погрешность {frames.max_error:.2e}")
+
+    theta = np.random.default_rng(0).uniform(0, 2 * np.pi, 10**6)
+    start = time.perf_counter()
+    approx = frames.evaluate(theta)
+    interpolated = time.perf_counter() - start
+    start = time.perf_counter()
+    exact = get_frame_table(theta)
+    direct = time.perf_counter() - start
+
+    print(f"10^6 точек: таблица {interpolated:.3f} с, точно {direct:.3f} с")
+    for name in ('x', 'y', 'tx', 'ty', 'signed_curvature'):
+        print(f"  {name:>16}: оценка {frames.error[name]:.2e}, "
+              f"факт {np.abs(approx[name] - exact[name]).max():.2e}")
@@ -0,0 +1,181 @@
+"""Интерактивная подсказка: данные кривой в точке под курсором."""
+
+import numpy as np
+
+from frame_interpolation import get_frame_interpolator
+from instrumentation import instrumented
+from warm_cache import cached_frame_table, cached_spatial_index
+from config import (HOVER_NUM_SAMPLES, HOVER_MAX_DISTANCE_PX,
+                    POINT_COLOR, POINT_EDGE_COLOR)
+
+
+class HoverInspector:
+    """
+    Показывает θ, κ, R и центр кривизны для точки кривой, ближайшей к курсору.
+
+    Все данные вычисляются один раз при создании: плотная выборка точек
+    кривой записывается в столбцовую таблицу (get_frame_table), по её
+    координатам строится пространственный индекс; обе структуры берутся
+    из дискового кэша warm_cache, если он уже заполнен. Обработчик движения
+    мыши ищет ближайшую точку выборки в индексе, уточняет θ одним шагом
+    вдоль касательной и читает данные репера из интерполяционных таблиц
+    (FrameInterpolator.point_data) — функции curve_math при этом не
+    вызываются, а значения не привязаны к узлам выборки. Подсказка
+    перерисовывается, только когда меняется ближайшая точка выборки.
+    Погрешность таблиц и выведенные из неё оценки для R и центра
+    кривизны показываются в подсказке.
+
+    Использование:
+        fig, ax = plt.subplots()
+        draw_curve(ax)
+        inspector = HoverInspector(ax)
+        plt.show()
+    """
+
+    def __init__(self, ax, num_samples=None, max_distance_px=None,
+                 interpolator=None):
+        """
+        Инициализация подсказки.
+
+        Args:
+            ax: объект осей matplotlib
+            num_samples: количество точек выборки (по умолчанию из config)
+            max_distance_px: максимальное расстояние от курсора до кривой
+                             в пикселях, при котором показывается подсказка
+            interpolator: FrameInterpolator (по умолчанию —
+                          get_frame_interpolator для активной кривой)
+        """
+        if num_samples is None:
+            num_samples = HOVER_NUM_SAMPLES
+        if max_distance_px is None:
+            max_distance_px = HOVER_MAX_DISTANCE_PX
+        if interpolator is None:
+            interpolator = get_frame_interpolator()
+
+        self.ax = ax
+        self.fig = ax.figure
+        self.max_distance_px = max_distance_px
+        self.interpolator = interpolator
+        self.current_index = None
+
+        self.table = cached_frame_table(num_samples)
+        self.index = cached_spatial_index(num_samples)
+
+        self._create_artists()
+        self._cid_motion = self.fig.canvas.mpl_connect('motion_notify_event',
+                                                       self._on_motion)
+
+    def _create_artists(self):
+        """Создаёт маркер и подпись (скрыты до наведения курсора)."""
+        self.marker, = self.ax.plot([], [], 'o', markersize=8,
+                                    color=POINT_COLOR,
+                                    markeredgecolor=POINT_EDGE_COLOR,
+                                    zorder=6, visible=False)
+        self.annotation = self.ax.annotate(
+            '', xy=(0, 0),
+            textcoords="offset points",
+            xytext=(15, 15),
+            fontsize=10,
+            family='monospace',
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.9),
+            zorder=7,
+            visible=False)
+
+    def disconnect(self):
+        """Отключает обработчик и удаляет артисты подсказки."""
+        self.fig.canvas.mpl_disconnect(self._cid_motion)
+        self.marker.remove()
+        self.annotation.remove()
+
+    def local_theta(self, i, x, y):
+        """
+        Уточняет θ ближайшей точки выборки i для точки (x, y).
+
+        Смещение вдоль касательной делится на скорость |P'(θ)| и
+        ограничивается половиной шага выборки.
+
+        Returns:
+            float: θ
+        """
+        table = self.table
+        half_step = np.pi / len(table['theta'])
+        shift = ((x - table['x'][i]) * table['tx'][i] +
+                 (y - table['y'][i]) * table['ty'][i]) / table['speed'][i]
+        return float(table['theta'][i] + np.clip(shift, -half_step, half_step))
+
+    def format_row(self, data):
+        """
+        Формирует текст подсказки.
+
+        Args:
+            data: данные точки (FrameInterpolator.point_data)
+
+        Returns:
+            str: многострочный текст
+        """
+        radius = data['radius_of_curvature']
+        r_str = f"{radius:.4f}" if np.isfinite(radius) else "∞"
+        center_x, center_y = data['curvature_center']
+
+        return (f"θ = {np.mod(data['theta'], 2 * np.pi):.4f}\n"
+                f"κ = {data['curvature']:.4f}\n"
+                f"R = {r_str}\n"
+                f"C = ({center_x:.3f}, {center_y:.3f})\n"
+                f"ε(x, y, T, κ) ≤ {data['interpolation_error']:.1e}\n"
+                f"ε(R) ≤ {data['radius_error']:.1e}, "
+                f"ε(C) ≤ {data['center_error']:.1e}")
+
+    def _hide(self):
+        """Скрывает подсказку, если она показана."""
+        if self.current_index is None:
+            return
+        self.current_index = None
+        self.marker.set_visible(False)
+        self.annotation.set_visible(False)
+        self.fig.canvas.draw_idle()
+
+    @instrumented
+    def _on_motion(self, event):
+        """Обработчик движения мыши — поиск ближайшей точки кривой."""
+        if event.inaxes != self.ax:
+            self._hide()
+            return
+
+        i, _ = self.index.query(event.xdata, event.ydata)
+        i = int(i)
+
+        # Порог в пикселях — не зависит от текущего масштаба
+        px, py = self.ax.transData.transform((self.table['x'][i], self.table['y'][i]))
+        if np.hypot(px - event.x, py - event.y) > self.max_distance_px:
+            self._hide()
+            return
+
+        # Пока ближайшая точка выборки та же, подсказка не перерисовывается
+        if i == self.current_index:
+            return
+
+        theta = self.local_theta(i, event.xdata, event.ydata)
+        data = self.interpolator.point_data(theta)
+        x, y = data['point']
+
+        self.current_index = i
+        self.marker.set_data([x], [y])
+        self.annotation.xy = (x, y)
+        self.annotation.set_text(self.format_row(data))
+        self.marker.set_visible(True)
+        self.annotation.set_visible(True)
+        self.fig.canvas.draw_idle()
+
+
+def enable_hover_inspector(ax, **kwargs):
+    """
+    Функция-обёртка для быстрого включения подсказки.
+
+    Args:
+        ax: объект осей matplotlib
+        **kwargs: аргументы для HoverInspector
+
+    Returns:
+        HoverInspector: экземпляр класса
+    """
+    return HoverInspector(ax, **kwargs)
@@ -0,0 +1,205 @@
+"""Инструментирование горячих функций: счётчики вызовов, время и память"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+from config import PROFILE_ENABLED, PROFILE_MEMORY
+
+# Переменная окружения CURVES2D_PROFILE включает инструментирование
+# без правки config: '1' — счётчики и время, 'memory' — ещё и память
+_env = os.environ.get('CURVES2D_PROFILE', '')
+_enabled = PROFILE_ENABLED or _env not in ('', '0')
+_track_memory = PROFILE_MEMORY or _env == 'memory'
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+# Стеки активных замеров памяти по потокам: {поток: [[базовый объём, пик], ...]}.
+# tracemalloc ведёт один пик на процесс, поэтому чтение и сброс пика
+# выполняются под _memory_lock, а пик перед сбросом передаётся открытым
+# замерам всех потоков: при параллельной работе (async_compute) оценка
+# памяти может включать выделения других потоков, но не теряется.
+_memory_stacks = {}
+_memory_lock = threading.Lock()
+
+
+def is_enabled():
+    """Включено ли инструментирование."""
+    return _enabled
+
+
+def _count_elements(args):
+    """
+    Количество обрабатываемых элементов — наибольший размер среди
+    числовых аргументов.
+
+    Пары координат (px, py) и массивы вместе со скалярными параметрами
+    (theta, max_order) считаются по самому большому массиву, а не по
+    первому аргументу. Аргументы, которые не приводятся к числовому
+    массиву (объекты осей, словари), пропускаются.
+    """
+    count = 0
+    for arg in args:
+        if isinstance(arg, np.ndarray):
+            size = arg.size
+        elif isinstance(arg, (float, int, np.number)):
+            size = 1
+        elif isinstance(arg, (list, tuple)):
+            try:
+                size = np.asarray(arg, dtype=float).size
+            except (TypeError, ValueError):
+                continue
+        else:
+            continue
+        count = max(count, int(size))
+    return count
+
+
+def _record(name, elements, seconds, allocated):
+    """Добавляет результат одного вызова в статистику (из любого потока)."""
+    with _stats_lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = {'calls': 0, 'elements': 0,
+                                    'seconds': 0.0, 'bytes': 0}
+        stats['calls'] += 1
+        stats['elements'] += elements
+        stats['seconds'] += seconds
+        stats['bytes'] += allocated
+
+
+def _propagate_peak(peak):
+    """Учитывает пик памяти в открытых замерах всех потоков (под _memory_lock)."""
+    for stack in _memory_stacks.values():
+        stack[-1][1] = max(stack[-1][1], peak)
+
+
+def _memory_enter():
+    """Открывает замер памяти текущего потока."""
+    with _memory_lock:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        current, peak = tracemalloc.get_traced_memory()
+        _propagate_peak(peak)
+        _memory_stacks.setdefault(threading.get_ident(), []).append([current, current])
+        tracemalloc.reset_peak()
+
+
+def _memory_exit():
+    """Закрывает замер памяти текущего потока и возвращает выделенный объём."""
+    with _memory_lock:
+        ident = threading.get_ident()
+        stack = _memory_stacks[ident]
+        baseline, nested_peak = stack.pop()
+        if not stack:
+            del _memory_stacks[ident]
+        peak = max(tracemalloc.get_traced_memory()[1], nested_peak)
+        _propagate_peak(peak)
+        return peak - baseline
+
+
+def instrumented(func=None, *, name=None):
+    """
+    Декоратор: считает вызовы, элементы, время и выделенную память функции.
+
+    Если инструментирование выключено, декоратор возвращает функцию
+    без изменений — во время работы никаких накладных расходов нет.
+    Поэтому включать его нужно до импорта модулей (config или
+    переменная окружения CURVES2D_PROFILE).
+
+    Args:
+        func: декорируемая функция
+        name: имя в отчёте (по умолчанию module.qualname)
+
+    Пример:
+        @instrumented
+        def compute_curvature(theta):
+            ...
+    """
+    if func is None:
+        return functools.partial(instrumented, name=name)
+    if not _enabled:
+        return func
+
+    key = name or f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        elements = _count_elements(args)
+
+        if _track_memory:
+            _memory_enter()
+
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            allocated = _memory_exit() if _track_memory else 0
+            _record(key, elements, seconds, allocated)
+
+    return wrapper
+
+
+def reset():
+    """Очищает накопленную статистику."""
+    with _stats_lock:
+        _stats.clear()
+
+
+def get_report():
+    """
+    Возвращает накопленную статистику.
+
+    Returns:
+        dict: {имя функции: {'calls', 'elements', 'seconds', 'bytes',
+                             'mean_us'}}, отсортирован по суммарному времени
+    """
+    with _stats_lock:
+        snapshot = {name: dict(stats) for name, stats in _stats.items()}
+
+    report = {}
+    for name, stats in sorted(snapshot.items(), key=lambda item: -item[1]['seconds']):
+        report[name] = dict(stats, mean_us=1e6 * stats['seconds'] / stats['calls'])
+    return report
+
+
+def format_report():
+    """
+    Формирует текстовый отчёт.
+
+    Returns:
+        str: таблица функций, отсортированная по суммарному времени
+    """
+    report = get_report()
+    if not report:
+        return "Инструментирование: нет данных"
+
+    width = max(len(name) for name in report)
+    lines = [f"{'Функция':<{width}} {'Вызовы':>8} {'Элементы':>10} "
+             f"{'Время, мс':>10} {'Среднее, мкс':>13} {'Память, КБ':>11}",
+             "-" * (width + 57)]
+
+    for name, stats in report.items():
+        lines.append(f"{name:<{width}} {stats['calls']:>8} {stats['elements']:>10} "
+                     f"{1e3 * stats['seconds']:>10.2f} {stats['mean_us']:>13.1f} "
+                     f"{stats['bytes'] / 1024:>11.1f}")
+
+    return "\n".join(lines)
+
+
+def export_report(path):
+    """
+    Сохраняет отчёт в JSON.
+
+    Args:
+        path: путь к файлу
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'track_memory': _track_memory, 'functions': get_report()},
+                  f, ensure_ascii=False, indent=2)
@@ -1,6 +1,9 @@
 """Интерактивное управление графиком: zoom, pan, сброс."""
 
 import matplotlib.pyplot as plt
+from instrumentation import instrumented
+from support_function import bounding_box
+from config import AXES_PADDING
 
 
 class InteractiveZoom:
@@ -20,7 +23,7 @@ class InteractiveZoom:
         plt.show()
     """
 
-    def __init__(self, ax, scale_factor=1.2, print_help=True):
+    def __init__(self, ax, scale_factor=1.2, print_help=True, home_limits=None):
         """
         Инициализация интерактивного управления.
 
@@ -28,15 +31,25 @@ class InteractiveZoom:
             ax: объект осей matplotlib
             scale_factor: коэффициент масштабирования (по умолчанию 1.2)
             print_help: выводить ли справку в консоль
+            home_limits: границы для сброса (xmin, xmax, ymin, ymax); по
+                         умолчанию — текущие границы осей, расширенные до
+                         точного ограничивающего прямоугольника кривой
+                         с полями AXES_PADDING (кривая видна целиком,
+                         остальные слои не обрезаются)
         """
         self.ax = ax
         self.fig = ax.figure
         self.scale_factor = scale_factor
         self.press = None
 
-        # Сохраняем начальные границы для сброса
-        self.original_xlim = ax.get_xlim()
-        self.original_ylim = ax.get_ylim()
+        # Границы для сброса
+        if home_limits is None:
+            (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+            bxmin, bxmax, bymin, bymax = bounding_box(AXES_PADDING)
+            home_limits = (min(x0, bxmin), max(x1, bxmax), min(y0, bymin), max(y1, bymax))
+        xmin, xmax, ymin, ymax = home_limits
+        self.original_xlim = (xmin, xmax)
+        self.original_ylim = (ymin, ymax)
 
         # Подключаем обработчики событий
         self._connect_events()
@@ -79,6 +92,7 @@ class InteractiveZoom:
         """
         print(help_text)
 
+    @instrumented
     def _on_scroll(self, event):
         """Обработчик прокрутки колёсика — zoom."""
         if event.inaxes != self.ax:
@@ -115,6 +129,7 @@ class InteractiveZoom:
         self.ax.set_ylim(new_ylim)
         self.fig.canvas.draw_idle()
 
+    @instrumented
     def _on_press(self, event):
         """Обработчик нажатия кнопки мыши — начало pan."""
         if event.inaxes != self.ax:
@@ -129,10 +144,12 @@ class InteractiveZoom:
                 'ylim': self.ax.get_ylim()
             }
 
+    @instrumented
     def _on_release(self, event):
         """Обработчик отпускания кнопки мыши — конец pan."""
         self.press = None
 
+    @instrumented
     def _on_motion(self, event):
         """Обработчик движения мыши — pan."""
         if self.press is None:
@@ -152,6 +169,7 @@ class InteractiveZoom:
         self.ax.set_ylim(ylim[0] - dy, ylim[1] - dy)
         self.fig.canvas.draw_idle()
 
+    @instrumented
     def _on_key(self, event):
         """Обработчик нажатия клавиш."""
         if event.key == 'r':
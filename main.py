@@ -1,51 +1,230 @@
+import sys
+
+import numpy as np
 import matplotlib.pyplot as plt
 
 from point_selector import select_random_points
-from curve_math import get_multiple_points_data, verify_orthogonality
+from curve_math import get_multiple_points_data, get_frame_table, verify_orthogonality
 
 from visualization_base import create_figure, draw_curve, setup_axes
 from visualization_points import add_points_to_plot, add_points_legend
 from visualization_tangents import add_tangents_to_plot, add_tangents_legend
 from visualization_normals import add_normals_to_plot, add_normals_legend
 from interactive_zoom import InteractiveZoom
+from hover_inspector import HoverInspector
 from visualization_evolute import (add_evolute_to_plot, add_evolute_legend)
 from visualization_curvature import add_curvature_circles_to_plot, add_curvature_legend
+import instrumentation
+from validation import check_derivatives, format_validation_report
+from curve_derivatives import cartesian_derivatives
+from config import (PROFILE_REPORT_PATH, REPORT_FULL_TABLE_MAX_ROWS, REPORT_TOP_K,
+                    REPORT_QUANTILES, REPORT_INFLECTION_THRESHOLD)
+
+
+def summarize_points(table, quantiles=None, inflection_threshold=None):
+    """
+    Сводная статистика по столбцовой таблице точек (get_frame_table).
+
+    Все величины вычисляются векторно, без цикла по точкам:
+    квантили κ и R, экстремумы с их θ, число точек около перегиба
+    (|κ| < порога) и границы ошибок ортогональности и нормировки |T|.
+    Квантили R берутся только по конечным значениям (при κ ≤ 1e-10
+    таблица даёт R = ∞), число точек с R = ∞ выводится отдельно.
+    Нормаль таблицы построена поворотом её же касательной, поэтому
+    ортогональность проверяется с касательной P'/|P'|, вычисленной
+    независимо (cartesian_derivatives).
+
+    Args:
+        table: таблица get_frame_table
+        quantiles: уровни квантилей (по умолчанию из config)
+        inflection_threshold: порог |κ| для точек около перегиба
+                              (по умолчанию из config)
+
+    Returns:
+        dict: статистика для format_points_summary
+    """
+    if quantiles is None:
+        quantiles = REPORT_QUANTILES
+    if inflection_threshold is None:
+        inflection_threshold = REPORT_INFLECTION_THRESHOLD
+
+    theta = table['theta']
+    curvature = table['curvature']
+    radius = table['radius']
+    (_, dx), (_, dy) = cartesian_derivatives(theta, 1)
+    speed = np.hypot(dx, dy)
+    dot = (dx * table['nx'] + dy * table['ny']) / speed
+    norm_error = np.abs(np.hypot(table['tx'], table['ty']) - 1)
+
+    levels = np.asarray(quantiles, dtype=float)
+    finite = np.isfinite(radius)
+    curvature_q = np.quantile(curvature, levels)
+    radius_q = (np.quantile(radius[finite], levels) if finite.any()
+                else np.full(len(levels), np.inf))
+    max_index, min_index = np.argmax(curvature), np.argmin(curvature)
+
+    return {
+        'count': len(theta),
+        'quantiles': levels,
+        'curvature_quantiles': curvature_q,
+        'radius_quantiles': radius_q,
+        'infinite_radius': int(np.count_nonzero(~finite)),
+        'max_curvature': (theta[max_index], curvature[max_index], radius[max_index]),
+        'min_curvature': (theta[min_index], curvature[min_index], radius[min_index]),
+        'mean_curvature': curvature.mean(),
+        'inflection_threshold': inflection_threshold,
+        'near_inflection': int(np.count_nonzero(curvature < inflection_threshold)),
+        'orthogonality_max': np.abs(dot).max(initial=0.0),
+        'orthogonality_rms': np.sqrt(np.mean(dot**2)) if len(dot) else 0.0,
+        'normalization_max': norm_error.max(initial=0.0)
+    }
+
+
+def format_points_summary(summary):
+    """Форматирует результат summarize_points в текст."""
+    lines = [f"\nСводка по {summary['count']} точкам:"]
+
+    header = ' '.join(f"{f'q{100 * q:g}':>10}" for q in summary['quantiles'])
+    lines.append(f"  {'':<4} {header}")
+    for name, values in (('κ', summary['curvature_quantiles']),
+                         ('R', summary['radius_quantiles'])):
+        lines.append(f"  {name:<4} " + ' '.join(f"{v:>10.4g}" for v in values))
+
+    for label, key in (('max κ', 'max_curvature'), ('min κ', 'min_curvature')):
+        theta, k, r = summary[key]
+        lines.append(f"  {label}: {k:.6g} при θ = {theta:.6f} (R = {r:.6g})")
+    lines.append(f"  Среднее κ: {summary['mean_curvature']:.6g}")
+    lines.append(f"  Около перегиба (κ < {summary['inflection_threshold']:g}): "
+                 f"{summary['near_inflection']}")
+    if summary['infinite_radius']:
+        lines.append(f"  R = ∞ (не входят в квантили R): {summary['infinite_radius']}")
+    lines.append(f"  Ортогональность P'/|P'| · N: max {summary['orthogonality_max']:.2e}, "
+                 f"СКО {summary['orthogonality_rms']:.2e}")
+    lines.append(f"  Нормировка ||T| − 1|: max {summary['normalization_max']:.2e}")
+
+    return '\n'.join(lines)
+
 
-def print_points_table(theta_points, points_data):
-    """Выводит таблицу с данными точек."""
-    print("\n" + "=" * 110)
-    print(f"{'Точка':<6} {'θ (рад)':<10} {'x':<10} {'y':<10} "
-          f"{'Касат.':<18} {'Норм.':<18} {'κ':<10} {'R':<10}")
-    print("=" * 110)
+def format_points_table(table, rows=None):
+    """
+    Форматирует таблицу точек (get_frame_table) в текст.
 
-    for i, (theta, data) in enumerate(zip(theta_points, points_data)):
-        px, py = data['point']
-        tx, ty = data['tangent']
-        nx, ny = data['normal']
-        k = data['curvature']
-        r = data['radius_of_curvature']
+    Args:
+        table: таблица get_frame_table
+        rows: индексы или срез строк (None — все)
 
+    Returns:
+        str: таблица
+    """
+    index = np.arange(len(table['theta']))
+    if rows is not None:
+        index = index[rows]
+
+    rule = "=" * 110
+    lines = [rule,
+             f"{'Точка':<6} {'θ (рад)':<10} {'x':<10} {'y':<10} "
+             f"{'Касат.':<18} {'Норм.':<18} {'κ':<10} {'R':<10}",
+             rule]
+
+    columns = zip(index, *(table[name][index].tolist() for name in
+                           ('theta', 'x', 'y', 'tx', 'ty', 'nx', 'ny', 'curvature', 'radius')))
+    for i, theta, px, py, tx, ty, nx, ny, k, r in columns:
         r_str = f"{r:.4f}" if r < 100 else "∞"
+        label = f"P{i + 1}"
+        lines.append(f"{label:<6} {theta:<10.4f} {px:<10.4f} {py:<10.4f} "
+                     f"({tx:>6.3f},{ty:>6.3f})  ({nx:>6.3f},{ny:>6.3f})  "
+                     f"{k:<10.4f} {r_str:<10}")
+
+    lines.append(rule)
+    return '\n'.join(lines)
+
+
+def print_points_table(table, rows=None, top_k=None, max_rows=None, stream=None):
+    """
+    Выводит отчёт по точкам одной буферизованной записью.
+
+    Небольшие наборы (не больше max_rows точек) выводятся полной
+    таблицей. Для больших выводится сводка summarize_points и строки
+    только для запрошенного среза rows или top_k точек с наибольшей κ.
+
+    Args:
+        table: таблица get_frame_table
+        rows: индексы или срез строк для полной таблицы
+        top_k: сколько строк с наибольшей κ вывести (по умолчанию из config)
+        max_rows: наибольший размер набора для полной таблицы
+                  (по умолчанию из config)
+        stream: файловый объект (по умолчанию sys.stdout)
+    """
+    if top_k is None:
+        top_k = REPORT_TOP_K
+    if max_rows is None:
+        max_rows = REPORT_FULL_TABLE_MAX_ROWS
+    if stream is None:
+        stream = sys.stdout
+
+    count = len(table['theta'])
+    parts = []
+    if rows is None and count <= max_rows:
+        parts.append(format_points_table(table))
+    else:
+        parts.append(format_points_summary(summarize_points(table)))
+        if rows is None and top_k:
+            top_k = min(top_k, count)
+            top = np.argpartition(-table['curvature'], top_k - 1)[:top_k]
+            rows = top[np.argsort(-table['curvature'][top])]
+            parts.append(f"\nТочки с наибольшей кривизной ({top_k}):")
+        if rows is not None:
+            parts.append(format_points_table(table, rows))
 
-        print(f"P{i + 1:<4} {theta:<10.4f} {px:<10.4f} {py:<10.4f} "
-              f"({tx:>6.3f},{ty:>6.3f})  ({nx:>6.3f},{ny:>6.3f})  "
-              f"{k:<10.4f} {r_str:<10}")
+    stream.write('\n' + '\n'.join(parts) + '\n')
+    stream.flush()
 
-    print("=" * 110)
 
+def verify_all_orthogonality(theta_points, max_rows=None, stream=None):
+    """
+    Проверяет ортогональность для всех точек.
 
-def verify_all_orthogonality(theta_points):
-    """Проверяет ортогональность для всех точек."""
-    print("\nПроверка ортогональности (T · N должно быть ≈ 0):")
-    for i, theta in enumerate(theta_points):
-        dot_product = verify_orthogonality(theta)
-        print(f"  P{i + 1}: T · N = {dot_product:.2e}")
+    Для небольших наборов выводит T · N по каждой точке, для больших —
+    только наибольшее значение и точку, где оно достигается.
 
+    Args:
+        theta_points: массив углов θ
+        max_rows: наибольший размер набора для вывода по точкам
+                  (по умолчанию из config)
+        stream: файловый объект (по умолчанию sys.stdout)
+    """
+    if max_rows is None:
+        max_rows = REPORT_FULL_TABLE_MAX_ROWS
+    if stream is None:
+        stream = sys.stdout
 
-def visualize_full_interactive():
-    """Создаёт полную интерактивную визуализацию."""
+    dot_products = np.atleast_1d(verify_orthogonality(np.asarray(theta_points)))
+    lines = ["\nПроверка ортогональности (T · N должно быть ≈ 0):"]
+    if len(dot_products) <= max_rows:
+        lines.extend(f"  P{i + 1}: T · N = {dot_product:.2e}"
+                     for i, dot_product in enumerate(dot_products.tolist()))
+    else:
+        worst = int(np.argmax(np.abs(dot_products)))
+        lines.append(f"  {len(dot_products)} точек: max |T · N| = "
+                     f"{abs(dot_products[worst]):.2e} (P{worst + 1})")
 
-    theta_points = select_random_points()
+    stream.write('\n'.join(lines) + '\n')
+    stream.flush()
+
+
+def visualize_full_interactive(num_points=None, print_help=True):
+    """
+    Создаёт полную интерактивную визуализацию.
+
+    Args:
+        num_points: количество точек на кривой (по умолчанию из config)
+        print_help: выводить ли справку по управлению
+
+    Returns:
+        tuple: (fig, ax, theta_points, points_data, zoom, inspector)
+    """
+
+    theta_points = select_random_points(num_points)
     points_data = get_multiple_points_data(theta_points)
 
     fig, ax = create_figure()
@@ -71,9 +250,10 @@ def visualize_full_interactive():
     ax.legend(fontsize=12, loc='upper right')
 
     # Включаем интерактивность
-    zoom = InteractiveZoom(ax)
+    zoom = InteractiveZoom(ax, print_help=print_help)
+    inspector = HoverInspector(ax)
 
-    return fig, ax, theta_points, points_data, zoom
+    return fig, ax, theta_points, points_data, zoom, inspector
 
 
 
@@ -85,10 +265,20 @@ def main():
     print("  ВИЗУАЛИЗАЦИЯ КРИВОЙ С КАСАТЕЛЬНЫМИ И НОРМАЛЯМИ")
     print("=" * 50)
 
-    fig, ax, theta_points, points_data, zoom = visualize_full_interactive()
-    print_points_table(theta_points, points_data)
+    passed, report = check_derivatives()
+    if not passed:
+        print(format_validation_report(report))
+        print("ВНИМАНИЕ: аналитические производные расходятся с численными")
+
+    fig, ax, theta_points, points_data, zoom, inspector = visualize_full_interactive()
+    print_points_table(get_frame_table(np.asarray(theta_points)))
     verify_all_orthogonality(theta_points)
     plt.show()
 
+    if instrumentation.is_enabled():
+        print("\n" + instrumentation.format_report())
+        if PROFILE_REPORT_PATH:
+            instrumentation.export_report(PROFILE_REPORT_PATH)
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
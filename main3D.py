@@ -22,7 +22,6 @@ add_evolute_3d(ax, theta_points)
 
 # Легенда и настройка
 add_legend_3d(ax, show_tangents=True, show_normals=True, show_evolute=True, show_curvature_circles=True)
-plt.show()
 setup_axes_3d(ax, title='Моя 3D кривая', elevation=45, azimuth=-45)
 
 plt.show()
\ No newline at end of file
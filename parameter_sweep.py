@@ -0,0 +1,209 @@
+"""Параметрический перебор коэффициентов кривой на пуле процессов"""
+
+import hashlib
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+from batch_curves import as_coefficient_sets, batch_curve_statistics
+from curve_definition import CURVE_COEFFICIENTS, as_coefficients
+from config import SWEEP_NUM_SAMPLES, SWEEP_CHUNK_SIZE, SWEEP_CHECKPOINT_EVERY
+
+# Столбцы таблицы результатов
+SWEEP_COLUMNS = ('max_curvature', 'min_curvature', 'mean_curvature',
+                 'inflection_count', 'area', 'perimeter')
+
+
+def make_coefficient_grid(variations, base=None):
+    """
+    Строит декартову сетку вариантов коэффициентов.
+
+    Args:
+        variations: словарь {(строка, k): значения}, строка 0 — a_k (cos),
+                    строка 1 — b_k (sin)
+        base: исходные коэффициенты (по умолчанию — кривая из curve_definition)
+
+    Returns:
+        numpy.ndarray: массив формы (M, 2, K+1)
+
+    Пример:
+        grid = make_coefficient_grid({(0, 2): np.linspace(0, 0.5, 11),
+                                      (1, 3): np.linspace(0, 0.3, 7)})
+    """
+    base = as_coefficients(CURVE_COEFFICIENTS if base is None else base)
+    keys = list(variations)
+
+    max_k = max([k for _, k in keys] + [base.shape[1] - 1])
+    padded = np.zeros((2, max_k + 1))
+    padded[:, :base.shape[1]] = base
+
+    values = [np.asarray(variations[key], dtype=float) for key in keys]
+    grid = np.repeat(padded[np.newaxis], np.prod([len(v) for v in values]), axis=0)
+
+    for i, combo in enumerate(itertools.product(*values)):
+        for (row, k), value in zip(keys, combo):
+            grid[i, row, k] = value
+
+    return grid
+
+
+def _sweep_fingerprint(coefficient_sets, num_samples):
+    """Хэш входных данных перебора — защищает от возобновления чужого прогона."""
+    digest = hashlib.sha1(np.ascontiguousarray(coefficient_sets).tobytes())
+    digest.update(str(num_samples).encode())
+    return digest.hexdigest()
+
+
+def _compute_chunk(start, coefficient_chunk, num_samples):
+    """
+    Считает статистику для блока вариантов (выполняется в рабочем процессе).
+
+    Весь блок обрабатывается пакетно (batch_curve_statistics) — массивами
+    (варианты × θ), а не циклом по вариантам.
+
+    Returns:
+        tuple: (start, {столбец: массив})
+    """
+    stats = batch_curve_statistics(coefficient_chunk, num_samples)
+    return start, {name: stats[name] for name in SWEEP_COLUMNS}
+
+
+def _new_table(num_rows):
+    """Пустая столбцовая таблица результатов."""
+    table = {name: np.full(num_rows, np.nan) for name in SWEEP_COLUMNS}
+    table['done'] = np.zeros(num_rows, dtype=bool)
+    return table
+
+
+def save_checkpoint(path, table, fingerprint):
+    """
+    Атомарно сохраняет таблицу результатов в .npz.
+
+    Запись идёт во временный файл, который затем подменяет основной,
+    поэтому прерывание не оставляет повреждённую контрольную точку.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, fingerprint=np.array(fingerprint), **table)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path, fingerprint=None):
+    """
+    Загружает таблицу результатов из контрольной точки.
+
+    Args:
+        path: путь к .npz
+        fingerprint: ожидаемый хэш прогона (None — не проверять)
+
+    Returns:
+        dict или None: таблица, если файл существует
+    """
+    if not os.path.exists(path):
+        return None
+
+    with np.load(path) as data:
+        if fingerprint is not None and str(data['fingerprint']) != fingerprint:
+            raise ValueError(f"Контрольная точка {path} относится к другому перебору")
+        return {name: data[name].copy() for name in SWEEP_COLUMNS + ('done',)}
+
+
+def run_sweep(coefficient_sets, checkpoint_path=None, num_samples=None,
+              chunk_size=None, max_workers=None, checkpoint_every=None):
+    """
+    Считает статистику кривизны для набора вариантов коэффициентов.
+
+    Блоки вариантов обрабатываются пулом процессов, результаты по мере
+    готовности записываются в столбцовую таблицу. При заданном
+    checkpoint_path таблица периодически сохраняется, а повторный запуск
+    с тем же набором вариантов пропускает уже посчитанные строки.
+
+    Args:
+        coefficient_sets: массив (M, 2, K+1) или (M, 2·(K+1))
+        checkpoint_path: путь к .npz для контрольных точек (опционально)
+        num_samples: точек сетки θ на вариант (по умолчанию из config)
+        chunk_size: вариантов в одной задаче (по умолчанию из config)
+        max_workers: число процессов (None — по числу ядер, 0 — без пула)
+        checkpoint_every: сохранять каждые N задач (по умолчанию из config)
+
+    Returns:
+        dict: {столбец: numpy.ndarray длины M}, плюс булев столбец 'done'
+    """
+    if num_samples is None:
+        num_samples = SWEEP_NUM_SAMPLES
+    if chunk_size is None:
+        chunk_size = SWEEP_CHUNK_SIZE
+    if checkpoint_every is None:
+        checkpoint_every = SWEEP_CHECKPOINT_EVERY
+
+    sets = as_coefficient_sets(coefficient_sets)
+    num_rows = len(sets)
+    fingerprint = _sweep_fingerprint(sets, num_samples)
+
+    table = None
+    if checkpoint_path is not None:
+        table = load_checkpoint(checkpoint_path, fingerprint)
+    if table is None:
+        table = _new_table(num_rows)
+
+    # Незавершённые блоки (блок считается заново, если в нём есть пропуски)
+    pending = [start for start in range(0, num_rows, chunk_size)
+               if not table['done'][start:start + chunk_size].all()]
+
+    completed = 0
+
+    def store(result):
+        nonlocal completed
+        start, rows = result
+        stop = start + len(rows[SWEEP_COLUMNS[0]])
+        for name in SWEEP_COLUMNS:
+            table[name][start:stop] = rows[name]
+        table['done'][start:stop] = True
+
+        completed += 1
+        if checkpoint_path is not None and completed % checkpoint_every == 0:
+            save_checkpoint(checkpoint_path, table, fingerprint)
+
+    if max_workers == 0:
+        for start in pending:
+            store(_compute_chunk(start, sets[start:start + chunk_size], num_samples))
+    else:
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # Ограничиваем число задач в полёте, чтобы не копировать
+            # в очередь пула сразу все варианты
+            window = 2 * max_workers
+            queue = iter(pending)
+            in_flight = set()
+
+            while True:
+                for start in itertools.islice(queue, window - len(in_flight)):
+                    in_flight.add(executor.submit(
+                        _compute_chunk, start, sets[start:start + chunk_size], num_samples))
+                if not in_flight:
+                    break
+
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    store(future.result())
+
+    if checkpoint_path is not None:
+        save_checkpoint(checkpoint_path, table, fingerprint)
+
+    return table
+
+
+if __name__ == '__main__':
+    grid = make_coefficient_grid({(0, 2): np.linspace(0.0, 0.5, 21),
+                                  (1, 3): np.linspace(0.0, 0.3, 16)})
+    results = run_sweep(grid)
+
+    best = np.argmax(results['max_curvature'])
+    print(f"Вариантов: {len(grid)}")
+    print(f"Максимальная кривизна {results['max_curvature'][best]:.4f} "
+          f"при a_2 = {grid[best, 0, 2]:.3f}, b_3 = {grid[best, 1, 3]:.3f}")
+    print(f"Точек перегиба: от {results['inflection_count'].min():.0f} "
+          f"до {results['inflection_count'].max():.0f}")
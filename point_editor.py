@@ -0,0 +1,208 @@
+"""Интерактивное редактирование: перетаскивание точек вдоль кривой."""
+
+import numpy as np
+
+from curve_math import project_point_to_curve
+from instrumentation import instrumented
+from interactive_zoom import InteractiveZoom
+from config import DRAG_PICK_RADIUS_PX, DRAG_NEWTON_ITERATIONS
+
+
+class DragPointEditor(InteractiveZoom):
+    """
+    InteractiveZoom с перетаскиванием точек сцены левой кнопкой мыши.
+
+    Точка остаётся на кривой: позиция мыши проецируется на кривую
+    несколькими шагами Ньютона по θ, начиная с θ предыдущего шага.
+    Пересчитываются только касательная, нормаль, окружность и точка
+    эволюты перетаскиваемой точки (CurveScene.move_point), остальные
+    строки сцены не затрагиваются.
+
+    Перерисовка — blit, как в visualization_animation: при захвате точка
+    скрывается в общих артистах сцены и рисуется отдельной накладкой
+    (CurveScene.create_overlay), холст один раз перерисовывается целиком
+    и его фон запоминается. При движении мыши фон восстанавливается и
+    поверх рисуются только артисты перетаскиваемой точки, поэтому время
+    отклика не зависит от числа точек сцены. Если холст не поддерживает
+    blit, используется обычная перерисовка (draw_idle).
+
+    Использование:
+        fig, ax = create_figure()
+        draw_curve(ax)
+        scene = CurveScene(ax, select_random_points())
+        editor = DragPointEditor(ax, scene)
+        plt.show()
+    """
+
+    def __init__(self, ax, scene, pick_radius_px=None, newton_iterations=None,
+                 **kwargs):
+        """
+        Инициализация редактора.
+
+        Args:
+            ax: объект осей matplotlib
+            scene: CurveScene с редактируемыми точками
+            pick_radius_px: радиус захвата точки в пикселях (по умолчанию из config)
+            newton_iterations: шагов Ньютона на событие (по умолчанию из config)
+            **kwargs: аргументы для InteractiveZoom
+        """
+        if pick_radius_px is None:
+            pick_radius_px = DRAG_PICK_RADIUS_PX
+        if newton_iterations is None:
+            newton_iterations = DRAG_NEWTON_ITERATIONS
+
+        self.scene = scene
+        self.pick_radius_px = pick_radius_px
+        self.newton_iterations = newton_iterations
+        self.drag = None
+
+        super().__init__(ax, **kwargs)
+
+    def _connect_events(self):
+        """Подключает обработчики событий и запоминание фона для blit."""
+        super()._connect_events()
+        self._cid_draw = self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def disconnect(self):
+        """Отключает обработчики событий."""
+        super().disconnect()
+        self.fig.canvas.mpl_disconnect(self._cid_draw)
+
+    def _print_help(self):
+        """Выводит справку по управлению."""
+        super()._print_help()
+        print("  Левая кнопка       : перетаскивание точки вдоль кривой\n")
+
+    def pick_point(self, event):
+        """
+        Находит точку сцены под курсором.
+
+        Returns:
+            int или None: слот ближайшей точки в радиусе захвата
+        """
+        if len(self.scene) == 0:
+            return None
+
+        offsets = self.scene.get_table()
+        display = self.ax.transData.transform(
+            np.column_stack([offsets['x'], offsets['y']]))
+        distances = np.hypot(display[:, 0] - event.x, display[:, 1] - event.y)
+
+        slot = int(np.argmin(distances))
+        if distances[slot] > self.pick_radius_px:
+            return None
+        return slot
+
+    def start_drag(self, slot):
+        """
+        Начинает перетаскивание точки в слоте slot.
+
+        Точка скрывается в общих артистах сцены и рисуется накладкой;
+        полная перерисовка холста запоминает фон без неё (_on_draw).
+        """
+        self.drag = {'theta': self.scene.theta_at(slot), 'slot': slot,
+                     'overlay': None, 'background': None}
+
+        canvas = self.fig.canvas
+        if not canvas.supports_blit:
+            return
+
+        self.scene.set_hidden(slot, True)
+        self.drag['overlay'] = self.scene.create_overlay(slot)
+        canvas.draw()
+        self._blit()
+
+    def stop_drag(self):
+        """Заканчивает перетаскивание: точка возвращается в общие артисты."""
+        drag, self.drag = self.drag, None
+        if drag is None or drag['overlay'] is None:
+            return
+
+        self.scene.remove_overlay(drag['overlay'])
+        self.scene.set_hidden(drag['slot'], False)
+        self.fig.canvas.draw_idle()
+
+    def _overlay_artists(self):
+        """Артисты накладки перетаскиваемой точки."""
+        return [artist for artist in self.drag['overlay'].values()
+                if artist is not None and artist.get_visible()]
+
+    def _on_draw(self, event):
+        """После полной перерисовки — запоминает фон и рисует накладку."""
+        if self.drag is None or self.drag['overlay'] is None:
+            return
+
+        self.drag['background'] = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self._overlay_artists():
+            self.ax.draw_artist(artist)
+
+    def _blit(self):
+        """Восстанавливает фон, рисует накладку и выводит область осей."""
+        canvas = self.fig.canvas
+        canvas.restore_region(self.drag['background'])
+        for artist in self._overlay_artists():
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
+
+    @instrumented
+    def _on_press(self, event):
+        """Обработчик нажатия: захват точки левой кнопкой, иначе — pan."""
+        if event.inaxes == self.ax and event.button == 1:
+            slot = self.pick_point(event)
+            if slot is not None:
+                self.start_drag(slot)
+                return
+
+        super()._on_press(event)
+
+    @instrumented
+    def _on_release(self, event):
+        """Обработчик отпускания кнопки — конец перетаскивания или pan."""
+        self.stop_drag()
+        super()._on_release(event)
+
+    @instrumented
+    def _on_motion(self, event):
+        """Обработчик движения мыши — перетаскивание точки или pan."""
+        if self.drag is None:
+            super()._on_motion(event)
+            return
+        if event.inaxes != self.ax:
+            return
+
+        old_theta = self.drag['theta']
+        new_theta = float(project_point_to_curve(event.xdata, event.ydata,
+                                                 old_theta,
+                                                 iterations=self.newton_iterations))
+
+        if new_theta == old_theta or new_theta in self.scene:
+            return
+
+        overlay = self.drag['overlay']
+        self.drag['theta'] = self.scene.move_point(old_theta, new_theta,
+                                                   draw=overlay is None)
+        if overlay is not None:
+            self.scene.update_overlay(overlay, self.drag['slot'])
+            self._blit()
+
+
+if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+    from visualization_base import create_figure, draw_curve, setup_axes
+    from point_selector import select_random_points
+    from scene import CurveScene, add_scene_legend
+    from frame_interpolation import get_frame_interpolator
+
+    fig, ax = create_figure()
+    draw_curve(ax)
+
+    # Строки перетаскиваемой точки берутся из интерполяционных таблиц
+    scene = CurveScene(ax, select_random_points(),
+                       frame_function=get_frame_interpolator().evaluate)
+    add_scene_legend(ax)
+    setup_axes(ax, title='Перетаскивание точек вдоль кривой')
+    ax.legend(fontsize=12, loc='upper right')
+
+    editor = DragPointEditor(ax, scene)
+
+    plt.show()
@@ -1,27 +1,59 @@
 """Механизм выбора произвольных точек на кривой"""
 
+from collections import OrderedDict
+
 import numpy as np
-from config import NUM_RANDOM_POINTS, RANDOM_SEED
+from curve_definition import get_curve_coefficients, r_function, dr_function
+from curve_math import compute_curvature
+import warm_cache
+from config import NUM_RANDOM_POINTS, RANDOM_SEED, SAMPLER_TABLE_SIZE, SAMPLER_CACHE_SIZE
+
+# Кэш таблиц обратной функции распределения (LRU, не больше SAMPLER_CACHE_SIZE)
+_inverse_cdf_cache = OrderedDict()
+
+
+def _make_rng(seed=None, rng=None):
+    """Независимый генератор: переданный rng или новый из seed (по умолчанию из config)."""
+    if rng is not None:
+        return rng
+    if seed is None:
+        seed = RANDOM_SEED
+    return np.random.default_rng(seed)
 
 
-def select_random_points(num_points=None, seed=None):
+def spawn_generators(num_streams, seed=None):
+    """
+    Создаёт независимые генераторы для параллельных потоков или процессов.
+
+    Args:
+        num_streams: количество генераторов
+        seed: зерно (по умолчанию из config)
+
+    Returns:
+        list: список numpy.random.Generator
+    """
+    if seed is None:
+        seed = RANDOM_SEED
+    return [np.random.default_rng(child)
+            for child in np.random.SeedSequence(seed).spawn(num_streams)]
+
+
+def select_random_points(num_points=None, seed=None, rng=None):
     """
     Выбирает случайные значения θ на кривой.
 
     Args:
         num_points: количество точек (по умолчанию из config)
         seed: зерно для воспроизводимости (по умолчанию из config)
+        rng: готовый numpy.random.Generator (тогда seed не используется)
 
     Returns:
         numpy.ndarray: отсортированный массив углов θ
     """
     if num_points is None:
         num_points = NUM_RANDOM_POINTS
-    if seed is None:
-        seed = RANDOM_SEED
 
-    np.random.seed(seed)
-    theta_points = np.random.uniform(0, 2 * np.pi, num_points)
+    theta_points = _make_rng(seed, rng).uniform(0, 2 * np.pi, num_points)
 
     return np.sort(theta_points)
 
@@ -49,4 +81,155 @@ def select_custom_points(theta_list):
     Returns:
         numpy.ndarray: отсортированный массив углов
     """
-    return np.sort(np.array(theta_list))
\ No newline at end of file
+    return np.sort(np.array(theta_list))
+
+
+def build_inverse_cdf(weight='curvature', power=1.0, table_size=None):
+    """
+    Строит таблицу функции распределения θ с плотностью ∝ весу.
+
+    Веса:
+        'curvature'  — κ(θ)^power
+        'arc_length' — |dP/dθ| = √(r² + r'²), равномерно по длине дуги
+        'uniform'    — равномерно по θ
+
+    Таблица кэшируется по весу, степени, размеру и коэффициентам кривой —
+    в памяти процесса (последние SAMPLER_CACHE_SIZE таблиц) и на диске
+    (warm_cache).
+
+    Args:
+        weight: тип веса
+        power: степень для веса 'curvature'
+        table_size: количество интервалов сетки (по умолчанию из config)
+
+    Returns:
+        dict: {'theta': узлы сетки, 'cdf': значения функции распределения}
+    """
+    if table_size is None:
+        table_size = SAMPLER_TABLE_SIZE
+
+    key = (weight, power, table_size, get_curve_coefficients().tobytes())
+    if key in _inverse_cdf_cache:
+        _inverse_cdf_cache.move_to_end(key)
+        return _inverse_cdf_cache[key]
+
+    if weight not in ('curvature', 'arc_length', 'uniform'):
+        raise ValueError(f"Неизвестный вес: {weight!r}")
+
+    def compute():
+        theta = np.linspace(0, 2 * np.pi, table_size + 1)
+
+        if weight == 'curvature':
+            density = compute_curvature(theta) ** power
+        elif weight == 'arc_length':
+            density = np.sqrt(r_function(theta)**2 + dr_function(theta)**2)
+        else:
+            density = np.ones_like(theta)
+
+        # Интеграл плотности методом трапеций
+        cdf = np.concatenate([[0.0], np.cumsum(0.5 * (density[1:] + density[:-1]))])
+        cdf /= cdf[-1]
+        return {'theta': theta, 'cdf': cdf}
+
+    table = _inverse_cdf_cache[key] = warm_cache.cached(
+        'inverse_cdf', compute, table_size, weight=weight, power=float(power))
+    while len(_inverse_cdf_cache) > SAMPLER_CACHE_SIZE:
+        _inverse_cdf_cache.popitem(last=False)
+    return table
+
+
+def sample_inverse_cdf(table, u):
+    """
+    Преобразует равномерные числа u ∈ [0, 1) в углы θ по таблице.
+
+    Один вызов searchsorted на весь массив, внутри интервала —
+    линейная интерполяция функции распределения.
+
+    Args:
+        table: результат build_inverse_cdf
+        u: массив чисел из [0, 1)
+
+    Returns:
+        numpy.ndarray: углы θ той же формы, что u
+    """
+    theta, cdf = table['theta'], table['cdf']
+    i = np.clip(np.searchsorted(cdf, u, side='right') - 1, 0, len(cdf) - 2)
+
+    width = cdf[i + 1] - cdf[i]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fraction = np.where(width > 0, (u - cdf[i]) / width, 0.0)
+
+    return theta[i] + fraction * (theta[i + 1] - theta[i])
+
+
+def _van_der_corput(indices):
+    """Последовательность ван дер Корпута по основанию 2 (одномерная Соболь/Холтон)."""
+    indices = np.asarray(indices, dtype=np.uint64)
+    result = np.zeros(indices.shape)
+    scale = 0.5
+    while indices.any():
+        result += scale * (indices & np.uint64(1))
+        indices = indices >> np.uint64(1)
+        scale *= 0.5
+    return result
+
+
+def uniform_variates(num_points, method='random', rng=None):
+    """
+    Равномерные числа на [0, 1) для выборки по таблице.
+
+    Методы:
+        'random'     — независимые случайные числа
+        'stratified' — по одному случайному числу в каждом из num_points слоёв
+        'halton'     — малорасхождённая последовательность ван дер Корпута
+                       со случайным сдвигом (по модулю 1)
+
+    Args:
+        num_points: количество чисел
+        method: метод генерации
+        rng: numpy.random.Generator
+
+    Returns:
+        numpy.ndarray: массив чисел из [0, 1)
+    """
+    if rng is None:
+        rng = _make_rng()
+
+    if method == 'random':
+        return rng.random(num_points)
+    if method == 'stratified':
+        return (np.arange(num_points) + rng.random(num_points)) / num_points
+    if method == 'halton':
+        return (_van_der_corput(np.arange(1, num_points + 1)) + rng.random()) % 1.0
+
+    raise ValueError(f"Неизвестный метод: {method!r}")
+
+
+def select_weighted_points(num_points=None, weight='curvature', power=1.0,
+                           method='random', seed=None, rng=None):
+    """
+    Выбирает θ с плотностью, пропорциональной κ(θ)^power или длине дуги.
+
+    В отличие от select_random_points, точки чаще попадают на участки
+    с большой кривизной. Используется собственный генератор, поэтому
+    функцию безопасно вызывать из параллельных потоков и процессов
+    (см. spawn_generators).
+
+    Args:
+        num_points: количество точек (по умолчанию из config)
+        weight: 'curvature', 'arc_length' или 'uniform'
+        power: степень для веса 'curvature'
+        method: 'random', 'stratified' или 'halton'
+        seed: зерно (по умолчанию из config)
+        rng: готовый numpy.random.Generator (тогда seed не используется)
+
+    Returns:
+        numpy.ndarray: отсортированный массив углов θ
+    """
+    if num_points is None:
+        num_points = NUM_RANDOM_POINTS
+
+    table = build_inverse_cdf(weight, power)
+    u = uniform_variates(num_points, method, _make_rng(seed, rng))
+
+    return np.sort(sample_inverse_cdf(table, u))
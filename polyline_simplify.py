@@ -0,0 +1,152 @@
+"""Упрощение ломаной с контролем ошибки (Рамер — Дуглас — Пекер)"""
+
+import numpy as np
+
+
+def simplify_polyline(x, y, tolerance, curvature=None):
+    """
+    Отбирает вершины ломаной так, чтобы отклонение не превышало tolerance.
+
+    Алгоритм Рамера — Дугласа — Пекера, векторизованный по уровням:
+    на каждом шаге все активные отрезки обрабатываются одновременно,
+    максимум расстояния внутри отрезка ищется через np.maximum.reduceat.
+
+    Если передана кривизна в вершинах, отрезок с длиной дуги L и
+    max|κ| на нём принимается без вычисления расстояний, когда
+    стрелка прогиба κ·L²/8 не превышает tolerance — почти прямые
+    участки не подразбиваются.
+
+    Args:
+        x, y: координаты вершин
+        tolerance: допустимое отклонение (в единицах x, y)
+        curvature: кривизна в вершинах (опционально)
+
+    Returns:
+        numpy.ndarray: булева маска оставляемых вершин
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[[0, -1]] = True
+
+    arc = np.concatenate([[0.0], np.cumsum(np.hypot(np.diff(x), np.diff(y)))])
+    if curvature is not None:
+        # Запасной элемент — чтобы индекс end + 1 не выходил за массив
+        curvature = np.append(np.abs(np.asarray(curvature, dtype=float)), 0.0)
+
+    starts = np.array([0])
+    ends = np.array([n - 1])
+
+    while starts.size:
+        interior = ends - starts > 1
+        starts, ends = starts[interior], ends[interior]
+
+        if curvature is not None and starts.size:
+            bounds = np.column_stack([starts, ends + 1]).ravel()
+            max_curvature = np.maximum.reduceat(curvature, bounds)[::2]
+            length = arc[ends] - arc[starts]
+            curved = max_curvature * length**2 / 8 > tolerance
+            starts, ends = starts[curved], ends[curved]
+
+        if not starts.size:
+            break
+
+        # Внутренние вершины всех активных отрезков одним массивом
+        counts = ends - starts - 1
+        offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        owner = np.repeat(np.arange(len(starts)), counts)
+        index = starts[owner] + 1 + np.arange(counts.sum()) - offsets[owner]
+
+        x0, y0 = x[starts][owner], y[starts][owner]
+        cx = x[ends][owner] - x0
+        cy = y[ends][owner] - y0
+        px = x[index] - x0
+        py = y[index] - y0
+
+        chord = np.hypot(cx, cy)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distance = np.where(chord > 0, np.abs(cx * py - cy * px) / chord,
+                                np.hypot(px, py))
+
+        max_distance = np.maximum.reduceat(distance, offsets)
+
+        # Первая вершина с максимальным расстоянием в каждом отрезке
+        at_max = np.flatnonzero(distance == max_distance[owner])
+        _, first = np.unique(owner[at_max], return_index=True)
+        split = index[at_max[first]]
+
+        far = max_distance > tolerance
+        split = split[far]
+        keep[split] = True
+
+        starts = np.concatenate([starts[far], split])
+        ends = np.concatenate([split, ends[far]])
+
+    return keep
+
+
+def pixel_tolerance(ax, pixels):
+    """
+    Переводит допуск из пикселей в единицы данных для текущих осей.
+
+    Args:
+        ax: объект осей matplotlib
+        pixels: допуск в пикселях
+
+    Returns:
+        float: допуск в единицах данных (по более мелкой из осей)
+    """
+    x0, y0 = ax.transData.inverted().transform((0, 0))
+    x1, y1 = ax.transData.inverted().transform((pixels, pixels))
+    return min(abs(x1 - x0), abs(y1 - y0))
+
+
+def minmax_decimate(x, y, num_columns, x_range=None):
+    """
+    Прореживание min/max по столбцам: на каждый столбец — не больше двух вершин.
+
+    Диапазон x делится на num_columns столбцов (обычно — пиксели по
+    ширине осей); в каждом столбце остаются вершины с наименьшим и
+    наибольшим y в порядке следования. Узкие пики не теряются, а число
+    вершин не превышает 2·num_columns.
+
+    Args:
+        x: неубывающие координаты (θ, длина дуги)
+        y: значения
+        num_columns: количество столбцов
+        x_range: (x0, x1) — диапазон столбцов (по умолчанию — весь x)
+
+    Returns:
+        numpy.ndarray: индексы оставляемых вершин по возрастанию
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= 2 * num_columns:
+        return np.arange(n)
+
+    x0, x1 = (x[0], x[-1]) if x_range is None else x_range
+    scale = num_columns / (x1 - x0) if x1 > x0 else 0.0
+    column = np.clip(((x - x0) * scale).astype(np.intp), 0, num_columns - 1)
+
+    starts = np.flatnonzero(np.r_[True, column[1:] != column[:-1]])
+    ends = np.r_[starts[1:], n] - 1
+
+    # Внутри столбца сортировка по y: первая вершина группы — минимум, последняя — максимум
+    order = np.lexsort((y, column))
+    pairs = np.sort(np.column_stack([order[starts], order[ends]]), axis=1).ravel()
+    return pairs[np.r_[True, pairs[1:] != pairs[:-1]]]
+
+
+def pixel_columns(ax):
+    """
+    Ширина осей в пикселях — число столбцов для minmax_decimate.
+
+    Returns:
+        int: количество столбцов
+    """
+    return max(1, int(np.ceil(ax.bbox.width)))
@@ -0,0 +1,300 @@
+"""Пакетное пересечение лучей и прямых с кривой"""
+
+import numpy as np
+from curve_definition import r_function, dr_function, get_cartesian_coordinates
+from curve_math import compute_derivatives
+from instrumentation import instrumented
+from config import (RAY_COARSE_CELLS, RAY_CELL_SUBDIVISIONS,
+                    RAY_NEWTON_ITERATIONS, RAY_CHUNK_SIZE)
+
+
+class _CurveSampling:
+    """
+    Двухуровневая выборка кривой по θ для поиска корней.
+
+    Верхний уровень — coarse_cells ячеек по θ. Для каждой ячейки известна
+    max|P'(θ)|·Δθ — оценка того, насколько может измениться
+    g(θ) = d × (P(θ) − o) внутри ячейки при |d| = 1. Ячейка содержит корень,
+    только если |g(a)| + |g(b)| ≤ |d|·max|P'|·Δθ. Такие ячейки проверяются
+    на нижнем уровне — subdivisions подъячеек.
+    """
+
+    def __init__(self, coarse_cells, subdivisions):
+        self.coarse_cells = coarse_cells
+        self.subdivisions = subdivisions
+
+        num_fine = coarse_cells * subdivisions
+        self.theta = np.linspace(0, 2 * np.pi, num_fine + 1)
+        self.x, self.y = get_cartesian_coordinates(self.theta)
+
+        dx, dy = compute_derivatives(self.theta)
+        speed = np.hypot(dx, dy)
+        # Запас на отрезки между узлами выборки
+        cell_speed = speed[:-1].reshape(coarse_cells, subdivisions).max(axis=1)
+        self.cell_bound = 1.25 * cell_speed * (2 * np.pi / coarse_cells)
+
+        # Узлы верхнего уровня (включая 2π для замыкания); для отбора ячеек
+        # достаточно float32 — погрешность покрывается запасом coarse_slack
+        self.coarse_x = self.x[::subdivisions].astype(np.float32)
+        self.coarse_y = self.y[::subdivisions].astype(np.float32)
+        scale = np.abs(np.concatenate([self.x, self.y])).max()
+        self.coarse_slack = 16 * np.finfo(np.float32).eps * max(scale, 1.0)
+
+
+def _point_and_tangent(theta):
+    """Точка кривой и производная (x', y') по одному вычислению r и r'."""
+    r = r_function(theta)
+    dr = dr_function(theta)
+    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
+    return (r * cos_theta, r * sin_theta,
+            dr * cos_theta - r * sin_theta, dr * sin_theta + r * cos_theta)
+
+
+def _signed_distance(ox, oy, dx, dy, x, y):
+    """g = d × (P − o) — обращается в ноль, когда P лежит на прямой луча."""
+    return dx * (y - oy) - dy * (x - ox)
+
+
+def _brackets_for_chunk(sampling, ox, oy, dx, dy):
+    """
+    Находит интервалы θ со сменой знака g для блока лучей.
+
+    Returns:
+        tuple: (номер луча, индекс θa на мелкой сетке, g(θa), g(θb)) —
+               массивы по интервалам
+    """
+    # Верхний уровень считается в float32 с нормированным d
+    norm = np.hypot(dx, dy)
+    ux, uy = (dx / norm).astype(np.float32), (dy / norm).astype(np.float32)
+    g = np.abs(_signed_distance(ox.astype(np.float32)[:, np.newaxis],
+                                oy.astype(np.float32)[:, np.newaxis],
+                                ux[:, np.newaxis], uy[:, np.newaxis],
+                                sampling.coarse_x, sampling.coarse_y))
+
+    # Ячейки верхнего уровня, которые могут содержать корень: смена знака
+    # внутри ячейки возможна, только если |g(a)| + |g(b)| ≤ max|P'|·Δθ
+    possible = g[:, :-1] + g[:, 1:] <= (sampling.cell_bound + sampling.coarse_slack *
+                                        (1 + np.abs(ox) + np.abs(oy))[:, np.newaxis])
+    ray, cell = np.nonzero(possible)
+
+    # Нижний уровень: подъячейки кандидатов
+    sub = sampling.subdivisions
+    fine = cell[:, np.newaxis] * sub + np.arange(sub + 1)
+    gf = _signed_distance(ox[ray, np.newaxis], oy[ray, np.newaxis],
+                          dx[ray, np.newaxis], dy[ray, np.newaxis],
+                          sampling.x[fine], sampling.y[fine])
+
+    ga, gb = gf[:, :-1], gf[:, 1:]
+    crossing = (ga == 0) | (ga * gb < 0)
+    row, col = np.nonzero(crossing)
+
+    return ray[row], fine[row, col], ga[row, col], gb[row, col]
+
+
+def _refine(ox, oy, dx, dy, theta_a, theta_b, g_a, g_b, iterations,
+            tolerance=1e-14):
+    """
+    Уточняет корни g(θ) = 0 методом Ньютона с защитой интервалом.
+
+    Начальное приближение — метод хорд; шаг, выводящий за интервал,
+    заменяется делением пополам. Итерации продолжаются только для корней,
+    у которых шаг по θ ещё больше tolerance (почти касательные лучи
+    сходятся медленнее остальных).
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        theta = np.where(g_a != g_b, theta_a + (theta_b - theta_a) * g_a / (g_a - g_b),
+                         theta_a)
+
+    a, b = theta_a.copy(), theta_b.copy()
+    active = np.arange(len(theta))
+    for _ in range(iterations):
+        if not active.size:
+            break
+
+        current = theta[active]
+        x, y, px, py = _point_and_tangent(current)
+        g = _signed_distance(ox[active], oy[active], dx[active], dy[active], x, y)
+        dg = dx[active] * py - dy[active] * px
+
+        # Сужаем интервал по знаку g
+        left = np.sign(g) == np.sign(g_a[active])
+        a[active] = np.where(left, current, a[active])
+        b[active] = np.where(left, b[active], current)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = current - g / dg
+        inside = (step >= a[active]) & (step <= b[active])
+        step = np.where(inside, step, 0.5 * (a[active] + b[active]))
+
+        theta[active] = step
+        active = active[np.abs(step - current) > tolerance]
+
+    return theta
+
+
+@instrumented
+def intersect_rays(origins, directions, lines=False, t_min=1e-9,
+                   nearest=False, exclude_theta=None,
+                   coarse_cells=None, subdivisions=None,
+                   newton_iterations=None, chunk_size=None):
+    """
+    Находит все пересечения лучей (или прямых) с кривой.
+
+    Для каждого луча o + t·d ищутся корни g(θ) = d × (P(θ) − o):
+    ячейки θ без корня отбрасываются по оценке изменения g, в остальных
+    ищется смена знака на мелкой сетке, затем корень уточняется
+    векторизованным методом Ньютона (производные — по формулам
+    compute_derivatives, r и r' вычисляются один раз на итерацию).
+
+    Args:
+        origins: начала лучей, массив (N, 2)
+        directions: направления лучей, массив (N, 2) (не обязательно единичные)
+        lines: True — прямые (любые t), False — лучи (t > t_min)
+        t_min: минимальный параметр для лучей (отсекает точку старта)
+        nearest: True — только ближайшее пересечение с t > t_min для
+                 каждого луча; интервал выбирается по хорде мелкой сетки
+                 до уточнения, так что уточняется один корень на луч
+        exclude_theta: θ точек кривой, из которых выпущены лучи (массив N);
+                       интервал, содержащий эту θ, пропускается — для лучей,
+                       стартующих на самой кривой (отражения)
+        coarse_cells: ячеек верхнего уровня (по умолчанию из config)
+        subdivisions: подъячеек в ячейке (по умолчанию из config)
+        newton_iterations: максимум шагов Ньютона (по умолчанию из config)
+        chunk_size: лучей в одном блоке (по умолчанию из config)
+
+    Returns:
+        dict: массивы по всем пересечениям, упорядоченные по лучу и t:
+              'ray' — номер луча, 'theta', 'x', 'y', 'nx', 'ny' — единичная
+              нормаль (compute_normal_vector), 't' — параметр луча
+    """
+    if coarse_cells is None:
+        coarse_cells = RAY_COARSE_CELLS
+    if subdivisions is None:
+        subdivisions = RAY_CELL_SUBDIVISIONS
+    if newton_iterations is None:
+        newton_iterations = RAY_NEWTON_ITERATIONS
+    if chunk_size is None:
+        chunk_size = RAY_CHUNK_SIZE
+    if nearest and lines:
+        raise ValueError("nearest=True имеет смысл только для лучей (lines=False)")
+
+    origins = np.atleast_2d(np.asarray(origins, dtype=float))
+    directions = np.atleast_2d(np.asarray(directions, dtype=float))
+    ox, oy = origins[:, 0], origins[:, 1]
+    dx, dy = directions[:, 0], directions[:, 1]
+
+    sampling = _CurveSampling(coarse_cells, subdivisions)
+
+    parts = []
+    for start in range(0, len(ox), chunk_size):
+        block = slice(start, start + chunk_size)
+        ray, index, g_a, g_b = _brackets_for_chunk(
+            sampling, ox[block], oy[block], dx[block], dy[block])
+        parts.append((ray + start, index, g_a, g_b))
+
+    ray, index, g_a, g_b = (np.concatenate(column) for column in zip(*parts))
+    theta_a, theta_b = sampling.theta[index], sampling.theta[index + 1]
+
+    if exclude_theta is not None:
+        # Периодическое смещение θ старта от начала интервала
+        offset = np.mod(np.asarray(exclude_theta, dtype=float)[ray] - theta_a, 2 * np.pi)
+        keep = ~((offset <= theta_b - theta_a + 1e-12) | (offset >= 2 * np.pi - 1e-12))
+        ray, index, g_a, g_b = ray[keep], index[keep], g_a[keep], g_b[keep]
+        theta_a, theta_b = theta_a[keep], theta_b[keep]
+
+    if nearest:
+        # t по хорде мелкой сетки; для каждого луча — наименьшее t > t_min
+        fraction = g_a / (g_a - g_b)
+        chord_x = sampling.x[index] + fraction * (sampling.x[index + 1] - sampling.x[index])
+        chord_y = sampling.y[index] + fraction * (sampling.y[index + 1] - sampling.y[index])
+        t_chord = (((chord_x - ox[ray]) * dx[ray] + (chord_y - oy[ray]) * dy[ray]) /
+                   (dx[ray]**2 + dy[ray]**2))
+
+        ahead = np.flatnonzero(t_chord > t_min)
+        order = ahead[np.lexsort((t_chord[ahead], ray[ahead]))]
+        first = order[np.r_[True, ray[order][1:] != ray[order][:-1]]] if order.size else order
+        ray, g_a, g_b = ray[first], g_a[first], g_b[first]
+        theta_a, theta_b = theta_a[first], theta_b[first]
+
+    rox, roy, rdx, rdy = ox[ray], oy[ray], dx[ray], dy[ray]
+
+    theta = _refine(rox, roy, rdx, rdy, theta_a, theta_b, g_a, g_b,
+                    newton_iterations)
+    theta = np.mod(theta, 2 * np.pi)
+
+    x, y, px, py = _point_and_tangent(theta)
+    speed = np.hypot(px, py)
+    t = ((x - rox) * rdx + (y - roy) * rdy) / (rdx**2 + rdy**2)
+
+    valid = np.ones(len(t), dtype=bool) if lines else t > t_min
+    order = np.lexsort((t[valid], ray[valid]))
+
+    return {
+        'ray': ray[valid][order],
+        'theta': theta[valid][order],
+        'x': x[valid][order],
+        'y': y[valid][order],
+        'nx': (-py / speed)[valid][order],
+        'ny': (px / speed)[valid][order],
+        't': t[valid][order]
+    }
+
+
+def first_hits(hits, num_rays):
+    """
+    Ближайшее пересечение для каждого луча.
+
+    Args:
+        hits: результат intersect_rays
+        num_rays: количество лучей
+
+    Returns:
+        dict: массивы длины num_rays ('theta', 'x', 'y', 'nx', 'ny', 't');
+              'hit' — булева маска лучей, у которых есть пересечение,
+              для остальных значения NaN
+    """
+    ray = hits['ray']
+    # Пересечения упорядочены по лучу и t: первое в группе — ближайшее
+    first = np.flatnonzero(np.r_[True, ray[1:] != ray[:-1]]) if len(ray) else ray
+
+    result = {'hit': np.zeros(num_rays, dtype=bool)}
+    result['hit'][ray[first]] = True
+    for name in ('theta', 'x', 'y', 'nx', 'ny', 't'):
+        column = np.full(num_rays, np.nan)
+        column[ray[first]] = hits[name][first]
+        result[name] = column
+
+    return result
+
+
+if __name__ == '__main__':
+    import time
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from visualization_base import create_figure, draw_curve, setup_axes
+
+    num_rays = 10**6
+    rng = np.random.default_rng(0)
+    angles = rng.uniform(0, 2 * np.pi, num_rays)
+    origins = rng.uniform(-0.3, 0.3, (num_rays, 2))
+    directions = np.column_stack([np.cos(angles), np.sin(angles)])
+
+    start = time.perf_counter()
+    hits = intersect_rays(origins, directions)
+    print(f"{num_rays} лучей, {len(hits['ray'])} пересечений: "
+          f"{time.perf_counter() - start:.2f} с")
+
+    # Первые пересечения нескольких лучей
+    shown = 200
+    first = first_hits(hits, num_rays)
+    first = {name: column[:shown] for name, column in first.items()}
+    segments = np.stack([origins[:shown],
+                         np.column_stack([first['x'], first['y']])], axis=1)
+
+    fig, ax = create_figure()
+    draw_curve(ax)
+    ax.add_collection(LineCollection(segments[first['hit']], colors='orange',
+                                     linewidths=0.6))
+    ax.scatter(first['x'], first['y'], s=8, color='red', zorder=5)
+    setup_axes(ax, title='Пересечения лучей с кривой')
+    plt.show()
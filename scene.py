@@ -0,0 +1,523 @@
+"""Сцена с инкрементальным обновлением слоёв при изменении набора точек"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.path import Path
+
+from curve_math import get_frame_table
+from instrumentation import instrumented
+from visualization_curvature import CURVATURE_CIRCLE_COLOR
+from config import (POINT_SIZE, POINT_COLOR, POINT_EDGE_COLOR, POINT_EDGE_WIDTH,
+                    VECTOR_SCALE, TANGENT_COLOR, NORMAL_COLOR, VECTOR_LINEWIDTH,
+                    EVOLUTE_POINT_COLOR, EVOLUTE_POINT_SIZE,
+                    EVOLUTE_CONNECTION_COLOR, EVOLUTE_CONNECTION_STYLE,
+                    EVOLUTE_CONNECTION_WIDTH, EVOLUTE_CONNECTION_ALPHA,
+                    SCENE_CIRCLE_POINTS)
+
+# Столбцы таблицы точек, которые хранит сцена
+SCENE_COLUMNS = ('theta', 'x', 'y', 'tx', 'ty', 'nx', 'ny',
+                 'curvature', 'radius', 'center_x', 'center_y')
+
+
+class CurveScene:
+    """
+    Сцена: точки, касательные, нормали, соприкасающиеся окружности,
+    эволюта и подписи для набора точек кривой.
+
+    Каждый слой — один артист (scatter или LineCollection). Данные точек
+    хранятся построчно в заранее выделенных массивах («слотах»), слот
+    точки находится по её θ. При изменении набора точек вычисляются
+    данные только добавленных точек, удалённые слоты заполняются
+    последними строками. В артистах обновляются только изменённые слоты
+    (_update_artists): у LineCollection заменяются вершины соответствующих
+    Path, у scatter — строки массива смещений, поэтому перенос точки
+    стоит O(1) независимо от числа точек. При добавлении и удалении
+    списки Path растут и сокращаются с конца; массив смещений scatter
+    при изменении длины передаётся заново (одно копирование).
+    Для перетаскивания с blit строку можно скрыть в общих артистах
+    (set_hidden) и рисовать отдельной накладкой (create_overlay).
+
+    Использование:
+        fig, ax = create_figure()
+        draw_curve(ax)
+        scene = CurveScene(ax, select_random_points())
+        scene.set_points(select_random_points(seed=1))
+    """
+
+    def __init__(self, ax, theta_points=(), scale=None, max_radius=2.0,
+                 circle_points=None, show_labels=True, show_connections=True,
+                 frame_function=None):
+        """
+        Инициализация сцены.
+
+        Args:
+            ax: объект осей matplotlib
+            theta_points: начальный набор углов θ
+            scale: длина векторов (по умолчанию из config)
+            max_radius: окружности большего радиуса не рисуются
+            circle_points: точек на окружности (по умолчанию из config)
+            show_labels: показывать ли подписи точек
+            show_connections: показывать ли линии точка — центр кривизны
+            frame_function: функция θ → таблица репера (по умолчанию
+                            get_frame_table; для перетаскивания можно
+                            передать FrameInterpolator.evaluate)
+        """
+        if scale is None:
+            scale = VECTOR_SCALE
+        if circle_points is None:
+            circle_points = SCENE_CIRCLE_POINTS
+        if frame_function is None:
+            frame_function = get_frame_table
+
+        self.ax = ax
+        self.fig = ax.figure
+        self.scale = scale
+        self.max_radius = max_radius
+        self.show_labels = show_labels
+        self.show_connections = show_connections
+        self.frame_function = frame_function
+
+        self._phi = np.linspace(0, 2 * np.pi, circle_points)
+        self._count = 0
+        self._capacity = 0
+        self._slots = {}
+        self._keys = []
+        self._labels = []
+        self._hidden = set()
+        self._next_label = 1
+        self._allocate(16)
+
+        self._create_artists()
+        self.add_points(theta_points)
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, theta):
+        return float(theta) in self._slots
+
+    # ------------------------------------------------------------------
+    # Хранилище строк
+    # ------------------------------------------------------------------
+
+    def _allocate(self, capacity):
+        """Увеличивает ёмкость массивов, сохраняя заполненные строки."""
+        n = self._count
+        columns = {name: np.empty(capacity) for name in SCENE_COLUMNS}
+        offsets = np.empty((capacity, 2))
+        evolute = np.empty((capacity, 2))
+        tangents = np.empty((capacity, 2, 2))
+        normals = np.empty((capacity, 2, 2))
+        connections = np.empty((capacity, 2, 2))
+        circles = np.empty((capacity, len(self._phi), 2))
+
+        if self._capacity:
+            for name in SCENE_COLUMNS:
+                columns[name][:n] = self.columns[name][:n]
+            offsets[:n] = self._offsets[:n]
+            evolute[:n] = self._evolute[:n]
+            tangents[:n] = self._tangents[:n]
+            normals[:n] = self._normals[:n]
+            connections[:n] = self._connections[:n]
+            circles[:n] = self._circles[:n]
+
+        self.columns = columns
+        self._offsets = offsets
+        self._evolute = evolute
+        self._tangents = tangents
+        self._normals = normals
+        self._connections = connections
+        self._circles = circles
+        self._capacity = capacity
+
+    def _write_rows(self, slots, table):
+        """Записывает строки таблицы get_frame_table в указанные слоты."""
+        for name in SCENE_COLUMNS:
+            self.columns[name][slots] = table[name]
+
+        x, y = table['x'], table['y']
+        cx, cy = table['center_x'], table['center_y']
+        point = np.stack([x, y], axis=-1)
+        center = np.stack([cx, cy], axis=-1)
+
+        self._offsets[slots] = point
+        self._evolute[slots] = center
+        self._tangents[slots, 0] = point
+        self._tangents[slots, 1] = point + self.scale * np.stack([table['tx'], table['ty']], axis=-1)
+        self._normals[slots, 0] = point
+        self._normals[slots, 1] = point + self.scale * np.stack([table['nx'], table['ny']], axis=-1)
+        self._connections[slots, 0] = point
+        self._connections[slots, 1] = center
+
+        # Слишком большие окружности скрываем через NaN
+        radius = np.where(table['radius'] < self.max_radius, table['radius'], np.nan)
+        self._circles[slots, :, 0] = cx[:, np.newaxis] + radius[:, np.newaxis] * np.cos(self._phi)
+        self._circles[slots, :, 1] = cy[:, np.newaxis] + radius[:, np.newaxis] * np.sin(self._phi)
+
+    def _move_row(self, source, target):
+        """Переносит строку source в слот target (при удалении точки)."""
+        for name in SCENE_COLUMNS:
+            self.columns[name][target] = self.columns[name][source]
+        for array in (self._offsets, self._evolute, self._tangents,
+                      self._normals, self._connections, self._circles):
+            array[target] = array[source]
+
+    # ------------------------------------------------------------------
+    # Артисты
+    # ------------------------------------------------------------------
+
+    def _make_artists(self, animated=False):
+        """Артисты слоёв (пустые); animated=True — для рисования поверх фона (blit)."""
+        ax = self.ax
+        empty_segments = np.empty((0, 2, 2))
+
+        artists = {
+            'tangents': ax.add_collection(LineCollection(
+                empty_segments, colors=TANGENT_COLOR,
+                linewidths=VECTOR_LINEWIDTH, zorder=3, animated=animated)),
+            'normals': ax.add_collection(LineCollection(
+                empty_segments, colors=NORMAL_COLOR,
+                linewidths=VECTOR_LINEWIDTH, zorder=3, animated=animated)),
+            'circles': ax.add_collection(LineCollection(
+                empty_segments, colors=CURVATURE_CIRCLE_COLOR,
+                linestyles='--', linewidths=1.5, alpha=0.7, zorder=2,
+                animated=animated)),
+            'connections': ax.add_collection(LineCollection(
+                empty_segments, colors=EVOLUTE_CONNECTION_COLOR,
+                linestyles=EVOLUTE_CONNECTION_STYLE,
+                linewidths=EVOLUTE_CONNECTION_WIDTH,
+                alpha=EVOLUTE_CONNECTION_ALPHA, zorder=2, animated=animated)),
+            'evolute': ax.scatter([], [], s=EVOLUTE_POINT_SIZE,
+                                  c=EVOLUTE_POINT_COLOR, zorder=5,
+                                  edgecolors='white', linewidths=1.5,
+                                  animated=animated),
+            'points': ax.scatter([], [], s=POINT_SIZE, c=POINT_COLOR,
+                                 zorder=5, edgecolors=POINT_EDGE_COLOR,
+                                 linewidths=POINT_EDGE_WIDTH, animated=animated)
+        }
+        artists['connections'].set_visible(self.show_connections)
+        return artists
+
+    def _create_artists(self):
+        """Создаёт по одному артисту на слой."""
+        self.artists = self._make_artists()
+
+    def _create_label(self, x, y):
+        """Создаёт подпись очередной точки."""
+        label = self.ax.annotate(f'P{self._next_label}', (x, y),
+                                 textcoords="offset points",
+                                 xytext=(10, 10),
+                                 fontsize=10,
+                                 fontweight='bold')
+        self._next_label += 1
+        return label
+
+    def _segment_layers(self):
+        """Слои LineCollection и массивы их вершин."""
+        return (('tangents', self._tangents), ('normals', self._normals),
+                ('connections', self._connections), ('circles', self._circles))
+
+    def _offset_layers(self):
+        """Слои scatter и массивы их смещений."""
+        return (('points', self._offsets), ('evolute', self._evolute))
+
+    def refresh(self, draw=True):
+        """
+        Передаёт все заполненные строки артистам (O(числа точек)).
+
+        Args:
+            draw: запросить ли перерисовку холста
+        """
+        n = self._count
+        for name, offsets in self._offset_layers():
+            self.artists[name].set_offsets(offsets[:n])
+        for name, segments in self._segment_layers():
+            self.artists[name].set_segments(segments[:n])
+        self._update_artists(self._hidden, draw=False)
+
+        if draw:
+            self.fig.canvas.draw_idle()
+
+    def _update_artists(self, slots, draw=True):
+        """
+        Передаёт артистам только строки slots и изменение числа строк.
+
+        Args:
+            slots: изменённые слоты
+            draw: запросить ли перерисовку холста
+        """
+        n = self._count
+        slots = [int(slot) for slot in slots]
+        hidden = [slot for slot in self._hidden if slot < n]
+
+        for name, segments in self._segment_layers():
+            artist = self.artists[name]
+            paths = artist.get_paths()
+            del paths[n:]
+            for slot in slots:
+                if slot < len(paths):
+                    paths[slot].vertices = segments[slot].copy()
+            paths.extend(Path(segments[slot].copy()) for slot in range(len(paths), n))
+            # Скрытые слоты (перетаскиваемая точка рисуется отдельно) — NaN
+            for slot in hidden:
+                paths[slot].vertices = np.full_like(segments[slot], np.nan)
+            artist.stale = True
+
+        for name, offsets in self._offset_layers():
+            artist = self.artists[name]
+            current = artist.get_offsets()
+            if len(current) != n or n == 0:
+                artist.set_offsets(offsets[:n])
+                current = artist.get_offsets()
+            else:
+                current[slots] = offsets[slots]
+            current[hidden] = np.nan
+            artist.stale = True
+
+        if draw:
+            self.fig.canvas.draw_idle()
+
+    # ------------------------------------------------------------------
+    # Изменение набора точек
+    # ------------------------------------------------------------------
+
+    @instrumented
+    def add_points(self, theta_points, draw=True):
+        """
+        Добавляет точки (уже присутствующие пропускаются).
+
+        Args:
+            theta_points: массив углов θ
+            draw: запросить ли перерисовку
+
+        Returns:
+            int: количество добавленных точек
+        """
+        # dict.fromkeys — уникальные θ в порядке появления за O(k)
+        keys = np.atleast_1d(np.asarray(theta_points, dtype=float)).tolist()
+        added = [key for key in dict.fromkeys(keys) if key not in self._slots]
+        if not added:
+            return 0
+
+        needed = self._count + len(added)
+        if needed > self._capacity:
+            self._allocate(max(needed, 2 * self._capacity))
+
+        slots = np.arange(self._count, needed)
+        table = self.frame_function(np.array(added))
+        self._write_rows(slots, table)
+
+        for slot, key in zip(slots, added):
+            self._slots[key] = int(slot)
+            self._keys.append(key)
+            self._labels.append(self._create_label(self._offsets[slot, 0],
+                                                   self._offsets[slot, 1])
+                                if self.show_labels else None)
+        self._count = needed
+
+        self._update_artists(slots, draw)
+        return len(added)
+
+    @instrumented
+    def remove_points(self, theta_points, draw=True):
+        """
+        Удаляет точки (отсутствующие пропускаются).
+
+        Слот удалённой точки занимает последняя строка, поэтому
+        массивы остаются плотными.
+
+        Returns:
+            int: количество удалённых точек
+        """
+        removed = 0
+        changed = set()
+        for theta in np.atleast_1d(np.asarray(theta_points, dtype=float)):
+            slot = self._slots.pop(float(theta), None)
+            if slot is None:
+                continue
+
+            last = self._count - 1
+            label = self._labels[slot]
+            if label is not None:
+                label.remove()
+            self._hidden.discard(slot)
+
+            if slot != last:
+                self._move_row(last, slot)
+                changed.add(slot)
+                if last in self._hidden:
+                    self._hidden.discard(last)
+                    self._hidden.add(slot)
+                moved_key = self._keys[last]
+                self._keys[slot] = moved_key
+                self._labels[slot] = self._labels[last]
+                self._slots[moved_key] = slot
+
+            self._keys.pop()
+            self._labels.pop()
+            self._count = last
+            removed += 1
+
+        if removed:
+            self._update_artists(sorted(slot for slot in changed if slot < self._count), draw)
+        return removed
+
+    def set_points(self, theta_points, draw=True):
+        """
+        Приводит сцену к новому набору точек по разнице с текущим.
+
+        Returns:
+            tuple: (добавлено, удалено)
+        """
+        new_keys = {float(theta) for theta in np.atleast_1d(theta_points)}
+        removed = [key for key in self._keys if key not in new_keys]
+        added = [key for key in new_keys if key not in self._slots]
+
+        removed_count = self.remove_points(removed, draw=False)
+        added_count = self.add_points(sorted(added), draw=False)
+        if (removed_count or added_count) and draw:
+            self.fig.canvas.draw_idle()
+
+        return added_count, removed_count
+
+    @instrumented
+    def move_point(self, old_theta, new_theta, draw=True):
+        """
+        Переносит одну точку в новое θ, обновляя только её строку
+        и её элементы в артистах — O(1) по числу точек сцены.
+
+        Args:
+            old_theta: текущее θ точки
+            new_theta: новое θ
+
+        Returns:
+            float: новое θ (ключ точки в сцене)
+
+        Raises:
+            ValueError: если в new_theta уже есть другая точка
+        """
+        old_key, new_key = float(old_theta), float(new_theta)
+        if new_key != old_key and new_key in self._slots:
+            raise ValueError(f"Точка θ = {new_key} уже есть в сцене")
+        slot = self._slots.pop(old_key)
+        self._slots[new_key] = slot
+        self._keys[slot] = new_key
+
+        self._write_rows(np.array([slot]), self.frame_function(np.array([new_key])))
+
+        label = self._labels[slot]
+        if label is not None:
+            label.xy = tuple(self._offsets[slot])
+            label.stale = True
+
+        self._update_artists([slot], draw)
+        return new_key
+
+    def set_hidden(self, slot, hidden=True, draw=False):
+        """
+        Скрывает строку slot в общих артистах слоёв (данные строки сохраняются).
+
+        Args:
+            slot: слот точки
+            hidden: скрыть (True) или показать (False)
+            draw: запросить ли перерисовку
+        """
+        if hidden:
+            self._hidden.add(slot)
+        else:
+            self._hidden.discard(slot)
+        self._update_artists([slot], draw)
+
+    def create_overlay(self, slot):
+        """
+        Отдельные артисты одной точки для рисования поверх фона (blit).
+
+        Артисты создаются со стилями слоёв и animated=True, поэтому при
+        полной перерисовке холста они не рисуются и не попадают в фон.
+        Подпись точки на время существования накладки тоже анимируется.
+
+        Args:
+            slot: слот точки
+
+        Returns:
+            dict: {слой: артист}, 'label' — подпись точки (или None)
+        """
+        overlay = self._make_artists(animated=True)
+        overlay['label'] = self._labels[slot]
+        if overlay['label'] is not None:
+            overlay['label'].set_animated(True)
+        self.update_overlay(overlay, slot)
+        return overlay
+
+    def update_overlay(self, overlay, slot):
+        """Передаёт артистам накладки текущую строку slot — O(1)."""
+        for name, offsets in self._offset_layers():
+            overlay[name].set_offsets(offsets[slot:slot + 1])
+        for name, segments in self._segment_layers():
+            overlay[name].set_segments(segments[slot:slot + 1])
+
+    def remove_overlay(self, overlay):
+        """Удаляет артисты накладки, подпись возвращается в обычный режим."""
+        for name, artist in overlay.items():
+            if name == 'label':
+                if artist is not None:
+                    artist.set_animated(False)
+            else:
+                artist.remove()
+
+    def get_table(self):
+        """
+        Возвращает данные точек сцены.
+
+        Returns:
+            dict: {столбец: numpy.ndarray} — представления заполненных строк
+        """
+        return {name: self.columns[name][:self._count] for name in SCENE_COLUMNS}
+
+    def find_slot(self, theta):
+        """Слот точки по её θ (или None)."""
+        return self._slots.get(float(theta))
+
+    def theta_at(self, slot):
+        """θ точки в слоте."""
+        return self._keys[slot]
+
+
+def add_scene_legend(ax):
+    """
+    Добавляет слои сцены в легенду.
+
+    Args:
+        ax: объект осей matplotlib
+    """
+    from visualization_points import add_points_legend
+    from visualization_tangents import add_tangents_legend
+    from visualization_normals import add_normals_legend
+    from visualization_curvature import add_curvature_legend
+    from visualization_evolute import add_evolute_legend
+
+    add_points_legend(ax)
+    add_tangents_legend(ax)
+    add_normals_legend(ax)
+    add_curvature_legend(ax)
+    add_evolute_legend(ax)
+
+
+if __name__ == '__main__':
+    from visualization_base import create_figure, draw_curve, setup_axes
+    from point_selector import select_random_points
+
+    fig, ax = create_figure()
+    draw_curve(ax)
+
+    scene = CurveScene(ax, select_random_points(10))
+    added, removed = scene.set_points(np.concatenate([
+        select_random_points(10)[:5], select_random_points(5, seed=7)]))
+    print(f"Добавлено точек: {added}, удалено: {removed}")
+
+    add_scene_legend(ax)
+    setup_axes(ax, title='Сцена с инкрементальным обновлением')
+    ax.legend(fontsize=12, loc='upper right')
+
+    plt.show()
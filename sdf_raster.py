@@ -0,0 +1,318 @@
+"""Растеризация знакового расстояния до кривой (фон-тепловая карта)"""
+
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from curve_definition import r_function, get_cartesian_coordinates, get_curve_coefficients
+from curve_math import project_point_to_curve
+from curve_derivatives import cartesian_derivatives
+from instrumentation import instrumented
+from spatial_index import CurveSpatialIndex
+from support_function import bounding_box
+from config import (SDF_RESOLUTION, SDF_NUM_SAMPLES, SDF_TILE_SIZE, SDF_PADDING,
+                    SDF_LEAF_SIZE, SDF_NEWTON_ITERATIONS, SDF_MAX_WORKERS, SDF_CACHE_SIZE,
+                    SDF_CMAP, SDF_ALPHA)
+
+# Прямоугольник, у которого кандидатами оказываются больше TILE_MAX_LEAVES
+# листьев индекса, делится, пока сторона не меньше TILE_MIN_SIZE пикселей
+TILE_MAX_LEAVES = 8
+TILE_MIN_SIZE = 16
+
+# Результаты последних вызовов rasterize_sdf: ключ — параметры и коэффициенты
+_cache = OrderedDict()
+
+
+def default_extent(padding=None):
+    """
+    Область растра по умолчанию — ограничивающий прямоугольник кривой с полями.
+
+    Returns:
+        tuple: (xmin, xmax, ymin, ymax)
+    """
+    if padding is None:
+        padding = SDF_PADDING
+
+    return bounding_box(padding)
+
+
+class _Samples:
+    """
+    Выборка кривой: индекс ближайшей вершины и отрезки ломаной.
+
+    vertex_gap — оценка сверху расстояния от любой точки кривой до
+    ближайшей вершины: половина наибольшей длины дуги между соседними
+    вершинами (max|P'|·Δθ / 2 с запасом на участки между узлами).
+    """
+
+    def __init__(self, num_samples):
+        self.theta = np.linspace(0, 2 * np.pi, num_samples, endpoint=False)
+        self.x, self.y = get_cartesian_coordinates(self.theta)
+        (_, dx), (_, dy) = cartesian_derivatives(self.theta, 1)
+        self.vertex_gap = 0.5 * 1.25 * np.hypot(dx, dy).max() * (2 * np.pi / num_samples)
+        self.index = CurveSpatialIndex(self.x, self.y, leaf_size=SDF_LEAF_SIZE)
+        # Для выбора ближайшей вершины достаточно float32
+        self.x32, self.y32 = self.x.astype(np.float32), self.y.astype(np.float32)
+
+    def segment_distance(self, px, py, i, j):
+        """Расстояние от точек до отрезков (i, j) ломаной."""
+        ax, ay = self.x[i], self.y[i]
+        sx, sy = self.x[j] - ax, self.y[j] - ay
+        t = np.clip(((px - ax) * sx + (py - ay) * sy) / (sx**2 + sy**2), 0.0, 1.0)
+        return np.hypot(px - ax - t * sx, py - ay - t * sy)
+
+
+def _inside(px, py):
+    """Полярная проверка принадлежности: ρ < r(φ)."""
+    return np.hypot(px, py) < r_function(np.arctan2(py, px))
+
+
+def _leaf_sdf(samples, xs, ys, leaves, single_side, refine, iterations):
+    """Знаковое расстояние для прямоугольника пикселей по вершинам заданных листьев."""
+    candidates = samples.index.leaf_points(leaves)
+
+    px, py = np.meshgrid(xs, ys)
+    px, py = px.ravel(), py.ravel()
+
+    px32, py32 = px.astype(np.float32), py.astype(np.float32)
+    d2 = ((px32[:, np.newaxis] - samples.x32[candidates]) ** 2 +
+          (py32[:, np.newaxis] - samples.y32[candidates]) ** 2)
+    nearest = candidates[np.argmin(d2, axis=1)]
+
+    # Расстояние до двух отрезков ломаной, примыкающих к ближайшей вершине
+    n = len(samples.x)
+    distance = np.minimum(samples.segment_distance(px, py, nearest, (nearest + 1) % n),
+                          samples.segment_distance(px, py, (nearest - 1) % n, nearest))
+
+    if refine:
+        theta = project_point_to_curve(px, py, samples.theta[nearest], iterations)
+        x, y = get_cartesian_coordinates(theta)
+        distance = np.minimum(distance, np.hypot(x - px, y - py))
+
+    if single_side:
+        inside = bool(_inside(0.5 * (xs[0] + xs[-1]), 0.5 * (ys[0] + ys[-1])))
+    else:
+        inside = _inside(px, py)
+
+    return np.where(inside, -distance, distance).reshape(len(ys), len(xs))
+
+
+def _tile_sdf(samples, xs, ys, refine, iterations):
+    """
+    Знаковое расстояние для одного тайла (отрицательное внутри кривой).
+
+    Расстояние D от центра прямоугольника до ближайшей вершины
+    ограничивает кандидатов: ближайшая вершина любого пикселя лежит
+    в круге радиуса D + 2h вокруг центра (h — полудиагональ). Прямоугольники,
+    у которых в этот круг попадает много листьев индекса (крупные или
+    у срединной оси), делятся на четыре; все прямоугольники одного уровня
+    проверяются одним векторизованным запросом. Расстояние от центра до
+    самой кривой не меньше D − vertex_gap, поэтому если D − vertex_gap > h,
+    прямоугольник целиком по одну сторону кривой и знак определяется
+    одной проверкой.
+    """
+    sdf = np.empty((len(ys), len(xs)))
+
+    # Прямоугольники текущего уровня: [r0, r1) × [c0, c1)
+    r0, r1 = np.array([0]), np.array([len(ys)])
+    c0, c1 = np.array([0]), np.array([len(xs)])
+
+    while r0.size:
+        cx = 0.5 * (xs[c0] + xs[c1 - 1])
+        cy = 0.5 * (ys[r0] + ys[r1 - 1])
+        h = 0.5 * np.hypot(xs[c1 - 1] - xs[c0], ys[r1 - 1] - ys[r0])
+        _, center_dist = samples.index.query(cx, cy)
+        leaves = samples.index.leaves_within(cx, cy, center_dist + 2 * h)
+
+        split = ((leaves.sum(axis=1) > TILE_MAX_LEAVES) &
+                 (np.minimum(r1 - r0, c1 - c0) >= 2 * TILE_MIN_SIZE))
+
+        for k in np.flatnonzero(~split):
+            rows, cols = slice(r0[k], r1[k]), slice(c0[k], c1[k])
+            sdf[rows, cols] = _leaf_sdf(samples, xs[cols], ys[rows], leaves[k],
+                                        center_dist[k] - samples.vertex_gap > h[k],
+                                        refine, iterations)
+
+        r0, r1, c0, c1 = r0[split], r1[split], c0[split], c1[split]
+        rm, cm = (r0 + r1) // 2, (c0 + c1) // 2
+        r0, r1, c0, c1 = (np.concatenate([r0, r0, rm, rm]), np.concatenate([rm, rm, r1, r1]),
+                          np.concatenate([c0, cm, c0, cm]), np.concatenate([cm, c1, cm, c1]))
+
+    return sdf
+
+
+@instrumented
+def rasterize_sdf(extent=None, resolution=None, num_samples=None, refine=False,
+                  iterations=None, tile_size=None, max_workers=None, use_cache=True):
+    """
+    Вычисляет знаковое расстояние до кривой на регулярной сетке.
+
+    Знак — полярная проверка ρ < r(φ) (кривая звёздная относительно
+    начала координат), модуль — расстояние до ломаной из num_samples
+    вершин через CurveSpatialIndex, при refine=True — уточнение
+    проекции методом Ньютона (project_point_to_curve).
+    Сетка обрабатывается тайлами tile_size × tile_size в пуле потоков,
+    так что память ограничена размером тайла и числом потоков.
+
+    Args:
+        extent: (xmin, xmax, ymin, ymax) (по умолчанию — default_extent())
+        resolution: пикселей по длинной стороне (по умолчанию из config)
+                    или пара (ширина, высота)
+        num_samples: вершин ломаной (по умолчанию из config)
+        refine: уточнять ли расстояние методом Ньютона
+        iterations: шагов Ньютона (по умолчанию из config)
+        tile_size: размер тайла в пикселях (по умолчанию из config)
+        max_workers: потоков (по умолчанию из config; None — по числу ядер)
+        use_cache: использовать ли кэш последних результатов
+
+    Returns:
+        numpy.ndarray: массив (высота, ширина) float32, строка 0 — ymin
+                       (для imshow с origin='lower'); только для чтения
+    """
+    if extent is None:
+        extent = default_extent()
+    if resolution is None:
+        resolution = SDF_RESOLUTION
+    if num_samples is None:
+        num_samples = SDF_NUM_SAMPLES
+    if iterations is None:
+        iterations = SDF_NEWTON_ITERATIONS
+    if tile_size is None:
+        tile_size = SDF_TILE_SIZE
+    if max_workers is None:
+        max_workers = SDF_MAX_WORKERS or os.cpu_count()
+
+    xmin, xmax, ymin, ymax = (float(v) for v in extent)
+    if np.isscalar(resolution):
+        scale = resolution / max(xmax - xmin, ymax - ymin)
+        width = max(1, int(round((xmax - xmin) * scale)))
+        height = max(1, int(round((ymax - ymin) * scale)))
+    else:
+        width, height = (int(v) for v in resolution)
+
+    key = ((xmin, xmax, ymin, ymax), width, height, num_samples, bool(refine),
+           iterations if refine else None, get_curve_coefficients().tobytes())
+    if use_cache and key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+
+    # Центры пикселей
+    xs = xmin + (np.arange(width) + 0.5) * (xmax - xmin) / width
+    ys = ymin + (np.arange(height) + 0.5) * (ymax - ymin) / height
+
+    samples = _Samples(num_samples)
+    sdf = np.empty((height, width), dtype=np.float32)
+
+    def work(tile):
+        row, col = tile
+        rows = slice(row, row + tile_size)
+        cols = slice(col, col + tile_size)
+        sdf[rows, cols] = _tile_sdf(samples, xs[cols], ys[rows], refine, iterations)
+
+    tiles = [(row, col) for row in range(0, height, tile_size)
+             for col in range(0, width, tile_size)]
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(work, tiles))
+    else:
+        for tile in tiles:
+            work(tile)
+
+    sdf.flags.writeable = False
+    if use_cache:
+        _cache[key] = sdf
+        while len(_cache) > SDF_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+    return sdf
+
+
+def sign_mismatches(sdf, extent=None):
+    """
+    Число пикселей растра, знак которых расходится с полярной проверкой
+    принадлежности (ρ < r(φ)) в центре пикселя.
+
+    Args:
+        sdf: результат rasterize_sdf
+        extent: область растра (по умолчанию — default_extent())
+
+    Returns:
+        int: количество пикселей с неверным знаком
+    """
+    if extent is None:
+        extent = default_extent()
+
+    xmin, xmax, ymin, ymax = (float(v) for v in extent)
+    height, width = sdf.shape
+    xs = xmin + (np.arange(width) + 0.5) * (xmax - xmin) / width
+    ys = ymin + (np.arange(height) + 0.5) * (ymax - ymin) / height
+    px, py = np.meshgrid(xs, ys)
+
+    return int(np.count_nonzero((sdf < 0) != _inside(px, py)))
+
+
+def clear_sdf_cache():
+    """Очищает кэш растров."""
+    _cache.clear()
+
+
+def add_sdf_background(ax, extent=None, resolution=None, tolerance=None,
+                       cmap=None, alpha=None, **kwargs):
+    """
+    Добавляет тепловую карту знакового расстояния фоном графика.
+
+    Args:
+        ax: объект осей matplotlib
+        extent: (xmin, xmax, ymin, ymax) (по умолчанию — default_extent())
+        resolution: пикселей по длинной стороне (по умолчанию из config)
+        tolerance: если задан — контуры уровней ±tolerance
+        cmap: цветовая карта (по умолчанию из config)
+        alpha: прозрачность (по умолчанию из config)
+        **kwargs: аргументы для rasterize_sdf
+
+    Returns:
+        AxesImage: объект изображения
+    """
+    if extent is None:
+        extent = default_extent()
+    if cmap is None:
+        cmap = SDF_CMAP
+    if alpha is None:
+        alpha = SDF_ALPHA
+
+    sdf = rasterize_sdf(extent, resolution, **kwargs)
+    limit = float(np.abs(sdf).max())
+
+    image = ax.imshow(sdf, extent=extent, origin='lower', cmap=cmap,
+                      vmin=-limit, vmax=limit, alpha=alpha, zorder=0,
+                      interpolation='bilinear')
+
+    if tolerance is not None:
+        ax.contour(sdf, levels=[-tolerance, tolerance], extent=extent,
+                   origin='lower', colors='black', linewidths=0.6,
+                   linestyles='dashed', zorder=1)
+
+    return image
+
+
+if __name__ == '__main__':
+    import time
+    import matplotlib.pyplot as plt
+    from visualization_base import create_figure, draw_curve, setup_axes
+
+    start = time.perf_counter()
+    rasterize_sdf(resolution=4096)
+    print(f"SDF 4096²: {time.perf_counter() - start:.2f} с")
+
+    # Редкая ломаная: кривая проходит между вершинами далеко от них
+    coarse = rasterize_sdf(resolution=2048, num_samples=64, use_cache=False)
+    print(f"Пикселей с неверным знаком (64 вершины): {sign_mismatches(coarse)}")
+
+    fig, ax = create_figure()
+    image = add_sdf_background(ax, tolerance=0.05)
+    draw_curve(ax, show_fill=False)
+    fig.colorbar(image, ax=ax, label='Знаковое расстояние')
+    setup_axes(ax, title='Знаковое расстояние до кривой')
+    plt.show()
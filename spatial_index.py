@@ -0,0 +1,330 @@
+"""Пространственный индекс по точкам кривой — поиск ближайшей точки"""
+
+import numpy as np
+from config import SPATIAL_INDEX_LEAF_SIZE
+
+# Ограничение размера промежуточных массивов (запросы × узлы, запросы × точки листа)
+QUERY_BLOCK_ELEMENTS = 1 << 22
+
+
+def _enclosing_circles(cx, cy, radius):
+    """
+    Окружности, охватывающие соседние пары (2j, 2j+1) окружностей уровня.
+
+    Для пары (c₁, ρ₁), (c₂, ρ₂) на расстоянии d: если одна лежит внутри
+    другой — берётся большая, иначе R = (d + ρ₁ + ρ₂)/2, центр на отрезке
+    c₁c₂ на расстоянии R − ρ₁ от c₁. Непарная последняя окружность
+    переходит на уровень выше без изменений.
+
+    Returns:
+        tuple: (центры x, центры y, радиусы) уровня выше
+    """
+    pairs = len(cx) // 2
+    x1, y1, r1 = cx[0:2 * pairs:2], cy[0:2 * pairs:2], radius[0:2 * pairs:2]
+    x2, y2, r2 = cx[1:2 * pairs:2], cy[1:2 * pairs:2], radius[1:2 * pairs:2]
+
+    d = np.hypot(x2 - x1, y2 - y1)
+    big = 0.5 * (d + r1 + r2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shift = np.where(d > 0, (big - r1) / d, 0.0)
+    px, py, pr = x1 + shift * (x2 - x1), y1 + shift * (y2 - y1), big
+
+    first_holds = d + r2 <= r1
+    second_holds = d + r1 <= r2
+    px = np.where(first_holds, x1, np.where(second_holds, x2, px))
+    py = np.where(first_holds, y1, np.where(second_holds, y2, py))
+    pr = np.where(first_holds, r1, np.where(second_holds, r2, pr))
+
+    if len(cx) % 2:
+        px, py, pr = np.append(px, cx[-1]), np.append(py, cy[-1]), np.append(pr, radius[-1])
+    return px, py, pr
+
+
+# Спуск по дереву начинается с уровня, где не больше стольких узлов: на малых
+# уровнях одна плотная матрица (запросы × узлы) дешевле пошагового спуска
+DESCENT_START_NODES = 64
+
+
+def _group_flags(groups):
+    """Признаки начала групп одинаковых значений в неубывающем массиве."""
+    flags = np.empty(len(groups), dtype=bool)
+    flags[:1] = True
+    np.not_equal(groups[1:], groups[:-1], out=flags[1:])
+    return flags
+
+
+class CurveSpatialIndex:
+    """
+    Иерархия ограничивающих окружностей над точками кривой.
+
+    Точки кривой идут подряд по θ, поэтому соседние точки образуют
+    компактные «листья» по leaf_size штук. Для каждого листа хранится
+    ограничивающая окружность (центр и радиус), соседние листья
+    попарно объединяются охватывающими окружностями до корня — получается
+    двоичное дерево глубины ⌈log₂(число листьев)⌉.
+
+    Поиск спускается по дереву сразу для всего массива запросов. Первый
+    уровень спуска (не больше DESCENT_START_NODES узлов) проверяется
+    целиком, дальше на каждом уровне у оставшихся узлов берутся дети, и
+    ребёнок отбрасывается, если нижняя оценка |q − c| − ρ больше
+    наименьшей по этому запросу верхней оценки |q − c| + ρ (в узле есть
+    точка не дальше неё). Для точки рядом с кривой на каждом уровне
+    остаётся несколько узлов, поэтому поиск занимает O(log n) на запрос.
+    Поиск точный.
+
+    Использование:
+        table = get_frame_table(theta)
+        index = CurveSpatialIndex(table['x'], table['y'])
+        idx, dist = index.query(x_mouse, y_mouse)
+    """
+
+    def __init__(self, x, y, leaf_size=None):
+        """
+        Построение индекса.
+
+        Args:
+            x, y: координаты точек кривой (упорядочены по θ)
+            leaf_size: точек в одном листе (по умолчанию из config)
+        """
+        if leaf_size is None:
+            leaf_size = SPATIAL_INDEX_LEAF_SIZE
+
+        self.x = np.asarray(x, dtype=float).ravel()
+        self.y = np.asarray(y, dtype=float).ravel()
+        self.leaf_size = leaf_size
+
+        n = len(self.x)
+        num_leaves = -(-n // leaf_size)
+
+        # Дополняем до целого числа листьев фиктивной точкой на бесконечности
+        self._x_ext = np.append(self.x, np.inf)
+        self._y_ext = np.append(self.y, np.inf)
+        leaves = np.full(num_leaves * leaf_size, n)
+        leaves[:n] = np.arange(n)
+        self._leaves = leaves.reshape(num_leaves, leaf_size)
+
+        # Ограничивающие окружности листьев
+        valid = self._leaves < n
+        counts = valid.sum(axis=1)
+        lx = np.where(valid, self._x_ext[self._leaves], 0.0)
+        ly = np.where(valid, self._y_ext[self._leaves], 0.0)
+        self.leaf_center_x = lx.sum(axis=1) / counts
+        self.leaf_center_y = ly.sum(axis=1) / counts
+        spread = np.hypot(lx - self.leaf_center_x[:, np.newaxis],
+                          ly - self.leaf_center_y[:, np.newaxis])
+        self.leaf_radius = np.where(valid, spread, 0.0).max(axis=1)
+
+        # Уровни дерева от листьев к корню; хранятся подряд от корня к листьям,
+        # узел j уровня имеет детей 2j и 2j + 1 на следующем уровне
+        levels = [(self.leaf_center_x, self.leaf_center_y, self.leaf_radius)]
+        while len(levels[-1][0]) > 1:
+            levels.append(_enclosing_circles(*levels[-1]))
+        levels.reverse()
+
+        self._node_x = np.concatenate([level[0] for level in levels])
+        self._node_y = np.concatenate([level[1] for level in levels])
+        self._node_radius = np.concatenate([level[2] for level in levels])
+        self._level_offsets = np.cumsum([0] + [len(level[0]) for level in levels])
+
+    # Массивы, полностью описывающие построенный индекс
+    _ARRAYS = ('x', 'y', '_x_ext', '_y_ext', '_leaves',
+               'leaf_center_x', 'leaf_center_y', 'leaf_radius',
+               '_node_x', '_node_y', '_node_radius', '_level_offsets')
+
+    def to_arrays(self):
+        """
+        Массивы индекса для сохранения (например, в warm_cache).
+
+        Returns:
+            dict: {имя: массив}
+        """
+        arrays = {name.lstrip('_'): getattr(self, name) for name in self._ARRAYS}
+        arrays['leaf_size'] = np.array(self.leaf_size)
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Восстанавливает индекс из массивов to_arrays без перестроения.
+
+        Массивы используются как есть (в том числе отображённые в память).
+        """
+        index = cls.__new__(cls)
+        for name in cls._ARRAYS:
+            setattr(index, name, arrays[name.lstrip('_')])
+        index.leaf_size = int(arrays['leaf_size'])
+        return index
+
+    def __len__(self):
+        return len(self.x)
+
+    def _descend(self, qx, qy, radius=None):
+        """
+        Спуск по дереву для массива запросов.
+
+        Args:
+            qx, qy: координаты запросов (одномерные массивы)
+            radius: если задан — оставлять узлы, пересекающие круги
+                    запросов этого радиуса (массив); иначе — узлы, которые
+                    могут содержать ближайшую точку
+
+        Returns:
+            tuple: (номера запросов, номера листьев, нижние оценки
+                   расстояния) — пары, упорядоченные по номеру запроса
+        """
+        offsets = self._level_offsets
+        level = np.searchsorted(np.diff(offsets), DESCENT_START_NODES, side='right') - 1
+        level = max(int(level), 0)
+
+        if radius is not None:
+            radius = np.asarray(radius, dtype=float)
+
+        # Первый уровень спуска — плотная матрица (запросы × узлы уровня)
+        nodes = slice(offsets[level], offsets[level + 1])
+        distance = np.hypot(qx[:, np.newaxis] - self._node_x[nodes],
+                            qy[:, np.newaxis] - self._node_y[nodes])
+        lower = distance - self._node_radius[nodes]
+        if radius is None:
+            bound = (distance + self._node_radius[nodes]).min(axis=1)
+            keep = lower <= bound[:, np.newaxis]
+        else:
+            keep = lower <= radius[:, np.newaxis]
+        query, node = np.nonzero(keep)
+        lower = lower[keep]
+
+        # Дальше — по парам (запрос, узел): дети оставшихся узлов
+        for level in range(level + 1, len(offsets) - 1):
+            start, count = offsets[level], offsets[level + 1] - offsets[level]
+            query = np.repeat(query, 2)
+            node = (2 * node[:, np.newaxis] + np.arange(2)).ravel()
+            exists = node < count
+            query, node = query[exists], node[exists]
+
+            distance = np.hypot(qx[query] - self._node_x[start + node],
+                                qy[query] - self._node_y[start + node])
+            node_radius = self._node_radius[start + node]
+            lower = distance - node_radius
+            if radius is None:
+                flags = _group_flags(query)
+                bound = np.minimum.reduceat(distance + node_radius, np.flatnonzero(flags))
+                keep = lower <= bound[np.cumsum(flags) - 1]
+            else:
+                keep = lower <= radius[query]
+            query, node, lower = query[keep], node[keep], lower[keep]
+
+        return query, node, lower
+
+    def query(self, qx, qy):
+        """
+        Находит ближайшую точку кривой для каждого запроса.
+
+        Args:
+            qx, qy: координаты запросов (скаляры или массивы одной формы)
+
+        Returns:
+            tuple: (индексы ближайших точек, расстояния) той же формы, что qx
+        """
+        qx = np.asarray(qx, dtype=float)
+        qy = np.asarray(qy, dtype=float)
+        shape = np.broadcast(qx, qy).shape
+        qx = np.broadcast_to(qx, shape).ravel()
+        qy = np.broadcast_to(qy, shape).ravel()
+
+        indices = np.empty(qx.size, dtype=np.intp)
+        distances = np.empty(qx.size)
+
+        block = max(1, QUERY_BLOCK_ELEMENTS // max(self.leaf_size, DESCENT_START_NODES))
+        for start in range(0, qx.size, block):
+            stop = start + block
+            indices[start:stop], distances[start:stop] = self._query_block(
+                qx[start:stop], qy[start:stop])
+
+        return indices.reshape(shape), distances.reshape(shape)
+
+    def _leaf_nearest(self, qx, qy, query, leaf):
+        """Ближайшая точка в листе leaf для каждой пары (запрос, лист)."""
+        candidates = self._leaves[leaf]
+        d2 = ((self._x_ext[candidates] - qx[query, np.newaxis]) ** 2 +
+              (self._y_ext[candidates] - qy[query, np.newaxis]) ** 2)
+        k = np.argmin(d2, axis=1)
+        return candidates[np.arange(len(leaf)), k], d2[np.arange(len(leaf)), k]
+
+    def _query_block(self, qx, qy):
+        """
+        Точный поиск для блока запросов.
+
+        После спуска по дереву сначала перебираются точки листа с
+        наименьшей нижней оценкой — это даёт точное расстояние-кандидат;
+        остальные листья проверяются, только если их оценка меньше его.
+        """
+        query, leaf, lower = self._descend(qx, qy)
+
+        # Пары упорядочены по запросу, у каждого запроса есть хотя бы одна:
+        # первая пара группы после сортировки по оценке — лучший лист
+        order = np.lexsort((lower, query))
+        first = order[_group_flags(query[order])]
+        best, best_d2 = self._leaf_nearest(qx, qy, query[first], leaf[first])
+
+        rest = np.maximum(lower, 0.0) ** 2 < best_d2[query]
+        rest[first] = False
+        if rest.any():
+            query, leaf = query[rest], leaf[rest]
+            points, d2 = self._leaf_nearest(qx, qy, query, leaf)
+            order = np.lexsort((d2, query))
+            winners = order[_group_flags(query[order])]
+            improved = winners[d2[winners] < best_d2[query[winners]]]
+            best[query[improved]] = points[improved]
+            best_d2[query[improved]] = d2[improved]
+
+        return best, np.sqrt(best_d2)
+
+    def query_radius(self, x, y, radius):
+        """
+        Находит все точки кривой в круге радиуса radius вокруг (x, y).
+
+        Args:
+            x, y: центр круга (скаляры)
+            radius: радиус поиска
+
+        Returns:
+            numpy.ndarray: индексы точек
+        """
+        _, leaf, _ = self._descend(np.array([float(x)]), np.array([float(y)]),
+                                   radius=np.array([float(radius)]))
+        points = self._leaves[leaf].ravel()
+        points = points[points < len(self.x)]
+
+        inside = np.hypot(self.x[points] - x, self.y[points] - y) <= radius
+        return np.sort(points[inside])
+
+    def leaves_within(self, x, y, radius):
+        """
+        Отбирает листья, которые могут содержать точки в кругах запросов.
+
+        Args:
+            x, y, radius: центры и радиусы кругов (массивы одной длины)
+
+        Returns:
+            numpy.ndarray: булева матрица (запросы × листья)
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        radius = np.broadcast_to(np.asarray(radius, dtype=float), x.shape)
+
+        query, leaf, _ = self._descend(x, y, radius=radius)
+        within = np.zeros((len(x), len(self.leaf_radius)), dtype=bool)
+        within[query, leaf] = True
+        return within
+
+    def leaf_points(self, leaves):
+        """
+        Индексы точек, входящих в заданные листья.
+
+        Args:
+            leaves: номера листьев или булева маска листьев
+
+        Returns:
+            numpy.ndarray: индексы точек
+        """
+        points = self._leaves[leaves].ravel()
+        return points[points < len(self.x)]
@@ -0,0 +1,292 @@
+"""Опорная функция кривой: точные габариты, минимальная ширина и выпуклая оболочка"""
+
+from collections import OrderedDict
+
+import numpy as np
+from curve_definition import get_curve_coefficients, get_cartesian_coordinates
+from curve_derivatives import cartesian_derivatives
+from instrumentation import instrumented
+from config import (SUPPORT_SAMPLES_PER_HARMONIC, SUPPORT_MIN_SAMPLES,
+                    SUPPORT_NEWTON_ITERATIONS, SUPPORT_DIRECTIONS,
+                    SUPPORT_BISECTION_STEPS)
+
+# Грубые сетки по коэффициентам кривой (последние использованные)
+_cache = OrderedDict()
+_CACHE_SIZE = 4
+
+# Золотое сечение для уточнения минимальной ширины
+_GOLDEN = (np.sqrt(5) - 1) / 2
+
+
+class _CoarseSampling:
+    """Грубая сетка θ: узлы и точки кривой для выбора начального приближения."""
+
+    def __init__(self, num_samples):
+        self.step = 2 * np.pi / num_samples
+        self.theta = np.arange(num_samples) * self.step
+        self.points = np.column_stack(get_cartesian_coordinates(self.theta))
+
+
+def _sampling():
+    """Грубая сетка для активных коэффициентов (из кэша, если уже построена)."""
+    coeffs = get_curve_coefficients()
+    key = coeffs.tobytes()
+    if key not in _cache:
+        num_samples = max(SUPPORT_MIN_SAMPLES, SUPPORT_SAMPLES_PER_HARMONIC * coeffs.shape[1])
+        _cache[key] = _CoarseSampling(num_samples)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    _cache.move_to_end(key)
+    return _cache[key]
+
+
+def _refine_maximum(sampling, nodes, phi, iterations):
+    """
+    Уточняет максимум ⟨P(θ), u⟩ около узлов грубой сетки методом Ньютона.
+
+    Returns:
+        tuple: (θ в [0, 2π), значение ⟨P(θ), u⟩)
+    """
+    ux, uy = np.cos(phi), np.sin(phi)
+    theta = sampling.theta[nodes]
+    a, b = theta - sampling.step, theta + sampling.step
+
+    for _ in range(iterations):
+        x_derivs, y_derivs = cartesian_derivatives(theta, 2)
+        slope = x_derivs[1] * ux + y_derivs[1] * uy
+        bend = x_derivs[2] * ux + y_derivs[2] * uy
+
+        # Максимум правее, если ⟨P', u⟩ > 0
+        rising = slope > 0
+        a = np.where(rising, theta, a)
+        b = np.where(rising, b, theta)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = theta - slope / bend
+        inside = (bend < 0) & (step >= a) & (step <= b)
+        new_theta = np.where(inside, step, 0.5 * (a + b))
+
+        converged = not phi.size or np.abs(new_theta - theta).max() <= 1e-15
+        theta = new_theta
+        if converged:
+            break
+
+    theta = np.mod(theta, 2 * np.pi)
+    x, y = get_cartesian_coordinates(theta)
+    return theta, x * ux + y * uy
+
+
+@instrumented
+def support_function(angles, iterations=None):
+    """
+    Опорная функция h(φ) = max_θ ⟨P(θ), u⟩, u = (cos φ, sin φ).
+
+    Максимум ищется среди корней ⟨P'(θ), u⟩ = 0: на грубой сетке θ
+    (SUPPORT_SAMPLES_PER_HARMONIC узлов на гармонику) выбираются два
+    лучших локальных максимума, затем каждый уточняется векторизованным
+    методом Ньютона (вторая производная ⟨P''(θ), u⟩) в интервале соседних
+    узлов; шаг, выводящий из интервала или направленный к минимуму,
+    заменяется делением пополам. Из двух уточнённых берётся больший.
+
+    Args:
+        angles: направления φ (скаляр или массив)
+        iterations: максимум шагов Ньютона (по умолчанию из config)
+
+    Returns:
+        dict: 'value' — h(φ), 'theta' — θ опорной точки, 'x', 'y' — опорная точка
+    """
+    if iterations is None:
+        iterations = SUPPORT_NEWTON_ITERATIONS
+
+    angles = np.asarray(angles, dtype=float)
+    phi = angles.ravel()
+
+    # Два лучших локальных максимума грубой сетки: вблизи битангенсов
+    # лучший узел может принадлежать не тому «лепестку»
+    sampling = _sampling()
+    values = sampling.points @ np.vstack([np.cos(phi), np.sin(phi)])
+    peak = (values >= np.roll(values, 1, axis=0)) & (values >= np.roll(values, -1, axis=0))
+    values = np.where(peak, values, -np.inf)
+    second, best = np.argsort(values, axis=0)[-2:]
+    # Единственный максимум — уточняем его дважды
+    second = np.where(np.isfinite(values[second, np.arange(phi.size)]), second, best)
+
+    candidates = np.concatenate([best, second])
+    theta, value = _refine_maximum(sampling, candidates, np.tile(phi, 2), iterations)
+    pick = np.where(value[:phi.size] >= value[phi.size:], 0, phi.size) + np.arange(phi.size)
+    theta = theta[pick]
+
+    x, y = get_cartesian_coordinates(theta)
+    shape = angles.shape
+    return {'value': value[pick].reshape(shape), 'theta': theta.reshape(shape),
+            'x': x.reshape(shape), 'y': y.reshape(shape)}
+
+
+def bounding_box(padding=0.0):
+    """
+    Точный ограничивающий прямоугольник кривой (по опорной функции).
+
+    Args:
+        padding: поля с каждой стороны
+
+    Returns:
+        tuple: (xmin, xmax, ymin, ymax)
+    """
+    h = support_function(np.array([0.0, 0.5, 1.0, 1.5]) * np.pi)['value']
+    return (float(-h[2] - padding), float(h[0] + padding),
+            float(-h[3] - padding), float(h[1] + padding))
+
+
+def _box_corners(phi, support):
+    """Вершины прямоугольника с нормалями сторон u(φ), v(φ) и опорными значениями."""
+    u = np.array([np.cos(phi), np.sin(phi)])
+    v = np.array([-np.sin(phi), np.cos(phi)])
+    h_u, h_v, h_mu, h_mv = support
+    return np.array([h_u * u + h_v * v, -h_mu * u + h_v * v,
+                     -h_mu * u - h_mv * v, h_u * u - h_mv * v])
+
+
+def minimum_width_box(num_directions=None):
+    """
+    Ориентированный прямоугольник минимальной ширины.
+
+    Ширина w(φ) = h(φ) + h(φ + π) вычисляется на num_directions
+    направлениях, минимум уточняется золотым сечением (w может иметь
+    изломы там, где опорная точка перескакивает через впадину).
+
+    Args:
+        num_directions: направлений на полном обороте (по умолчанию из config)
+
+    Returns:
+        dict: 'angle' — φ нормали к узким сторонам, 'width', 'length',
+              'corners' — массив (4, 2) вершин против часовой стрелки
+    """
+    if num_directions is None:
+        num_directions = SUPPORT_DIRECTIONS
+
+    def width(phi):
+        return support_function(np.concatenate([phi, phi + np.pi]))['value'].reshape(2, -1).sum(axis=0)
+
+    step = 2 * np.pi / num_directions
+    phi = np.arange(num_directions // 2) * step
+    best = phi[np.argmin(width(phi))]
+
+    lo, hi = best - step, best + step
+    left, right = hi - _GOLDEN * (hi - lo), lo + _GOLDEN * (hi - lo)
+    w_left, w_right = width(np.array([left, right]))
+    while hi - lo > 1e-12:
+        if w_left <= w_right:
+            hi, right, w_right = right, left, w_left
+            left = hi - _GOLDEN * (hi - lo)
+            w_left = width(np.array([left]))[0]
+        else:
+            lo, left, w_left = left, right, w_right
+            right = lo + _GOLDEN * (hi - lo)
+            w_right = width(np.array([right]))[0]
+
+    angle = np.mod(0.5 * (lo + hi), np.pi)
+    support = support_function(angle + np.array([0.0, 0.5, 1.0, 1.5]) * np.pi)['value']
+    return {'angle': float(angle),
+            'width': float(support[0] + support[2]),
+            'length': float(support[1] + support[3]),
+            'corners': _box_corners(angle, support)}
+
+
+@instrumented
+def convex_hull(num_directions=None, bisection_steps=None):
+    """
+    Вершины выпуклой оболочки кривой против часовой стрелки.
+
+    Опорные точки для num_directions направлений идут по оболочке
+    против часовой стрелки. Между соседними опорными точками кривая
+    либо выпукла (середина дуги снаружи хорды), либо уходит внутрь —
+    там оболочку замыкает отрезок битангенса. Направление битангенса
+    находится делением пополам между соседними направлениями, концы
+    битангенса — опорные точки по обе стороны от него.
+
+    Args:
+        num_directions: количество направлений (по умолчанию из config)
+        bisection_steps: делений пополам для битангенсов (по умолчанию из config)
+
+    Returns:
+        dict: 'theta', 'x', 'y' — вершины оболочки; 'bitangent' — True,
+              если отрезок от вершины к следующей — битангенс (не дуга кривой)
+    """
+    if num_directions is None:
+        num_directions = SUPPORT_DIRECTIONS
+    if bisection_steps is None:
+        bisection_steps = SUPPORT_BISECTION_STEPS
+
+    phi = np.arange(num_directions) * (2 * np.pi / num_directions)
+    support = support_function(phi)
+    theta, x, y = support['theta'], support['x'], support['y']
+    theta_next, x_next, y_next = np.roll(theta, -1), np.roll(x, -1), np.roll(y, -1)
+
+    # Середина дуги между опорными точками относительно хорды (внешняя нормаль хорды)
+    mid = theta + 0.5 * np.mod(theta_next - theta, 2 * np.pi)
+    mx, my = get_cartesian_coordinates(mid)
+    bulge = (mx - x) * (y_next - y) - (my - y) * (x_next - x)
+    jump = (bulge < 0) & (theta != theta_next)
+
+    # Битангенсы: направление, где опорная точка перескакивает через впадину
+    lo, hi = phi[jump], phi[jump] + 2 * np.pi / num_directions
+    start, end = theta[jump], theta_next[jump]
+    lo_theta, hi_theta = start.copy(), end.copy()
+    for _ in range(bisection_steps):
+        middle = 0.5 * (lo + hi)
+        t = support_function(middle)['theta']
+        # Ближе к дуге начала — опорная точка ещё до перескока
+        before = np.mod(t - start, 2 * np.pi) < np.mod(end - t, 2 * np.pi)
+        lo, lo_theta = np.where(before, middle, lo), np.where(before, t, lo_theta)
+        hi, hi_theta = np.where(before, hi, middle), np.where(before, hi_theta, t)
+
+    # Вершины: опорные точки и концы битангенсов в порядке направлений
+    order_phi = np.concatenate([phi, lo, hi])
+    vertices = np.concatenate([theta, lo_theta, hi_theta])
+    edge = np.concatenate([np.zeros(num_directions, dtype=bool),
+                           np.ones(len(lo), dtype=bool), np.zeros(len(hi), dtype=bool)])
+    order = np.argsort(order_phi, kind='stable')
+    vertices, edge = vertices[order], edge[order]
+
+    # Повторяющиеся опорные точки (углы оболочки) оставляем один раз
+    first = np.flatnonzero(np.r_[True, np.diff(vertices) != 0])
+    vertices, edge = vertices[first], np.logical_or.reduceat(edge, first)
+    if len(vertices) > 1 and vertices[-1] == vertices[0]:
+        edge[0] |= edge[-1]
+        vertices, edge = vertices[:-1], edge[:-1]
+
+    hx, hy = get_cartesian_coordinates(vertices)
+    return {'theta': vertices, 'x': hx, 'y': hy, 'bitangent': edge}
+
+
+if __name__ == '__main__':
+    import time
+    import matplotlib.pyplot as plt
+    from curve_definition import get_curve_points
+    from visualization_base import create_figure, draw_curve, setup_axes
+
+    start = time.perf_counter()
+    box = bounding_box()
+    print(f"Ограничивающий прямоугольник: x ∈ [{box[0]:.6f}, {box[1]:.6f}], "
+          f"y ∈ [{box[2]:.6f}, {box[3]:.6f}] ({1e3 * (time.perf_counter() - start):.1f} мс)")
+
+    _, x, y = get_curve_points(1000)
+    print(f"По 1000 точкам:               x ∈ [{x.min():.6f}, {x.max():.6f}], "
+          f"y ∈ [{y.min():.6f}, {y.max():.6f}]")
+
+    width_box = minimum_width_box()
+    hull = convex_hull()
+    print(f"Минимальная ширина {width_box['width']:.6f} при φ = {width_box['angle']:.4f}, "
+          f"оболочка: {len(hull['theta'])} вершин, {hull['bitangent'].sum()} битангенсов")
+
+    fig, ax = create_figure()
+    draw_curve(ax)
+    corners = np.vstack([width_box['corners'], width_box['corners'][:1]])
+    ax.plot(corners[:, 0], corners[:, 1], 'g--', linewidth=1.5, label='Минимальная ширина')
+    ax.plot(np.r_[hull['x'], hull['x'][0]], np.r_[hull['y'], hull['y'][0]],
+            'r-', linewidth=1.0, label='Выпуклая оболочка')
+    ax.add_patch(plt.Rectangle((box[0], box[2]), box[1] - box[0], box[3] - box[2],
+                               fill=False, linestyle=':', label='Габариты'))
+    setup_axes(ax, title='Опорная функция кривой')
+    ax.legend(fontsize=12, loc='upper right')
+    plt.show()
@@ -0,0 +1,297 @@
+"""Измерение отклика интерактивного графика без окна: воспроизведение событий"""
+
+import json
+import time
+
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import MouseEvent, KeyEvent
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+
+from curve_definition import get_curve_points
+from main import visualize_full_interactive
+from scene import CurveScene
+from config import (BENCHMARK_SCENE_SIZES, BENCHMARK_ZOOM_STEPS,
+                    BENCHMARK_PAN_STEPS, BENCHMARK_HOVER_STEPS,
+                    BENCHMARK_EDIT_SIZES, BENCHMARK_EDIT_MOVES, BENCHMARK_EDIT_MAX_GROWTH)
+
+
+def _use_agg_canvas(fig):
+    """
+    Переводит фигуру на холст Agg: замеры не зависят от бэкенда GUI
+    и не меняют глобальный бэкенд pyplot. Обработчики событий хранятся
+    в самой фигуре, поэтому остаются подключёнными.
+    """
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _axes_center(ax):
+    """Центр осей в координатах экрана."""
+    bbox = ax.bbox
+    return 0.5 * (bbox.x0 + bbox.x1), 0.5 * (bbox.y0 + bbox.y1)
+
+
+def zoom_script(ax, steps=None):
+    """
+    Zoom колёсиком: steps шагов приближения, затем столько же отдаления.
+
+    Returns:
+        list: события (имя, параметры)
+    """
+    if steps is None:
+        steps = BENCHMARK_ZOOM_STEPS
+
+    x, y = _axes_center(ax)
+    return ([('scroll_event', {'x': x, 'y': y, 'button': 'up', 'step': 1})] * steps +
+            [('scroll_event', {'x': x, 'y': y, 'button': 'down', 'step': -1})] * steps)
+
+
+def pan_script(ax, steps=None):
+    """
+    Pan средней кнопкой: нажатие, steps перемещений по окружности, отпускание.
+
+    Returns:
+        list: события (имя, параметры)
+    """
+    if steps is None:
+        steps = BENCHMARK_PAN_STEPS
+
+    x, y = _axes_center(ax)
+    radius = 0.25 * min(ax.bbox.width, ax.bbox.height)
+    angles = np.linspace(0, 2 * np.pi, steps)
+
+    events = [('button_press_event', {'x': x, 'y': y, 'button': 2})]
+    events += [('motion_notify_event', {'x': x + radius * np.sin(a),
+                                        'y': y + radius * (1 - np.cos(a))})
+               for a in angles]
+    events.append(('button_release_event', {'x': x, 'y': y, 'button': 2}))
+    return events
+
+
+def hover_script(ax, steps=None):
+    """
+    Движение курсора вдоль кривой (подсказка HoverInspector).
+
+    Returns:
+        list: события (имя, параметры)
+    """
+    if steps is None:
+        steps = BENCHMARK_HOVER_STEPS
+
+    _, x, y = get_curve_points(steps)
+    display = ax.transData.transform(np.column_stack([x, y]))
+    return [('motion_notify_event', {'x': px, 'y': py}) for px, py in display]
+
+
+def key_script(ax):
+    """
+    Клавиши: сетка вкл/выкл и сброс вида.
+
+    Returns:
+        list: события (имя, параметры)
+    """
+    x, y = _axes_center(ax)
+    return [('key_press_event', {'key': key, 'x': x, 'y': y})
+            for key in ('g', 'g', 'r')]
+
+
+# Сценарии по умолчанию: имя → функция построения событий
+SCRIPTS = {
+    'zoom': zoom_script,
+    'pan': pan_script,
+    'hover': hover_script,
+    'key': key_script,
+}
+
+
+def _make_event(canvas, name, params):
+    """Создаёт событие matplotlib так же, как его создаёт бэкенд GUI."""
+    params = dict(params)
+    if name == 'key_press_event':
+        return KeyEvent(name, canvas, params.pop('key'), **params)
+    return MouseEvent(name, canvas, **params)
+
+
+def replay(fig, events):
+    """
+    Воспроизводит события через обработчики холста и замеряет отклик.
+
+    Каждое событие передаётся всем подписчикам (canvas.callbacks.process —
+    те же вызовы, что делает бэкенд GUI), затем холст перерисовывается
+    принудительно. На холсте Agg draw_idle рисует сразу, поэтому на время
+    воспроизведения он, как в бэкендах GUI, только откладывает отрисовку —
+    иначе каждое событие рисовалось бы дважды.
+
+    Args:
+        fig: фигура с подключёнными обработчиками
+        events: список (имя события, параметры)
+
+    Returns:
+        dict: {'handler': секунды, 'draw': секунды, 'total': секунды} —
+              массивы по событиям
+    """
+    canvas = fig.canvas
+    canvas.draw()
+
+    handler = np.empty(len(events))
+    draw = np.empty(len(events))
+
+    canvas.draw_idle = lambda *args, **kwargs: None
+    try:
+        for i, (name, params) in enumerate(events):
+            event = _make_event(canvas, name, params)
+
+            start = time.perf_counter()
+            canvas.callbacks.process(name, event)
+            middle = time.perf_counter()
+            canvas.draw()
+            end = time.perf_counter()
+
+            handler[i] = middle - start
+            draw[i] = end - middle
+    finally:
+        del canvas.draw_idle
+
+    return {'handler': handler, 'draw': draw, 'total': handler + draw}
+
+
+def latency_percentiles(seconds):
+    """
+    Перцентили задержки в миллисекундах.
+
+    Returns:
+        dict: p50, p95, p99, max и число событий
+    """
+    ms = 1e3 * np.asarray(seconds)
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {'p50': float(p50), 'p95': float(p95), 'p99': float(p99),
+            'max': float(ms.max()), 'count': int(ms.size)}
+
+
+def run_benchmark(scene_sizes=None, scripts=None):
+    """
+    Строит полную сцену для каждого размера и воспроизводит сценарии
+    на холсте Agg (без окна, при любом активном бэкенде).
+
+    Args:
+        scene_sizes: количества точек на кривой (по умолчанию из config)
+        scripts: {имя: функция(ax) -> события} (по умолчанию SCRIPTS)
+
+    Returns:
+        dict: {размер: {сценарий: {'handler'|'draw'|'total': перцентили}}}
+    """
+    if scene_sizes is None:
+        scene_sizes = BENCHMARK_SCENE_SIZES
+    if scripts is None:
+        scripts = SCRIPTS
+
+    results = {}
+    for size in scene_sizes:
+        fig, ax, *_ = visualize_full_interactive(num_points=size, print_help=False)
+        _use_agg_canvas(fig).canvas.draw()
+
+        results[size] = {}
+        for name, script in scripts.items():
+            timings = replay(fig, script(ax))
+            results[size][name] = {part: latency_percentiles(values)
+                                   for part, values in timings.items()}
+
+        plt.close(fig)
+
+    return results
+
+
+def format_benchmark(results):
+    """
+    Формирует текстовую таблицу задержек.
+
+    Returns:
+        str: таблица (миллисекунды)
+    """
+    lines = [f"{'Точек':>6} {'Сценарий':<8} {'Событий':>8} "
+             f"{'p50':>8} {'p95':>8} {'p99':>8} {'обраб. p95':>11} {'отрис. p95':>11}"]
+
+    for size, scripts in results.items():
+        for name, parts in scripts.items():
+            total = parts['total']
+            lines.append(f"{size:>6} {name:<8} {total['count']:>8} "
+                         f"{total['p50']:>8.2f} {total['p95']:>8.2f} {total['p99']:>8.2f} "
+                         f"{parts['handler']['p95']:>11.2f} {parts['draw']['p95']:>11.2f}")
+
+    return "\n".join(lines)
+
+
+def export_benchmark(results, path):
+    """Сохраняет результаты в JSON (для сравнения между версиями)."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({str(size): scripts for size, scripts in results.items()},
+                  f, ensure_ascii=False, indent=2)
+
+
+def measure_move_point(scene_sizes=None, moves=None):
+    """
+    Время CurveScene.move_point (без отрисовки) для сцен разного размера.
+
+    Args:
+        scene_sizes: количества точек сцены (по умолчанию из config)
+        moves: переносов на каждый размер (по умолчанию из config)
+
+    Returns:
+        dict: {размер: перцентили latency_percentiles}
+    """
+    if scene_sizes is None:
+        scene_sizes = BENCHMARK_EDIT_SIZES
+    if moves is None:
+        moves = BENCHMARK_EDIT_MOVES
+
+    results = {}
+    for size in scene_sizes:
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        theta_points = np.linspace(0, 2 * np.pi, size, endpoint=False)
+        scene = CurveScene(ax, theta_points, show_labels=False)
+
+        theta = scene.theta_at(size // 2)
+        step = 0.1 * 2 * np.pi / (size * moves)
+        seconds = np.empty(moves)
+        for i in range(moves):
+            start = time.perf_counter()
+            theta = scene.move_point(theta, theta + step, draw=False)
+            seconds[i] = time.perf_counter() - start
+
+        results[size] = latency_percentiles(seconds)
+
+    return results
+
+
+def check_edit_scaling(scene_sizes=None, moves=None, max_growth=None):
+    """
+    Регрессионная проверка: медианное время move_point не растёт
+    с числом точек сцены (отношение самой большой сцены к самой
+    маленькой не больше max_growth).
+
+    Returns:
+        tuple: (прошла ли проверка, результаты measure_move_point)
+    """
+    if max_growth is None:
+        max_growth = BENCHMARK_EDIT_MAX_GROWTH
+
+    results = measure_move_point(scene_sizes, moves)
+    sizes = sorted(results)
+    passed = results[sizes[-1]]['p50'] <= max_growth * results[sizes[0]]['p50']
+    return passed, results
+
+
+if __name__ == '__main__':
+    print("Задержка отклика, мс (Agg, принудительная отрисовка после события)")
+    print(format_benchmark(run_benchmark()))
+
+    passed, edits = check_edit_scaling()
+    print("\nCurveScene.move_point, мс (p50 / p95):")
+    for size, timing in edits.items():
+        print(f"  {size:>6} точек: {timing['p50']:.3f} / {timing['p95']:.3f}")
+    if not passed:
+        print("ВНИМАНИЕ: время переноса точки растёт с числом точек сцены")
@@ -0,0 +1,186 @@
+"""Самопроверка: аналитические производные против спектральных и разностных оценок"""
+
+import time
+
+import numpy as np
+from curve_definition import r_function, dr_function
+from curve_math import (d2r_function, compute_derivatives,
+                        compute_second_derivatives, compute_third_derivatives,
+                        compute_signed_curvature, compute_curvature_derivative)
+from config import VALIDATION_NUM_SAMPLES, VALIDATION_TOLERANCE
+
+# Центральные разности 6-го порядка: смещения и веса для f' и f''
+_FD_OFFSETS = np.arange(-3, 4)
+_FD_FIRST = np.array([-1, 9, -45, 0, 45, -9, 1]) / 60
+_FD_SECOND = np.array([2, -27, 270, -490, 270, -27, 2]) / 180
+
+
+def _spectral_derivative(values, order):
+    """Производная периодической функции на равномерной сетке [0, 2π) через FFT."""
+    n = len(values)
+    k = np.fft.rfftfreq(n, 1.0 / n)
+    spectrum = np.fft.rfft(values) * (1j * k) ** order
+    if order % 2 and n % 2 == 0:
+        # Гармоника Найквиста не имеет однозначной нечётной производной
+        spectrum[-1] = 0
+    return np.fft.irfft(spectrum, n)
+
+
+def _fd_derivative(values, step, order):
+    """Периодическая центральная разность порядка order (1 или 2) через np.roll."""
+    weights = _FD_FIRST if order == 1 else _FD_SECOND
+    result = np.zeros_like(values)
+    for offset, weight in zip(_FD_OFFSETS, weights):
+        if weight:
+            result += weight * np.roll(values, -offset)
+    return result / step ** order
+
+
+def _curvature(dx, dy, d2x, d2y):
+    """Знаковая кривизна по производным."""
+    return (dx * d2y - dy * d2x) / (dx**2 + dy**2) ** 1.5
+
+
+def _curvature_derivative(dx, dy, d2x, d2y, d3x, d3y):
+    """
+    dκ/dθ по производным x, y.
+
+    Сама κ не является тригонометрическим полиномом, поэтому её прямое
+    численное дифференцирование теряет точность у пиков кривизны.
+    """
+    speed_sq = dx**2 + dy**2
+    return ((dx * d3y - dy * d3x) / speed_sq**1.5 -
+            3 * (dx * d2y - dy * d2x) * (dx * d2x + dy * d2y) / speed_sq**2.5)
+
+
+def _errors(analytic, estimate):
+    """Максимальная и среднеквадратичная ошибки, абсолютные и относительные."""
+    diff = estimate - analytic
+    scale = np.max(np.abs(analytic)) or 1.0
+    max_error = float(np.max(np.abs(diff)))
+    rms_error = float(np.sqrt(np.mean(diff**2)))
+    return {
+        'max': max_error,
+        'rms': rms_error,
+        'max_rel': max_error / scale,
+        'rms_rel': rms_error / scale
+    }
+
+
+def validate_derivatives(num_samples=None):
+    """
+    Сравнивает аналитические производные и кривизну с численными оценками.
+
+    На равномерной периодической сетке θ вычисляются r, x, y, после чего
+    их производные оцениваются двумя способами: спектрально (FFT) и
+    центральными разностями 6-го порядка. Проверяются r', r'', x', y',
+    x'', y'', x''', y''', κ и dκ/dθ.
+
+    Args:
+        num_samples: количество точек сетки (по умолчанию из config)
+
+    Returns:
+        dict: {'quantities': {имя: {'spectral': ошибки, 'fd': ошибки}},
+               'seconds': время проверки}
+    """
+    if num_samples is None:
+        num_samples = VALIDATION_NUM_SAMPLES
+
+    start = time.perf_counter()
+
+    theta = np.linspace(0, 2 * np.pi, num_samples, endpoint=False)
+    step = theta[1] - theta[0]
+
+    r = r_function(theta)
+    x = r * np.cos(theta)
+    y = r * np.sin(theta)
+
+    dx, dy = compute_derivatives(theta)
+    d2x, d2y = compute_second_derivatives(theta)
+    d3x, d3y = compute_third_derivatives(theta)
+
+    analytic = {
+        "r'": dr_function(theta),
+        "r''": d2r_function(theta),
+        "x'": dx, "y'": dy,
+        "x''": d2x, "y''": d2y,
+        "x'''": d3x, "y'''": d3y,
+        'κ': compute_signed_curvature(theta),
+        'dκ/dθ': compute_curvature_derivative(theta)
+    }
+
+    def estimate(diff1, diff2):
+        """Численные оценки всех величин одним методом дифференцирования."""
+        values = {
+            "r'": diff1(r), "r''": diff2(r),
+            "x'": diff1(x), "y'": diff1(y),
+            "x''": diff2(x), "y''": diff2(y)
+        }
+        values["x'''"] = diff1(values["x''"])
+        values["y'''"] = diff1(values["y''"])
+        values['κ'] = _curvature(values["x'"], values["y'"],
+                                 values["x''"], values["y''"])
+        values['dκ/dθ'] = _curvature_derivative(values["x'"], values["y'"],
+                                                values["x''"], values["y''"],
+                                                values["x'''"], values["y'''"])
+        return values
+
+    spectral = estimate(lambda f: _spectral_derivative(f, 1),
+                        lambda f: _spectral_derivative(f, 2))
+    fd = estimate(lambda f: _fd_derivative(f, step, 1),
+                  lambda f: _fd_derivative(f, step, 2))
+
+    quantities = {name: {'spectral': _errors(value, spectral[name]),
+                         'fd': _errors(value, fd[name])}
+                  for name, value in analytic.items()}
+
+    return {'quantities': quantities,
+            'num_samples': num_samples,
+            'seconds': time.perf_counter() - start}
+
+
+def check_derivatives(num_samples=None, tolerance=None):
+    """
+    Регрессионная проверка: относительная спектральная ошибка каждой
+    величины не превышает tolerance.
+
+    Args:
+        num_samples: количество точек сетки (по умолчанию из config)
+        tolerance: допустимая относительная ошибка (по умолчанию из config)
+
+    Returns:
+        tuple: (прошла ли проверка, отчёт validate_derivatives)
+    """
+    if tolerance is None:
+        tolerance = VALIDATION_TOLERANCE
+
+    report = validate_derivatives(num_samples)
+    passed = all(errors['spectral']['max_rel'] <= tolerance
+                 for errors in report['quantities'].values())
+    return passed, report
+
+
+def format_validation_report(report):
+    """
+    Формирует текстовый отчёт проверки.
+
+    Returns:
+        str: таблица ошибок по величинам
+    """
+    lines = [f"Проверка производных: {report['num_samples']} точек, "
+             f"{1e3 * report['seconds']:.1f} мс",
+             f"{'Величина':<8} {'FFT max':>10} {'FFT rms':>10} "
+             f"{'КР max':>10} {'КР rms':>10}   (относительные ошибки)"]
+
+    for name, errors in report['quantities'].items():
+        spectral, fd = errors['spectral'], errors['fd']
+        lines.append(f"{name:<8} {spectral['max_rel']:>10.2e} {spectral['rms_rel']:>10.2e} "
+                     f"{fd['max_rel']:>10.2e} {fd['rms_rel']:>10.2e}")
+
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    passed, report = check_derivatives()
+    print(format_validation_report(report))
+    print("Проверка пройдена" if passed else "ПРОВЕРКА НЕ ПРОЙДЕНА")
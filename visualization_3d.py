@@ -0,0 +1,323 @@
+"""3D-визуализация — кривая, поднятая по оси z на выбранную величину"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+
+from curve_math import get_frame_table
+from instrumentation import instrumented
+from visualization_curvature import CURVATURE_CIRCLE_COLOR, CURVATURE_CENTER_COLOR
+from config import (FIGURE_SIZE, THETA_POINTS, CURVE_COLOR, CURVE_LINEWIDTH,
+                    CURVE_FILL_ALPHA, POINT_SIZE, POINT_COLOR, POINT_EDGE_COLOR,
+                    VECTOR_SCALE, TANGENT_COLOR, NORMAL_COLOR, VECTOR_LINEWIDTH,
+                    EVOLUTE_POINT_COLOR, EVOLUTE_POINT_SIZE,
+                    EVOLUTE_CONNECTION_COLOR, EVOLUTE_CONNECTION_STYLE,
+                    EVOLUTE_CONNECTION_WIDTH, EVOLUTE_CONNECTION_ALPHA,
+                    PLOT3D_Z_QUANTITY, PLOT3D_CURVATURE_CLIP,
+                    PLOT3D_CIRCLE_POINTS)
+
+# Подписи оси z для поддерживаемых величин
+Z_LABELS = {
+    'theta': 'θ (рад)',
+    'curvature': 'Кривизна κ',
+    'radius': 'Радиус кривизны R',
+    'zero': 'z'
+}
+
+
+def z_values(table, quantity=None):
+    """
+    Значения по оси z для строк таблицы get_frame_table.
+
+    Args:
+        table: столбцовая таблица точек кривой
+        quantity: 'theta', 'curvature', 'radius' или 'zero'
+                  (по умолчанию из config)
+
+    Returns:
+        numpy.ndarray: высоты точек
+    """
+    if quantity is None:
+        quantity = PLOT3D_Z_QUANTITY
+
+    if quantity == 'theta':
+        return table['theta']
+    if quantity == 'curvature':
+        return np.minimum(table['curvature'], PLOT3D_CURVATURE_CLIP)
+    if quantity == 'radius':
+        return np.minimum(table['radius'], PLOT3D_CURVATURE_CLIP)
+    if quantity == 'zero':
+        return np.zeros_like(table['theta'])
+
+    raise ValueError(f"Неизвестная величина для оси z: {quantity!r}")
+
+
+def _segments(x0, y0, z0, x1, y1, z1):
+    """Массив отрезков формы (N, 2, 3) для Line3DCollection."""
+    start = np.stack([x0, y0, z0], axis=-1)
+    end = np.stack([x1, y1, z1], axis=-1)
+    return np.stack([start, end], axis=1)
+
+
+def create_figure_3d():
+    """
+    Создаёт фигуру и 3D-оси.
+
+    Returns:
+        tuple: (fig, ax)
+    """
+    fig = plt.figure(figsize=FIGURE_SIZE)
+    ax = fig.add_subplot(projection='3d')
+    return fig, ax
+
+
+def setup_axes_3d(ax, title='Кривая в 3D', elevation=30, azimuth=-60,
+                  z_quantity=None):
+    """
+    Настраивает 3D-оси.
+
+    Args:
+        ax: 3D-оси matplotlib
+        title: заголовок графика
+        elevation: угол возвышения камеры, градусы
+        azimuth: азимут камеры, градусы
+        z_quantity: величина по оси z (для подписи)
+    """
+    if z_quantity is None:
+        z_quantity = PLOT3D_Z_QUANTITY
+
+    ax.set_xlabel('x', fontsize=12)
+    ax.set_ylabel('y', fontsize=12)
+    ax.set_zlabel(Z_LABELS.get(z_quantity, 'z'), fontsize=12)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.view_init(elev=elevation, azim=azimuth)
+
+
+@instrumented
+def draw_curve_3d(ax, num_points=None, z_quantity=None, show_fill=True):
+    """
+    Рисует кривую одной Line3DCollection.
+
+    Args:
+        ax: 3D-оси matplotlib
+        num_points: количество точек кривой (по умолчанию из config)
+        z_quantity: величина по оси z (по умолчанию из config)
+        show_fill: рисовать ли «стенку» от плоскости z = 0 до кривой
+                   (одна Poly3DCollection)
+
+    Returns:
+        dict: таблица точек кривой с добавленным столбцом 'z'
+    """
+    if num_points is None:
+        num_points = THETA_POINTS
+
+    theta = np.linspace(0, 2 * np.pi, num_points)
+    table = get_frame_table(theta)
+    x, y = table['x'], table['y']
+    z = table['z'] = z_values(table, z_quantity)
+
+    segments = _segments(x[:-1], y[:-1], z[:-1], x[1:], y[1:], z[1:])
+    ax.add_collection3d(Line3DCollection(segments, colors=CURVE_COLOR,
+                                         linewidths=CURVE_LINEWIDTH))
+
+    if show_fill:
+        base = np.zeros_like(z)
+        quads = np.stack([
+            np.stack([x[:-1], y[:-1], base[:-1]], axis=-1),
+            np.stack([x[1:], y[1:], base[1:]], axis=-1),
+            np.stack([x[1:], y[1:], z[1:]], axis=-1),
+            np.stack([x[:-1], y[:-1], z[:-1]], axis=-1)
+        ], axis=1)
+        ax.add_collection3d(Poly3DCollection(quads, facecolors=CURVE_COLOR,
+                                             edgecolors='none',
+                                             alpha=CURVE_FILL_ALPHA))
+
+    ax.auto_scale_xyz(x, y, np.append(z, 0.0))
+
+    return table
+
+
+def _point_table(theta_points, z_quantity):
+    """Таблица данных выбранных точек вместе с высотами."""
+    table = get_frame_table(theta_points)
+    table['z'] = z_values(table, z_quantity)
+    return table
+
+
+@instrumented
+def add_points_3d(ax, theta_points, z_quantity=None, show_labels=True):
+    """
+    Добавляет точки одним вызовом scatter.
+
+    Args:
+        ax: 3D-оси matplotlib
+        theta_points: массив углов θ
+        z_quantity: величина по оси z (по умолчанию из config)
+        show_labels: показывать ли подписи точек
+
+    Returns:
+        dict: таблица данных точек
+    """
+    table = _point_table(theta_points, z_quantity)
+
+    ax.scatter(table['x'], table['y'], table['z'], s=POINT_SIZE,
+               c=POINT_COLOR, edgecolors=POINT_EDGE_COLOR, depthshade=False)
+
+    if show_labels:
+        for i, (x, y, z) in enumerate(zip(table['x'], table['y'], table['z'])):
+            ax.text(x, y, z, f'  P{i + 1}', fontsize=10, fontweight='bold')
+
+    return table
+
+
+def _add_vectors_3d(ax, theta_points, component, scale, color, z_quantity):
+    """Векторы единичной длины (в плоскости z = const) одной Line3DCollection."""
+    if scale is None:
+        scale = VECTOR_SCALE
+
+    table = _point_table(theta_points, z_quantity)
+    x, y, z = table['x'], table['y'], table['z']
+    vx, vy = table[component + 'x'], table[component + 'y']
+
+    segments = _segments(x, y, z, x + vx * scale, y + vy * scale, z)
+    ax.add_collection3d(Line3DCollection(segments, colors=color,
+                                         linewidths=VECTOR_LINEWIDTH))
+    return table
+
+
+@instrumented
+def add_tangents_3d(ax, theta_points, scale=None, z_quantity=None):
+    """
+    Добавляет касательные векторы одной Line3DCollection.
+
+    Returns:
+        dict: таблица данных точек
+    """
+    return _add_vectors_3d(ax, theta_points, 't', scale, TANGENT_COLOR, z_quantity)
+
+
+@instrumented
+def add_normals_3d(ax, theta_points, scale=None, z_quantity=None):
+    """
+    Добавляет векторы нормалей одной Line3DCollection.
+
+    Returns:
+        dict: таблица данных точек
+    """
+    return _add_vectors_3d(ax, theta_points, 'n', scale, NORMAL_COLOR, z_quantity)
+
+
+@instrumented
+def add_curvature_circles_3d(ax, theta_points, max_radius=2.0, z_quantity=None,
+                             circle_points=None):
+    """
+    Добавляет соприкасающиеся окружности одной Line3DCollection
+    и их центры одним scatter.
+
+    Args:
+        ax: 3D-оси matplotlib
+        theta_points: массив углов θ
+        max_radius: окружности большего радиуса не рисуются
+        z_quantity: величина по оси z (по умолчанию из config)
+        circle_points: точек на окружности (по умолчанию из config)
+
+    Returns:
+        dict: таблица данных точек
+    """
+    if circle_points is None:
+        circle_points = PLOT3D_CIRCLE_POINTS
+
+    table = _point_table(theta_points, z_quantity)
+    visible = np.isfinite(table['radius']) & (table['radius'] < max_radius)
+
+    cx = table['center_x'][visible, np.newaxis]
+    cy = table['center_y'][visible, np.newaxis]
+    radius = table['radius'][visible, np.newaxis]
+    z = np.broadcast_to(table['z'][visible, np.newaxis],
+                        (visible.sum(), circle_points))
+
+    phi = np.linspace(0, 2 * np.pi, circle_points)
+    circles = np.stack([cx + radius * np.cos(phi),
+                        cy + radius * np.sin(phi), z], axis=-1)
+
+    ax.add_collection3d(Line3DCollection(circles, colors=CURVATURE_CIRCLE_COLOR,
+                                         linestyles='--', linewidths=1.5,
+                                         alpha=0.7))
+    ax.scatter(cx.ravel(), cy.ravel(), z[:, 0], s=30,
+               color=CURVATURE_CENTER_COLOR, marker='x', depthshade=False)
+
+    return table
+
+
+@instrumented
+def add_evolute_3d(ax, theta_points, show_connections=True, z_quantity=None):
+    """
+    Добавляет точки эволюты одним scatter и соединительные линии
+    одной Line3DCollection.
+
+    Returns:
+        dict: таблица данных точек
+    """
+    table = _point_table(theta_points, z_quantity)
+    ex, ey, z = table['center_x'], table['center_y'], table['z']
+
+    ax.scatter(ex, ey, z, s=EVOLUTE_POINT_SIZE, c=EVOLUTE_POINT_COLOR,
+               edgecolors='white', depthshade=False)
+
+    if show_connections:
+        segments = _segments(table['x'], table['y'], z, ex, ey, z)
+        ax.add_collection3d(Line3DCollection(segments,
+                                             colors=EVOLUTE_CONNECTION_COLOR,
+                                             linestyles=EVOLUTE_CONNECTION_STYLE,
+                                             linewidths=EVOLUTE_CONNECTION_WIDTH,
+                                             alpha=EVOLUTE_CONNECTION_ALPHA))
+
+    return table
+
+
+def add_legend_3d(ax, show_tangents=True, show_normals=True,
+                  show_evolute=False, show_curvature_circles=False):
+    """
+    Добавляет легенду (пустые артисты-заместители для коллекций).
+
+    Args:
+        ax: 3D-оси matplotlib
+        show_tangents, show_normals, show_evolute, show_curvature_circles:
+            какие слои включить в легенду
+    """
+    ax.plot([], [], color=CURVE_COLOR, linewidth=CURVE_LINEWIDTH, label='Кривая')
+    ax.scatter([], [], s=POINT_SIZE, c=POINT_COLOR, label='Точки')
+
+    if show_tangents:
+        ax.plot([], [], color=TANGENT_COLOR, linewidth=VECTOR_LINEWIDTH,
+                label='Касательная')
+    if show_normals:
+        ax.plot([], [], color=NORMAL_COLOR, linewidth=VECTOR_LINEWIDTH,
+                label='Нормаль')
+    if show_curvature_circles:
+        ax.plot([], [], color=CURVATURE_CIRCLE_COLOR, linestyle='--',
+                linewidth=1.5, label='Соприкасающаяся окружность')
+    if show_evolute:
+        ax.scatter([], [], s=EVOLUTE_POINT_SIZE, c=EVOLUTE_POINT_COLOR,
+                   label='Точки эволюты')
+
+    ax.legend(fontsize=10, loc='upper right')
+
+
+if __name__ == '__main__':
+    from point_selector import select_random_points
+
+    theta_points = select_random_points(10)
+
+    fig, ax = create_figure_3d()
+    draw_curve_3d(ax)
+    add_points_3d(ax, theta_points)
+    add_tangents_3d(ax, theta_points)
+    add_normals_3d(ax, theta_points)
+    add_curvature_circles_3d(ax, theta_points)
+    add_evolute_3d(ax, theta_points)
+
+    add_legend_3d(ax, show_evolute=True, show_curvature_circles=True)
+    setup_axes_3d(ax, title='Кривая в 3D: z = θ')
+
+    plt.show()
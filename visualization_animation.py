@@ -0,0 +1,266 @@
+"""Анимация — точка, движущаяся по кривой, с репером Френе и соприкасающейся окружностью"""
+
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation, PillowWriter, FFMpegWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from frame_interpolation import get_frame_interpolator
+from visualization_base import draw_curve, setup_axes
+from visualization_curvature import CURVATURE_CIRCLE_COLOR, CURVATURE_CENTER_COLOR
+from config import (FIGURE_SIZE, POINT_SIZE, POINT_COLOR, POINT_EDGE_COLOR,
+                    VECTOR_SCALE, TANGENT_COLOR, NORMAL_COLOR, VECTOR_LINEWIDTH,
+                    ANIMATION_FRAMES, ANIMATION_INTERVAL, ANIMATION_FPS,
+                    ANIMATION_CIRCLE_POINTS)
+
+
+def precompute_animation_frames(num_frames=None, scale=None, max_radius=2.0,
+                                circle_points=None, frame_function=None):
+    """
+    Заранее вычисляет данные всех кадров анимации за один векторизованный проход.
+
+    Репер кадров берётся из интерполяционных таблиц
+    (FrameInterpolator.evaluate): их погрешность много меньше пикселя,
+    а стоимость не зависит от числа гармоник кривой.
+
+    Args:
+        num_frames: количество кадров на оборот (по умолчанию из config)
+        scale: длина векторов касательной и нормали (по умолчанию из config)
+        max_radius: окружности большего радиуса не рисуются
+        circle_points: точек на окружности (по умолчанию из config)
+        frame_function: функция θ → таблица репера (по умолчанию
+                        get_frame_interpolator().evaluate; для точных
+                        значений — get_frame_table)
+
+    Returns:
+        dict: массивы формы (кадры,) или (кадры, точки) для каждого элемента:
+              point_x/point_y, tangent_x/tangent_y, normal_x/normal_y,
+              circle_x/circle_y, center_x/center_y и исходная таблица 'table'
+    """
+    if num_frames is None:
+        num_frames = ANIMATION_FRAMES
+    if scale is None:
+        scale = VECTOR_SCALE
+    if circle_points is None:
+        circle_points = ANIMATION_CIRCLE_POINTS
+    if frame_function is None:
+        frame_function = get_frame_interpolator().evaluate
+
+    theta = np.linspace(0, 2 * np.pi, num_frames, endpoint=False)
+    table = frame_function(theta)
+    x, y = table['x'], table['y']
+
+    # Отрезки векторов: столбец 0 — начало, столбец 1 — конец
+    tangent_x = np.stack([x, x + table['tx'] * scale], axis=1)
+    tangent_y = np.stack([y, y + table['ty'] * scale], axis=1)
+    normal_x = np.stack([x, x + table['nx'] * scale], axis=1)
+    normal_y = np.stack([y, y + table['ny'] * scale], axis=1)
+
+    # Окружности: слишком большие (почти прямые участки) скрываем через NaN
+    visible = table['radius'] < max_radius
+    radius = np.where(visible, table['radius'], np.nan)
+    center_x = np.where(visible, table['center_x'], np.nan)
+    center_y = np.where(visible, table['center_y'], np.nan)
+
+    phi = np.linspace(0, 2 * np.pi, circle_points)
+    circle_x = center_x[:, np.newaxis] + radius[:, np.newaxis] * np.cos(phi)
+    circle_y = center_y[:, np.newaxis] + radius[:, np.newaxis] * np.sin(phi)
+
+    return {
+        'table': table,
+        'point_x': x,
+        'point_y': y,
+        'tangent_x': tangent_x,
+        'tangent_y': tangent_y,
+        'normal_x': normal_x,
+        'normal_y': normal_y,
+        'circle_x': circle_x,
+        'circle_y': circle_y,
+        'center_x': center_x,
+        'center_y': center_y
+    }
+
+
+def create_frame_artists(ax):
+    """
+    Создаёт фиксированный набор артистов, которые обновляются в каждом кадре.
+
+    Args:
+        ax: объект осей matplotlib
+
+    Returns:
+        dict: {'point', 'tangent', 'normal', 'circle', 'center'} — объекты Line2D
+    """
+    point, = ax.plot([], [], 'o', markersize=np.sqrt(POINT_SIZE),
+                     color=POINT_COLOR, markeredgecolor=POINT_EDGE_COLOR,
+                     zorder=5, animated=True)
+    tangent, = ax.plot([], [], color=TANGENT_COLOR, linewidth=VECTOR_LINEWIDTH,
+                       label='Касательная', animated=True)
+    normal, = ax.plot([], [], color=NORMAL_COLOR, linewidth=VECTOR_LINEWIDTH,
+                      label='Нормаль', animated=True)
+    circle, = ax.plot([], [], color=CURVATURE_CIRCLE_COLOR, linestyle='--',
+                      linewidth=1.5, alpha=0.7,
+                      label='Соприкасающаяся окружность', animated=True)
+    center, = ax.plot([], [], 'x', color=CURVATURE_CENTER_COLOR,
+                      zorder=4, animated=True)
+
+    return {
+        'point': point,
+        'tangent': tangent,
+        'normal': normal,
+        'circle': circle,
+        'center': center
+    }
+
+
+def update_frame_artists(artists, frames, i):
+    """
+    Переносит данные кадра i в артисты (только set_data, без создания новых).
+
+    Returns:
+        list: обновлённые артисты (для blit)
+    """
+    artists['point'].set_data(frames['point_x'][i:i + 1], frames['point_y'][i:i + 1])
+    artists['tangent'].set_data(frames['tangent_x'][i], frames['tangent_y'][i])
+    artists['normal'].set_data(frames['normal_x'][i], frames['normal_y'][i])
+    artists['circle'].set_data(frames['circle_x'][i], frames['circle_y'][i])
+    artists['center'].set_data(frames['center_x'][i:i + 1], frames['center_y'][i:i + 1])
+
+    return list(artists.values())
+
+
+def create_animation(fig, ax, frames=None, interval=None, blit=True):
+    """
+    Создаёт анимацию движения точки по кривой.
+
+    Args:
+        fig: объект фигуры matplotlib
+        ax: объект осей с уже нарисованной кривой
+        frames: результат precompute_animation_frames (по умолчанию — новый)
+        interval: задержка между кадрами, мс (по умолчанию из config)
+        blit: перерисовывать только изменившихся артистов
+
+    Returns:
+        tuple: (FuncAnimation, artists)
+    """
+    if frames is None:
+        frames = precompute_animation_frames()
+    if interval is None:
+        interval = ANIMATION_INTERVAL
+
+    artists = create_frame_artists(ax)
+    num_frames = len(frames['point_x'])
+
+    def init():
+        for artist in artists.values():
+            artist.set_data([], [])
+        return list(artists.values())
+
+    def update(i):
+        return update_frame_artists(artists, frames, i)
+
+    animation = FuncAnimation(fig, update, frames=num_frames, init_func=init,
+                              interval=interval, blit=blit)
+
+    return animation, artists
+
+
+def _create_headless_figure():
+    """Фигура на холсте Agg — не требует оконного бэкенда."""
+    fig = Figure(figsize=FIGURE_SIZE)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    draw_curve(ax)
+    setup_axes(ax, title='Движение точки по кривой')
+    return fig, ax
+
+
+def export_animation(path, num_frames=None, fps=None, dpi=100):
+    """
+    Сохраняет анимацию в файл без открытия окна.
+
+    Формат определяется расширением: .gif — Pillow, остальные — ffmpeg.
+
+    Args:
+        path: путь к файлу (.gif, .mp4, ...)
+        num_frames: количество кадров (по умолчанию из config)
+        fps: частота кадров (по умолчанию из config)
+        dpi: разрешение кадров
+    """
+    if fps is None:
+        fps = ANIMATION_FPS
+
+    fig, ax = _create_headless_figure()
+    frames = precompute_animation_frames(num_frames)
+    animation, _ = create_animation(fig, ax, frames)
+
+    if str(path).lower().endswith('.gif'):
+        writer = PillowWriter(fps=fps)
+    else:
+        writer = FFMpegWriter(fps=fps)
+
+    animation.save(path, writer=writer, dpi=dpi)
+
+
+def measure_animation_fps(num_frames=None, blit=True):
+    """
+    Измеряет пропускную способность отрисовки кадров на холсте Agg.
+
+    При blit=True повторяет схему FuncAnimation: фон рисуется один раз,
+    в каждом кадре восстанавливается и поверх рисуются только артисты кадра.
+
+    Args:
+        num_frames: количество кадров (по умолчанию из config)
+        blit: использовать ли blitting
+
+    Returns:
+        dict: {'frames', 'seconds', 'fps'}
+    """
+    fig, ax = _create_headless_figure()
+    frames = precompute_animation_frames(num_frames)
+    artists = create_frame_artists(ax)
+    canvas = fig.canvas
+    total = len(frames['point_x'])
+
+    if not blit:
+        for artist in artists.values():
+            artist.set_animated(False)
+
+    canvas.draw()
+    background = canvas.copy_from_bbox(ax.bbox)
+
+    start = time.perf_counter()
+    for i in range(total):
+        updated = update_frame_artists(artists, frames, i)
+        if blit:
+            canvas.restore_region(background)
+            for artist in updated:
+                ax.draw_artist(artist)
+            canvas.blit(ax.bbox)
+        else:
+            canvas.draw()
+    seconds = time.perf_counter() - start
+
+    return {
+        'frames': total,
+        'seconds': seconds,
+        'fps': total / seconds if seconds > 0 else np.inf
+    }
+
+
+if __name__ == '__main__':
+    from visualization_base import create_figure
+
+    stats = measure_animation_fps()
+    print(f"Отрисовка: {stats['frames']} кадров за {stats['seconds']:.2f} с "
+          f"({stats['fps']:.0f} кадр/с)")
+
+    fig, ax = create_figure()
+    draw_curve(ax)
+    setup_axes(ax, title='Движение точки по кривой')
+    animation, _ = create_animation(fig, ax)
+
+    plt.show()
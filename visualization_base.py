@@ -2,8 +2,13 @@
 
 import matplotlib.pyplot as plt
 from curve_definition import get_curve_points
-from config import (FIGURE_SIZE, CURVE_COLOR, CURVE_LINEWIDTH,
-                    CURVE_FILL_ALPHA)
+from curve_math import compute_curvature
+from instrumentation import instrumented
+from polyline_simplify import simplify_polyline
+from support_function import bounding_box
+from config import (FIGURE_SIZE, THETA_POINTS, CURVE_COLOR, CURVE_LINEWIDTH,
+                    CURVE_FILL_ALPHA, SIMPLIFY_TOLERANCE,
+                    EXPORT_THETA_POINTS, EXPORT_SIMPLIFY_TOLERANCE)
 
 
 def create_figure():
@@ -17,13 +22,17 @@ def create_figure():
     return fig, ax
 
 
-def setup_axes(ax, title='Кривая'):
+def setup_axes(ax, title='Кривая', padding=None):
     """
     Настраивает оси графика.
 
     Args:
         ax: объект осей matplotlib
         title: заголовок графика
+        padding: если задан — границы осей по точному ограничивающему
+                 прямоугольнику кривой (bounding_box) с этими полями
+                 (например, AXES_PADDING), а не по автомасштабу всех
+                 нарисованных слоёв; по умолчанию — автомасштаб
     """
     ax.set_aspect('equal')
     ax.grid(True, alpha=0.3)
@@ -31,19 +40,37 @@ def setup_axes(ax, title='Кривая'):
     ax.set_ylabel('y', fontsize=12)
     ax.set_title(title, fontsize=14, fontweight='bold')
 
+    if padding is not None:
+        xmin, xmax, ymin, ymax = bounding_box(padding)
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
 
-def draw_curve(ax, show_fill=True):
+
+@instrumented
+def draw_curve(ax, show_fill=True, num_points=None, tolerance=None):
     """
     Рисует кривую на осях.
 
     Args:
         ax: объект осей matplotlib
         show_fill: заливать ли область внутри кривой
+        num_points: количество точек кривой (по умолчанию из config)
+        tolerance: допуск упрощения ломаной в единицах данных
+                   (по умолчанию из config; None — без упрощения)
 
     Returns:
-        tuple: (theta, x, y) данные кривой
+        tuple: (theta, x, y) данные нарисованных вершин
     """
-    theta, x, y = get_curve_points()
+    if num_points is None:
+        num_points = THETA_POINTS
+    if tolerance is None:
+        tolerance = SIMPLIFY_TOLERANCE
+
+    theta, x, y = get_curve_points(num_points)
+
+    if tolerance is not None:
+        keep = simplify_polyline(x, y, tolerance, compute_curvature(theta))
+        theta, x, y = theta[keep], x[keep], y[keep]
 
     ax.plot(x, y, color=CURVE_COLOR, linewidth=CURVE_LINEWIDTH,
             label='Кривая', zorder=1)
@@ -54,21 +81,36 @@ def draw_curve(ax, show_fill=True):
     return theta, x, y
 
 
-def visualize_curve_only(save_path=None):
+def visualize_curve_only(save_path=None, num_points=None, tolerance=None):
     """
     Создаёт визуализацию только кривой.
 
+    При сохранении в файл кривая строится по плотной выборке и упрощается
+    с допуском, поэтому размер SVG/PDF определяется сложностью формы,
+    а не плотностью выборки.
+
     Args:
         save_path: путь для сохранения (опционально)
+        num_points: количество точек кривой (по умолчанию из config)
+        tolerance: допуск упрощения в единицах данных (по умолчанию из config)
 
     Returns:
         tuple: (fig, ax)
     """
+    if save_path:
+        if num_points is None:
+            num_points = EXPORT_THETA_POINTS
+        if tolerance is None:
+            tolerance = EXPORT_SIMPLIFY_TOLERANCE
+
     fig, ax = create_figure()
-    draw_curve(ax)
+    draw_curve(ax, num_points=num_points, tolerance=tolerance)
     setup_axes(ax, title='Сложная замкнутая кривая (клякса)')
     ax.legend(fontsize=12, loc='upper right')
 
+    if save_path:
+        fig.savefig(save_path)
+
     return fig, ax
 
 
@@ -2,9 +2,15 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.colors import LogNorm, Normalize
 from curve_definition import get_cartesian_coordinates
-from curve_math import compute_radius_of_curvature, compute_curvature_center
-from config import VECTOR_SCALE
+from curve_math import (compute_radius_of_curvature, compute_curvature_center,
+                        get_frame_table)
+from instrumentation import instrumented
+from config import (VECTOR_SCALE, CURVE_LINEWIDTH, CURVATURE_CMAP,
+                    CURVATURE_LOG_SCALE, COMB_NUM_POINTS, COMB_SCALE,
+                    COMB_MAX_LENGTH, COMB_COLOR, COMB_LINEWIDTH)
 
 # Цвет для окружностей кривизны
 CURVATURE_CIRCLE_COLOR = 'purple'
@@ -12,6 +18,7 @@ CURVATURE_CIRCLE_ALPHA = 0.3
 CURVATURE_CENTER_COLOR = 'purple'
 
 
+@instrumented
 def add_curvature_circles_to_plot(ax, theta_points, max_radius=2.0):
     """
     Добавляет соприкасающиеся окружности на график.
@@ -62,23 +69,136 @@ def add_curvature_legend(ax):
             linewidth=1.5, label='Соприкасающаяся окружность')
 
 
-def plot_curvature_distribution(save_path=None):
+@instrumented
+def draw_curvature_colored_curve(ax, num_points=None, cmap=None, log_scale=None):
+    """
+    Рисует кривую, раскрашенную по кривизне, одной LineCollection.
+
+    Цвет отрезка — κ в его середине. Для кривой с пиками κ у точек
+    перегиба и острых выступов удобнее логарифмическая шкала.
+
+    Args:
+        ax: объект осей matplotlib
+        num_points: количество точек кривой (по умолчанию из config)
+        cmap: цветовая карта (по умолчанию из config)
+        log_scale: логарифмическая шкала цвета (по умолчанию из config)
+
+    Returns:
+        LineCollection: коллекция (для fig.colorbar)
+    """
+    if num_points is None:
+        num_points = COMB_NUM_POINTS
+    if cmap is None:
+        cmap = CURVATURE_CMAP
+    if log_scale is None:
+        log_scale = CURVATURE_LOG_SCALE
+
+    theta = np.linspace(0, 2 * np.pi, num_points + 1)
+    points = np.stack(get_cartesian_coordinates(theta), axis=-1)
+    segments = np.stack([points[:-1], points[1:]], axis=1)
+
+    curvature = get_frame_table(0.5 * (theta[:-1] + theta[1:]))['curvature']
+
+    if log_scale:
+        positive = curvature[curvature > 0]
+        norm = LogNorm(vmin=positive.min(), vmax=positive.max())
+        curvature = np.maximum(curvature, positive.min())
+    else:
+        norm = Normalize(vmin=curvature.min(), vmax=curvature.max())
+
+    collection = LineCollection(segments, cmap=cmap, norm=norm,
+                                linewidths=CURVE_LINEWIDTH, zorder=2)
+    collection.set_array(curvature)
+    ax.add_collection(collection)
+    ax.autoscale_view()
+
+    return collection
+
+
+@instrumented
+def add_curvature_comb_to_plot(ax, num_points=None, scale=None, max_length=None,
+                               show_envelope=True):
+    """
+    Добавляет гребёнку кривизны одной LineCollection.
+
+    В каждой точке из кривой выходит «волос» вдоль нормали длиной
+    scale·κ, направленный от центра кривизны (на выпуклых участках —
+    наружу). Огибающая — ломаная через концы волос — входит в ту же
+    коллекцию.
+
+    Args:
+        ax: объект осей matplotlib
+        num_points: количество волос (по умолчанию из config)
+        scale: длина волоса на единицу кривизны (по умолчанию из config)
+        max_length: ограничение длины волоса (по умолчанию из config)
+        show_envelope: рисовать ли огибающую
+
+    Returns:
+        dict: таблица точек гребёнки (get_frame_table) со столбцами
+              tip_x, tip_y — концы волос
+    """
+    if num_points is None:
+        num_points = COMB_NUM_POINTS
+    if scale is None:
+        scale = COMB_SCALE
+    if max_length is None:
+        max_length = COMB_MAX_LENGTH
+
+    theta = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
+    table = get_frame_table(theta)
+
+    length = np.clip(scale * table['signed_curvature'], -max_length, max_length)
+    tip_x = table['tip_x'] = table['x'] - length * table['nx']
+    tip_y = table['tip_y'] = table['y'] - length * table['ny']
+
+    base = np.stack([table['x'], table['y']], axis=-1)
+    tips = np.stack([tip_x, tip_y], axis=-1)
+    segments = np.stack([base, tips], axis=1)
+
+    if show_envelope:
+        envelope = np.stack([tips, np.roll(tips, -1, axis=0)], axis=1)
+        segments = np.concatenate([segments, envelope])
+
+    ax.add_collection(LineCollection(segments, colors=COMB_COLOR,
+                                     linewidths=COMB_LINEWIDTH, zorder=2))
+    ax.autoscale_view()
+
+    return table
+
+
+def add_curvature_comb_legend(ax):
+    """
+    Добавляет гребёнку кривизны в легенду.
+    """
+    ax.plot([], [], color=COMB_COLOR, linewidth=COMB_LINEWIDTH,
+            label='Гребёнка кривизны')
+
+
+def plot_curvature_distribution(save_path=None, num_samples=None):
     """
     Строит график распределения кривизны вдоль кривой.
 
+    κ и R берутся из одного вызова get_frame_table; линии прореживаются
+    по пикселям, поэтому пики κ у точек перегиба не теряются. Полная
+    панель кривизны — curvature_dashboard.plot_curvature_dashboard.
+
     Args:
         save_path: путь для сохранения
+        num_samples: количество точек (по умолчанию из config)
     """
-    from curve_math import compute_curvature, compute_radius_of_curvature
+    from curvature_dashboard import add_decimated_line
+    from config import DASHBOARD_NUM_SAMPLES, DASHBOARD_MAX_RADIUS
+
+    if num_samples is None:
+        num_samples = DASHBOARD_NUM_SAMPLES
 
-    theta = np.linspace(0, 2 * np.pi, 1000)
-    curvature = compute_curvature(theta)
-    radius = compute_radius_of_curvature(theta)
+    theta = np.linspace(0, 2 * np.pi, num_samples)
+    table = get_frame_table(theta)
 
     fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
     # Кривизна
-    axes[0].plot(theta, curvature, 'b-', linewidth=2)
+    add_decimated_line(axes[0], theta, table['curvature'], color='b', linewidth=2)
     axes[0].set_xlabel('θ (рад)', fontsize=12)
     axes[0].set_ylabel('Кривизна κ', fontsize=12)
     axes[0].set_title('Кривизна вдоль кривой', fontsize=14)
@@ -86,11 +206,12 @@ def plot_curvature_distribution(save_path=None):
     axes[0].set_xlim(0, 2 * np.pi)
 
     # Радиус кривизны (ограничиваем для наглядности)
-    radius_clipped = np.clip(radius, 0, 5)
-    axes[1].plot(theta, radius_clipped, 'r-', linewidth=2)
+    radius_clipped = np.minimum(table['radius'], DASHBOARD_MAX_RADIUS)
+    add_decimated_line(axes[1], theta, radius_clipped, color='r', linewidth=2)
     axes[1].set_xlabel('θ (рад)', fontsize=12)
     axes[1].set_ylabel('Радиус кривизны R', fontsize=12)
-    axes[1].set_title('Радиус кривизны вдоль кривой (ограничен R ≤ 5)', fontsize=14)
+    axes[1].set_title(f'Радиус кривизны вдоль кривой (ограничен R ≤ {DASHBOARD_MAX_RADIUS:g})',
+                      fontsize=14)
     axes[1].grid(True, alpha=0.3)
     axes[1].set_xlim(0, 2 * np.pi)
 
@@ -121,4 +242,14 @@ if __name__ == '__main__':
     setup_axes(ax, title='Кривая с соприкасающимися окружностями')
     ax.legend(fontsize=10, loc='upper right')
 
+    # Кривая, раскрашенная по кривизне, и гребёнка кривизны
+    fig, ax = create_figure()
+    collection = draw_curvature_colored_curve(ax)
+    add_curvature_comb_to_plot(ax)
+    add_curvature_comb_legend(ax)
+    fig.colorbar(collection, ax=ax, label='Кривизна κ')
+
+    setup_axes(ax, title='Кривизна на кривой: цвет и гребёнка')
+    ax.legend(fontsize=10, loc='upper right')
+
     plt.show()
\ No newline at end of file
@@ -1,3 +1,4 @@
+from instrumentation import instrumented
 from config import (
     EVOLUTE_POINT_COLOR,
     EVOLUTE_POINT_SIZE,
@@ -8,6 +9,7 @@ from config import (
 )
 
 
+@instrumented
 def add_evolute_to_plot(ax, theta_points, show_connections=True, show_labels=True):
     """
     Добавляет точки эволюты на график.
@@ -3,9 +3,11 @@
 import matplotlib.pyplot as plt
 from curve_definition import get_cartesian_coordinates
 from curve_math import compute_normal_vector
+from instrumentation import instrumented
 from config import VECTOR_SCALE, NORMAL_COLOR, VECTOR_LINEWIDTH
 
 
+@instrumented
 def add_normals_to_plot(ax, theta_points, scale=None):
     """
     Добавляет векторы нормалей на график.
@@ -2,10 +2,12 @@
 
 import matplotlib.pyplot as plt
 from curve_definition import get_cartesian_coordinates
+from instrumentation import instrumented
 from config import (POINT_SIZE, POINT_COLOR, POINT_EDGE_COLOR,
                     POINT_EDGE_WIDTH)
 
 
+@instrumented
 def add_points_to_plot(ax, theta_points, show_labels=True):
     """
     Добавляет точки на график.
@@ -0,0 +1,239 @@
+"""Постоянный дисковый кэш предвычислений (.npy, отображаемые в память)"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import uuid
+
+import numpy as np
+
+from curve_definition import get_curve_coefficients
+from curve_math import get_frame_table
+from spatial_index import CurveSpatialIndex
+from config import CACHE_ENABLED, CACHE_DIR, CACHE_MAX_BYTES, SPATIAL_INDEX_LEAF_SIZE
+
+# Версия формата кэша: увеличивается при изменении вычислений,
+# чтобы старые записи не использовались
+CACHE_FORMAT_VERSION = 3
+
+# Переменная окружения CURVES2D_CACHE_DIR переопределяет каталог кэша,
+# значение '0' отключает кэш
+_env_dir = os.environ.get('CURVES2D_CACHE_DIR', '')
+
+
+def is_enabled():
+    """Включён ли дисковый кэш."""
+    return CACHE_ENABLED and _env_dir != '0'
+
+
+def cache_dir():
+    """
+    Каталог кэша.
+
+    Returns:
+        str: путь из CURVES2D_CACHE_DIR, config.CACHE_DIR или ~/.cache/curves2d
+    """
+    if _env_dir not in ('', '0'):
+        return _env_dir
+    if CACHE_DIR:
+        return CACHE_DIR
+    return os.path.join(os.path.expanduser('~'), '.cache', 'curves2d')
+
+
+def cache_key(name, num_samples, coeffs=None, **params):
+    """
+    Ключ записи: имя, хэш коэффициентов, числа точек, параметров и версии.
+
+    Args:
+        name: имя артефакта
+        num_samples: количество точек выборки
+        coeffs: коэффициенты кривой (по умолчанию — активные)
+        **params: дополнительные параметры вычисления
+
+    Returns:
+        str: имя каталога записи
+    """
+    coeffs = np.ascontiguousarray(get_curve_coefficients() if coeffs is None else coeffs,
+                                  dtype=float)
+    digest = hashlib.sha1(coeffs.tobytes())
+    digest.update(repr((CACHE_FORMAT_VERSION, coeffs.shape, int(num_samples),
+                        sorted(params.items()))).encode())
+    return f"{name}-{digest.hexdigest()[:20]}"
+
+
+def load(key):
+    """
+    Отображает в память массивы записи.
+
+    Запись публикуется целиком (переименованием каталога), поэтому читатель
+    видит либо полную запись, либо никакой. Если запись удалили во время
+    чтения, возвращается None — уже отображённые файлы остаются доступны.
+
+    Returns:
+        dict или None: {имя: массив только для чтения}
+    """
+    path = os.path.join(cache_dir(), key)
+    try:
+        names = [name for name in os.listdir(path) if name.endswith('.npy')]
+        arrays = {name[:-4]: np.load(os.path.join(path, name), mmap_mode='r')
+                  for name in names}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    # Время изменения каталога — время последнего использования (для вытеснения).
+    # Отметка не обязательна: каталог может быть только для чтения или общим
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return arrays
+
+
+def store(key, arrays, max_bytes=None):
+    """
+    Атомарно записывает массивы в кэш.
+
+    Файлы пишутся во временный каталог, который затем переименовывается
+    в каталог записи. Если запись уже создал другой процесс, временный
+    каталог удаляется.
+
+    Args:
+        key: ключ записи (cache_key)
+        arrays: {имя: массив}
+        max_bytes: ограничение размера кэша (по умолчанию из config)
+    """
+    root = cache_dir()
+    os.makedirs(root, exist_ok=True)
+
+    tmp_path = tempfile.mkdtemp(prefix='.tmp-', dir=root)
+    try:
+        for name, value in arrays.items():
+            np.save(os.path.join(tmp_path, f"{name}.npy"), np.asarray(value))
+        os.rename(tmp_path, os.path.join(root, key))
+    except OSError:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not os.path.isdir(os.path.join(root, key)):
+            raise
+
+    evict(max_bytes)
+
+
+def _entry_size(path):
+    """Размер записи в байтах."""
+    try:
+        return sum(entry.stat().st_size for entry in os.scandir(path))
+    except FileNotFoundError:
+        return 0
+
+
+def evict(max_bytes=None):
+    """
+    Удаляет давно не использованные записи, пока кэш больше max_bytes.
+
+    Запись сначала переименовывается (читатели её больше не находят),
+    затем удаляется; уже отображённые в память файлы остаются доступны.
+    """
+    if max_bytes is None:
+        max_bytes = CACHE_MAX_BYTES
+
+    root = cache_dir()
+    entries = []
+    for entry in os.scandir(root):
+        if entry.is_dir() and not entry.name.startswith('.'):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path, _entry_size(entry.path)))
+            except FileNotFoundError:
+                continue
+
+    total = sum(size for _, _, size in entries)
+    for _, path, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        trash = os.path.join(root, f".trash-{uuid.uuid4().hex}")
+        try:
+            os.rename(path, trash)
+        except FileNotFoundError:
+            continue
+        shutil.rmtree(trash, ignore_errors=True)
+        total -= size
+
+
+def clear():
+    """Удаляет все записи кэша."""
+    evict(max_bytes=-1)
+
+
+def cached(name, compute, num_samples, **params):
+    """
+    Возвращает артефакт из кэша или вычисляет и сохраняет его.
+
+    Args:
+        name: имя артефакта
+        compute: функция без аргументов, возвращающая {имя: массив}
+        num_samples: количество точек выборки (входит в ключ)
+        **params: дополнительные параметры (входят в ключ)
+
+    Returns:
+        dict: {имя: массив}; из кэша — отображённые в память, только для чтения;
+              при ошибках ввода-вывода кэша — результат compute()
+    """
+    if not is_enabled():
+        return compute()
+
+    # Кэш — оптимизация: при любой ошибке чтения или записи (нет прав,
+    # повреждённый файл) работаем без него
+    key = cache_key(name, num_samples, **params)
+    try:
+        arrays = load(key)
+    except (OSError, ValueError):
+        arrays = None
+    if arrays is not None:
+        return arrays
+
+    arrays = compute()
+    try:
+        store(key, arrays)
+        return load(key) or arrays
+    except (OSError, ValueError):
+        return arrays
+
+
+def cached_frame_table(num_samples):
+    """
+    Столбцовая таблица get_frame_table на периодической сетке θ.
+
+    Returns:
+        dict: столбцы таблицы
+    """
+    def compute():
+        return get_frame_table(np.linspace(0, 2 * np.pi, num_samples, endpoint=False))
+
+    return cached('frame_table', compute, num_samples)
+
+
+def cached_spatial_index(num_samples):
+    """
+    Пространственный индекс по точкам таблицы cached_frame_table(num_samples).
+
+    Returns:
+        CurveSpatialIndex: индекс
+    """
+    def compute():
+        table = cached_frame_table(num_samples)
+        return CurveSpatialIndex(table['x'], table['y']).to_arrays()
+
+    arrays = cached('spatial_index', compute, num_samples,
+                    leaf_size=SPATIAL_INDEX_LEAF_SIZE)
+    return CurveSpatialIndex.from_arrays(arrays)
+
+
+if __name__ == '__main__':
+    import time
+
+    for attempt in ('первый', 'второй'):
+        start = time.perf_counter()
+        table = cached_frame_table(1 << 16)
+        index = cached_spatial_index(1 << 16)
+        print(f"{attempt} вызов: {1e3 * (time.perf_counter() - start):.1f} мс "
+              f"({len(index)} точек, каталог {cache_dir()})")